@@ -1,14 +1,24 @@
+import asyncio
+import hashlib
 import json
 import os
 import time
 from dotenv import load_dotenv
-import requests
-from openai import OpenAI
 import datetime
 import copy
 import re
-from AnalyzeTrends import add_google_trend_score
-from evaluator_final import evaluate as evaluate_metrics
+
+from extraction_module.config import ExtractionConfig
+from extraction_module.services import brightdata
+from extraction_module.services.assistant_runs import wait_for_run
+from extraction_module.services.deck_cache import deck_name, file_sha256, get_deck_cache
+from extraction_module.services.incremental import (carry_over, diff_paths, get_page_results, merge_page_fields,
+                                                    stage_affected)
+from extraction_module.services.openai_resources import get_openai_resources
+from extraction_module.services.profile_cache import get_profile_cache
+
+# openai, pytrends and the evaluator (torch/transformers) are imported on first
+# use, so importing this module does not slow down API startup
 
 # -----------------------------
 # 0. Load Environment Variables
@@ -16,10 +26,22 @@ from evaluator_final import evaluate as evaluate_metrics
 load_dotenv("Keys.env")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 BRIGHTDATA_API_KEY = os.getenv("BRIGHTDATA_API_KEY")
-if not OPENAI_API_KEY or not BRIGHTDATA_API_KEY:
-    raise RuntimeError("OPENAI_API_KEY or BRIGHTDATA_API_KEY missing in Keys.env")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+
+def check_api_keys():
+    if not OPENAI_API_KEY or not BRIGHTDATA_API_KEY:
+        raise RuntimeError("OPENAI_API_KEY or BRIGHTDATA_API_KEY missing in Keys.env")
+
+
+# Get the OpenAI client (lazily initialized singleton)
+def get_openai_client():
+    if not hasattr(get_openai_client, "instance"):
+        check_api_keys()
+        from openai import OpenAI
+        get_openai_client.instance = OpenAI(api_key=OPENAI_API_KEY)
+    return get_openai_client.instance
+
+
 MODEL_NAME = "gpt-4o"  # vision + file support model
 
 # -----------------------------
@@ -75,60 +97,227 @@ Produce JSON matching this schema exactly (omit nulls):
 
 """
 
+# Part of the deck cache key: bump PIPELINE_REVISION when a stage changes its output
+PIPELINE_REVISION = 1
+PIPELINE_VERSION = (f"r{PIPELINE_REVISION}:{MODEL_NAME}:"
+                    f"{hashlib.sha256(JSON_SCHEMA_PROMPT.encode('utf-8')).hexdigest()[:12]}"
+                    f"{':local-text' if ExtractionConfig.LOCAL_PDF_TEXT else ''}"
+                    f"{':pages' if ExtractionConfig.INCREMENTAL_EXTRACTION else ''}")
+
+
+ASSISTANT_NAME = "PitchDeck Extractor"
+ASSISTANT_TOOLS = [{"type": "file_search"}]
+ASSISTANT_INSTRUCTIONS = (
+    "You are an expert at analysing startup pitch decks. "
+    "Return ONLY valid JSON conforming to the schema provided by the user. "
+    "Make sure your response is valid JSON without any markdown formatting or backticks. "
+    "Ensure the following rules are respected: "
+    "1. 'growth_rate' must be a real number formatted as a string (e.g., '3.75'). "
+    "2. 'geographic_focus' must explicitly mention the country where the startup is based. "
+    "3. The structure of the response must exactly match the schema provided by the user. "
+    "4. Do not add additional fields not present in the schema. "
+    "5. The Pitchdeck you are receiving is biased towards the company that created it. Please try to be objective when filling the JSON"
+)
+
+
+def structure_pdf(pdf_path: str) -> dict:
+    """Structured JSON for a deck, from local page text when enabled and usable, else via Assistants."""
+    if ExtractionConfig.LOCAL_PDF_TEXT:
+        structured = structure_pdf_with_text(pdf_path)
+        if structured is not None:
+            return structured
+    return structure_pdf_with_assistant(pdf_path)
+
+
+def structure_pdf_with_text(pdf_path: str, stats: dict = None) -> dict | None:
+    """
+    Extracts the deck's page text locally and structures it with one chat
+    completion. Returns None when pypdf is missing or the deck has too little
+    text (image-only slides), so the caller can fall back to Assistants.
+    """
+    from extraction_module.services.page_text import compact_deck, estimate_tokens, extract_pages, has_enough_text
 
-def structure_pdf_with_assistant(pdf_path: str) -> dict:
-    """Uses Assistants API to process a PDF file and return structured JSON."""
-    # 1. Upload PDF file to OpenAI
-    with open(pdf_path, "rb") as f:
-        file_obj = client.files.create(file=f, purpose="assistants")
-    file_id = file_obj.id
-
-    # 2. Create assistant (with file_search tool)
-    assistant = client.beta.assistants.create(
-        name="PitchDeck Extractor",
+    start = time.perf_counter()
+    try:
+        pages = extract_pages(pdf_path)
+    except ImportError:
+        print("⚠️ pypdf is not installed, using the Assistants path")
+        return None
+    except Exception as e:
+        print(f"⚠️ Local text extraction failed ({e}), using the Assistants path")
+        return None
+    if not has_enough_text(pages):
+        print(f"📄 {os.path.basename(pdf_path)} has too little text for local extraction, using the Assistants path")
+        return None
+    deck_text = compact_deck(pages)
+    extract_seconds = time.perf_counter() - start
+
+    response = get_openai_client().chat.completions.create(
         model=MODEL_NAME,
-        tools=[{"type": "file_search"}],
-        instructions=(
-            "You are an expert at analysing startup pitch decks. "
-            "Return ONLY valid JSON conforming to the schema provided by the user. "
-            "Make sure your response is valid JSON without any markdown formatting or backticks. "
-            "Ensure the following rules are respected: "
-            "1. 'growth_rate' must be a real number formatted as a string (e.g., '3.75'). "
-            "2. 'geographic_focus' must explicitly mention the country where the startup is based. "
-            "3. The structure of the response must exactly match the schema provided by the user. "
-            "4. Do not add additional fields not present in the schema. "
-            "5. The Pitchdeck you are receiving is biased towards the company that created it. Please try to be objective when filling the JSON"
-        ),
+        response_format={"type": "json_object"},
+        messages=[
+            {"role": "system", "content": ASSISTANT_INSTRUCTIONS},
+            {"role": "user", "content": f"{JSON_SCHEMA_PROMPT}\n\nExtract from this pitch deck text:\n\n{deck_text}"},
+        ],
     )
+    usage = response.usage
+    seconds = time.perf_counter() - start
+    print(f"⏱️ Local text extraction: {len(pages)} pages ({sum(p.cached for p in pages)} cached) in "
+          f"{extract_seconds:.1f}s, ~{estimate_tokens(deck_text)} tokens of text, {seconds:.1f}s total, "
+          f"{usage.prompt_tokens}+{usage.completion_tokens} tokens")
+    if stats is not None:
+        stats.update(seconds=round(seconds, 3), extract_seconds=round(extract_seconds, 3), pages=len(pages),
+                     prompt_tokens=usage.prompt_tokens, completion_tokens=usage.completion_tokens)
+    return json.loads(response.choices[0].message.content)
+
+
+PAGE_FIELDS_PROMPT = (
+    "Each slide of the pitch deck below starts with a '## Slide N' header. For every slide, "
+    "return only the fields of the schema that this slide itself gives evidence for, "
+    "nested exactly as in the schema. Respond as {\"slides\": {\"<N>\": {...}}}, "
+    "with {} for slides that contain none of the fields."
+)
+
+
+def structure_pdf_by_page(pdf_path: str):
+    """
+    Structured JSON merged from per-page fields, plus the deck's pages.
+    Only pages whose hash has not been seen before are sent to the model,
+    in one chat completion. Returns (None, None) when the deck cannot be
+    read locally, so the caller can use the whole-deck path.
+    """
+    from extraction_module.services.page_text import compact_deck, extract_pages, has_enough_text
 
-    # 3. Create thread and upload file via a message
-    thread = client.beta.threads.create()
-    client.beta.threads.messages.create(
-        thread_id=thread.id,
-        role="user",
-        content=JSON_SCHEMA_PROMPT + "\n\nExtract from the attached pitch deck.",
-        attachments=[{"file_id": file_id, "tools": [{"type": "file_search"}]}]
-    )
+    try:
+        pages = extract_pages(pdf_path)
+    except ImportError:
+        print("⚠️ pypdf is not installed, using whole-deck extraction")
+        return None, None
+    except Exception as e:
+        print(f"⚠️ Local text extraction failed ({e}), using whole-deck extraction")
+        return None, None
+    if not has_enough_text(pages):
+        print(f"📄 {os.path.basename(pdf_path)} has too little text for page-level extraction")
+        return None, None
+
+    store = get_page_results()
+    fields = {page.sha256: store.get_page(page.sha256, PIPELINE_VERSION) for page in pages}
+    todo = list({page.sha256: page for page in pages if fields[page.sha256] is None}.values())
+    if todo:
+        response = get_openai_client().chat.completions.create(
+            model=MODEL_NAME,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": ASSISTANT_INSTRUCTIONS},
+                {"role": "user", "content": f"{JSON_SCHEMA_PROMPT}\n\n{PAGE_FIELDS_PROMPT}\n\n{compact_deck(todo)}"},
+            ],
+        )
+        slides = json.loads(response.choices[0].message.content).get("slides", {})
+        for page in todo:
+            page_fields = slides.get(str(page.number)) or {}
+            store.put_page(page.sha256, PIPELINE_VERSION, page_fields)
+            fields[page.sha256] = page_fields
+    print(f"🧩 Extracted {len(todo)} of {len(pages)} pages, reused the rest")
 
-    # 4. Run the assistant
-    run = client.beta.threads.runs.create(
-        thread_id=thread.id,
-        assistant_id=assistant.id
-    )
+    return merge_page_fields([fields[page.sha256] for page in pages]), pages
+
+
+def update_previous_result(previous: dict, structured: dict) -> dict:
+    """
+    Enrich a new version of a deck starting from the previous version's
+    result: LinkedIn and Google Trends only run again when their inputs
+    changed, and only changed top-level sections are refined again.
+    """
+    from AnalyzeTrends import add_google_trend_score
+
+    old = previous["result"]
+    paths = diff_paths(previous["structured"], structured)
+    sections = {path.split(".")[0] for path in paths}
+    rerun_linkedin = stage_affected("linkedin", paths)
+    rerun_trends = stage_affected("trends", paths)
+    print(f"🧩 Changed fields: {', '.join(sorted(paths)) or 'none'}; re-running "
+          f"linkedin={rerun_linkedin}, trends={rerun_trends}, refine={sorted(sections) or 'none'}")
+
+    data = copy.deepcopy(structured)
+    if rerun_linkedin:
+        data = enrich_with_linkedin(data)
+        sections |= {"team", "company_followers"}
+    else:
+        # Founders keep their LinkedIn fields and refinements from the previous version
+        data.setdefault("team", {})["founders"] = copy.deepcopy(old.get("team", {}).get("founders", []))
+
+    refine_keys = sorted(key for key in sections if key in data and key != "company_followers")
+    if refine_keys:
+        refined = refine_with_chatgpt_holes({key: data[key] for key in refine_keys})
+        data.update({key: refined[key] for key in refine_keys if key in refined})
+    data = carry_over(old, data, sections)
+
+    if rerun_trends:
+        data = add_google_trend_score(data, data.get("company_name", "Unknown"))
+    elif "google_trend_score" in old.get("traction", {}):
+        data.setdefault("traction", {})["google_trend_score"] = old["traction"]["google_trend_score"]
+    return data
+
+
+def structure_pdf_with_assistant(pdf_path: str, stats: dict = None) -> dict:
+    """Uses Assistants API to process a PDF file and return structured JSON."""
+    from openai import NotFoundError
+
+    start = time.perf_counter()
+    client = get_openai_client()
+    resources = get_openai_resources(client)
+    sha256 = file_sha256(pdf_path)
 
-    # 5. Poll for run completion
-    while run.status not in ("completed", "failed"):
-        time.sleep(1.5)
-        run = client.beta.threads.runs.retrieve(thread_id=thread.id, run_id=run.id)
+    for attempt in range(2):
+        assistant_id = thread_id = None
+        try:
+            # 1. Reuse the assistant and the indexed upload of this PDF (created on first use)
+            assistant_id = resources.assistant(ASSISTANT_NAME, MODEL_NAME, ASSISTANT_INSTRUCTIONS, ASSISTANT_TOOLS)
+            vector_store_id = resources.vector_store(pdf_path, sha256)
+
+            # 2. Create a thread over the deck's vector store and ask for the JSON
+            thread_id = resources.thread(tool_resources={"file_search": {"vector_store_ids": [vector_store_id]}})
+            client.beta.threads.messages.create(
+                thread_id=thread_id,
+                role="user",
+                content=JSON_SCHEMA_PROMPT + "\n\nExtract from the attached pitch deck.",
+            )
 
-    if run.status == "failed":
-        raise RuntimeError(f"Assistant run failed: {run.last_error}")
+            # 3. Run the assistant
+            run = client.beta.threads.runs.create(
+                thread_id=thread_id,
+                assistant_id=assistant_id
+            )
+            break
+        except NotFoundError:
+            # A remembered assistant or upload was deleted remotely: provision it again
+            if thread_id:
+                resources.release_thread(thread_id)
+            if attempt:
+                raise
+            print("♻️ Remembered OpenAI assistant or file is gone, recreating it")
+            if assistant_id:
+                resources.forget_assistant(assistant_id)
+            resources.forget_file(sha256)
 
-    # 6. Get response from assistant
-    msgs = client.beta.threads.messages.list(thread.id, order="desc")
-    assistant_msg = next((m for m in msgs.data if m.role == "assistant"), None)
-    if not assistant_msg:
-        raise RuntimeError("No assistant response found")
+    try:
+        # 4. Wait for the run with adaptive polling and a hard deadline
+        result = wait_for_run(client, thread_id, run)
+        phases = ", ".join(f"{status} {seconds:.1f}s" for status, seconds in result.phases.items())
+        print(f"⏱️ Assistant run finished in {result.seconds:.1f}s ({phases}; {result.polls} polls)")
+        if stats is not None:
+            usage = getattr(result.run, "usage", None)
+            stats.update(seconds=round(time.perf_counter() - start, 3), run_seconds=result.seconds,
+                         prompt_tokens=getattr(usage, "prompt_tokens", None),
+                         completion_tokens=getattr(usage, "completion_tokens", None))
+
+        # 5. Get response from assistant
+        msgs = client.beta.threads.messages.list(thread_id, order="desc")
+        assistant_msg = next((m for m in msgs.data if m.role == "assistant"), None)
+        if not assistant_msg:
+            raise RuntimeError("No assistant response found")
+    finally:
+        resources.release_thread(thread_id)
 
     content_text = assistant_msg.content[0].text.value.strip()
 
@@ -175,57 +364,6 @@ def structure_pdf_with_assistant(pdf_path: str) -> dict:
 # -----------------------------
 # 2. Enrich with LinkedIn Data via BrightData API
 # -----------------------------
-def safe_json(resp, label: str) -> dict | list:
-    """
-    Return resp.json() if the body is non-empty and valid JSON;
-    otherwise log & return {}.
-    """
-    text = resp.text.strip()
-    if not text:
-        print(f"[WARN] {label}: empty response (HTTP {resp.status_code})")
-        return {}
-    try:
-        return resp.json()
-    except json.JSONDecodeError:
-        print(f"[ERROR] {label}: invalid JSON\n{text[:500]}")
-        return {}
-
-def fetch_snapshot(snapshot_id: str, max_wait_sec: int = 300) -> list[dict]:
-    """
-    Download an existing Bright Data snapshot; if it is not ready yet,
-    poll the /progress/ endpoint (up to `max_wait_sec`) until 'success'.
-    """
-    headers = {"Authorization": f"Bearer {BRIGHTDATA_API_KEY}"}
-    data_url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format=json"
-
-    # 1) first try direct download
-    resp = requests.get(data_url, headers=headers, timeout=30)
-    if resp.ok and resp.text.strip():
-        recs = safe_json(resp, f"snapshot {snapshot_id}")
-        if isinstance(recs, list) and recs:
-            return recs
-
-    # 2) if empty → poll /progress/
-    prog_url = f"https://api.brightdata.com/datasets/v3/progress/{snapshot_id}"
-    deadline = time.time() + max_wait_sec
-    while time.time() < deadline:
-        prog = requests.get(prog_url, headers=headers, timeout=15)
-        status = safe_json(prog, f"progress {snapshot_id}").get("status")
-        print(f"[INFO] Snapshot {snapshot_id} status={status!r}")
-        if status == "ready":
-            break
-        if status in ("failed", "error"):
-            raise RuntimeError(f"Snapshot {snapshot_id} failed: {prog.text}")
-        time.sleep(5)
-    else:
-        raise RuntimeError(f"Timeout waiting for snapshot {snapshot_id}")
-
-    # 3) final download
-    recs = safe_json(requests.get(data_url, headers=headers, timeout=30),
-                     f"snapshot {snapshot_id}")
-    if not isinstance(recs, list):
-        raise ValueError(f"Unexpected data from snapshot {snapshot_id}: {recs}")
-    return recs
 def is_company_match(profile, target_name):
     company = profile.get("current_company", {})
     return company and company.get("name", "").strip().lower() == target_name
@@ -236,139 +374,136 @@ def profile_match_score(profile, company_name, first, last):
         score += 3
     if profile.get("full_name", "").lower() == f"{first} {last}".lower():
         score += 2
-
     experience = profile.get("experience")
     if isinstance(experience, list):
         if any(exp.get("company", "").lower() == company_name for exp in experience):
             score += 1
-
     return score
 
+def apply_linkedin_profile(founder: dict, profiles: list[dict], company_name: str, first: str, last: str):
+    """Fill a founder's LinkedIn fields from the best matching discovered profile and return that profile."""
+    # Score all profiles
+    scored_profiles = [
+        (profile_match_score(p, company_name, first, last), p)
+        for p in profiles
+    ]
 
-# ── enrichment main ───────────────────────────────────────────────────────────
-def is_company_match(profile, target_name):
-    company = profile.get("current_company", {})
-    return company and company.get("name", "").strip().lower() == target_name
-
-def profile_match_score(profile, company_name, first, last):
-    score = 0
-    if is_company_match(profile, company_name):
-        score += 3
-    if profile.get("full_name", "").lower() == f"{first} {last}".lower():
-        score += 2
-    experience = profile.get("experience")
-    if isinstance(experience, list):
-        if any(exp.get("company", "").lower() == company_name for exp in experience):
-            score += 1
-    return score
+    if scored_profiles:
+        # Always select the best scoring profile — even if score is low
+        best_score, prof = max(scored_profiles, key=lambda sp: sp[0])
+        if best_score <= 0:
+            print(f"[WARN] No confident match found for {founder['name']}, falling back to highest followers")
+        else:
+            print(f"[INFO] Selected profile {prof.get('url')} with score {best_score}")
 
-def enrich_with_linkedin(data: dict) -> dict:
-    headers = {
-        "Authorization": f"Bearer {BRIGHTDATA_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    DATASET_ID = "gd_l1viktl72bvl7bjuj0"
+        founder["university"] = (
+                prof.get("educations_details")
+                or (prof.get("education") or [{}])[0].get("title")
+        )
+        founder["network_strength"] = prof.get("connections")
+        founder["Followers"] = prof.get("followers")
+        founder["degree"] = prof.get("degree")
+        founder["age"] = prof.get("age")
+        founder["gender"] = prof.get("gender")
+        experience = prof.get("experience") or []
+        founder["previous_employments"] = [
+            {
+                "company": e.get("company"),
+                "title": e.get("title"),
+                "start": e.get("start_date"),
+                "end": e.get("end_date"),
+            }
+            for e in experience if e.get("company") and e.get("title")
+        ]
+        activity = prof.get("activity") or prof.get("posts") or []
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=30)
+        recent = [
+            p for p in activity
+            if p.get("created_at") and
+               datetime.datetime.fromisoformat(p["created_at"].replace("Z", "+00:00")) >= cutoff
+        ]
+        founder["linkedin_posts_last_30d"] = len(recent)
+        return prof
+    else:
+        # No profiles at all
+        print(f"[WARN] No profiles found for {founder['name']}")
+        founder["university"] = None
+        founder["degree"] = None
+        founder["network_strength"] = None
+        founder["age"] = None
+        founder["gender"] = None
+        founder["previous_employments"] = []
+        founder["linkedin_posts_last_30d"] = None
+        return None
+
+async def enrich_with_linkedin_async(data: dict) -> dict:
+    """
+    Discover every founder's profile in one batched job, concurrently with the
+    company page. Founders and companies seen in earlier decks come from the
+    profile cache and are not looked up again.
+    """
     company_name = (
         data.get("company_name")
         or data.get("team", {}).get("company_overview", {}).get("name")
         or ""
     ).lower()
+    cache = get_profile_cache()
 
+    founders = []
     for founder in data.get("team", {}).get("founders", []):
         first, *rest = founder["name"].split()
         if not rest:
             print(f"[WARN] skipping founder with single name: {founder['name']}")
             continue
         last = " ".join(rest)
-
-        # Trigger Bright Data job
-        trigger_url = (
-            "https://api.brightdata.com/datasets/v3/trigger"
-            f"?dataset_id={DATASET_ID}&include_errors=true&type=discover_new&discover_by=name"
-        )
-        trig = requests.post(trigger_url, headers=headers,
-                             json=[{"first_name": first, "last_name": last}],
-                             timeout=60)
-        if not trig.ok:
-            print(f"[ERROR] trigger failed for {founder['name']}: {trig.text}")
-            continue
-
-        snapshot_id = safe_json(trig, f"trigger {founder['name']}").get("snapshot_id")
-        if not snapshot_id:
-            print(f"[WARN] no snapshot_id for {founder['name']}")
-            continue
-
-        try:
-            profiles = fetch_snapshot(snapshot_id, max_wait_sec=300)
-        except Exception as e:
-            print(f"[ERROR] snapshot fetch failed for {founder['name']}: {e}")
-            continue
-
-        # Score profiles
-        # Score all profiles
-        scored_profiles = [
-            (profile_match_score(p, company_name, first, last), p)
-            for p in profiles
-        ]
-
-        if scored_profiles:
-            # Always select the best scoring profile — even if score is low
-            best_score, prof = max(scored_profiles, key=lambda sp: sp[0])
-            if best_score <= 0:
-                print(f"[WARN] No confident match found for {founder['name']}, falling back to highest followers")
-            else:
-                print(f"[INFO] Selected profile {prof.get('url')} with score {best_score}")
-
-            founder["university"] = (
-                    prof.get("educations_details")
-                    or (prof.get("education") or [{}])[0].get("title")
-            )
-            founder["network_strength"] = prof.get("connections")
-            founder["Followers"] = prof.get("followers")
-            founder["degree"] = prof.get("degree")
-            founder["age"] = prof.get("age")
-            founder["gender"] = prof.get("gender")
-            experience = prof.get("experience") or []
-            founder["previous_employments"] = [
-                {
-                    "company": e.get("company"),
-                    "title": e.get("title"),
-                    "start": e.get("start_date"),
-                    "end": e.get("end_date"),
-                }
-                for e in experience if e.get("company") and e.get("title")
-            ]
-            activity = prof.get("activity") or prof.get("posts") or []
-            cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=30)
-            recent = [
-                p for p in activity
-                if p.get("created_at") and
-                   datetime.datetime.fromisoformat(p["created_at"].replace("Z", "+00:00")) >= cutoff
-            ]
-            founder["linkedin_posts_last_30d"] = len(recent)
+        cached = cache.get_founder(founder["name"], company_name)
+        if cached is not None:
+            # A cached miss applies as "no profiles found"
+            apply_linkedin_profile(founder, [cached["profile"]] if cached["profile"] else [], company_name, first, last)
         else:
-            # No profiles at all
-            print(f"[WARN] No profiles found for {founder['name']}")
-            founder["university"] = None
-            founder["degree"] = None
-            founder["network_strength"] = None
-            founder["age"] = None
-            founder["gender"] = None
-            founder["previous_employments"] = []
-            founder["linkedin_posts_last_30d"] = None
+            founders.append((founder, first, last))
 
     comp_url = data.get("team", {}).get("company_overview", {}).get("url")
+    followers = cache.get_company(comp_url) if comp_url else None
+    lookup_company = bool(comp_url) and followers is None
+
+    start = time.perf_counter()
+    if founders or lookup_company:
+        poller = brightdata.get_snapshot_poller(BRIGHTDATA_API_KEY)
+        async with brightdata.async_client(BRIGHTDATA_API_KEY) as client:
+            # One batched discovery job for all uncached founders, concurrently with the company lookup
+            lookups = [brightdata.discover_profiles(client, poller, [(first, last) for _, first, last in founders],
+                                                    company_name or "founders")]
+            if lookup_company:
+                lookups.append(brightdata.company_followers(client, comp_url))
+            results = await asyncio.gather(*lookups)
+
+        for (founder, first, last), profiles in zip(founders, results[0]):
+            if profiles is None:  # None = the lookup failed, leave the founder as extracted and retry next time
+                continue
+            selected = apply_linkedin_profile(founder, profiles, company_name, first, last)
+            candidates = [
+                {"url": p.get("url"), "full_name": p.get("full_name"),
+                 "score": profile_match_score(p, company_name, first, last)}
+                for p in profiles
+            ]
+            cache.put_founder(founder["name"], company_name, selected, candidates)
+
+        if lookup_company:
+            followers = results[1]
+            if followers is not None:
+                cache.put_company(comp_url, followers)
+    print(f"⏱️ LinkedIn enrichment for {len(founders)} uncached founders took {time.perf_counter() - start:.1f}s "
+          f"(profile cache hit rate {cache.stats()['hit_rate']:.0%})")
+
     if comp_url:
-        comp_resp = requests.post(
-            "https://api.brightdata.com/linkedin/company",
-            headers=headers,
-            json={"url": comp_url},
-            timeout=30
-        )
-        data["company_followers"] = safe_json(comp_resp, "company").get("numFollowers")
+        data["company_followers"] = followers
 
     return data
 
+def enrich_with_linkedin(data: dict) -> dict:
+    return asyncio.run(enrich_with_linkedin_async(data))
+
 
 def refine_with_chatgpt_holes(data: dict) -> dict:
     """
@@ -376,6 +511,8 @@ def refine_with_chatgpt_holes(data: dict) -> dict:
     preserving the existing structure exactly—and then tags each filled field
     with a "<field>_source": "chatgpt" marker for manual review.
     """
+    client = get_openai_client()
+
     # 1) Keep a copy of the original
     original = copy.deepcopy(data)
 
@@ -449,41 +586,51 @@ Return ONLY the completed JSON.
 # -----------------------------
 
 def main(pdf_path=None):
-    # Define cache directory and output path
-    os.makedirs("./PreviouslyCalculatedSlidedecks", exist_ok=True)
+    from AnalyzeTrends import add_google_trend_score
+    from evaluator_final import evaluate_data as evaluate_metrics
 
-    # Get the base filename without extension
-    raw_filename = os.path.splitext(os.path.basename(pdf_path))[0]
-
-    # Clean the filename by removing everything before and including the underscore
-    if '_' in raw_filename:
-        filename = raw_filename.split('_', 1)[1]  # Split on first underscore and take second part
-    else:
-        filename = raw_filename  # Keep original if no underscore exists
-
-    cached_path = os.path.join("PreviouslyCalculatedSlidedecks", f"{filename}.json")
+    # Decks are cached by content, so renamed re-uploads hit and same-named decks don't collide
+    filename = deck_name(pdf_path)
+    sha256 = file_sha256(pdf_path)
+    cache = get_deck_cache()
 
     # 🔁 Return cached version if available
-    if os.path.exists(cached_path):
-        print(f"📂 Cached JSON found for {filename}, loading from {cached_path}")
-        with open(cached_path, "r") as f:
-            return json.load(f)
+    cached = cache.get(sha256, PIPELINE_VERSION, alias=filename)
+    if cached is not None:
+        print(f"📂 Cached JSON found for {filename} ({sha256[:12]})")
+        return cached
 
     # 🧠 Run full pipeline
+    check_api_keys()
     print(f"🔄 Processing new pitch deck: {pdf_path}")
-    structured = structure_pdf_with_assistant(pdf_path)
-    enriched = enrich_with_linkedin(structured)
-    refined = refine_with_chatgpt_holes(enriched)
+    structured, pages = None, None
+    if ExtractionConfig.INCREMENTAL_EXTRACTION:
+        structured, pages = structure_pdf_by_page(pdf_path)
+    previous = get_page_results().previous(filename, PIPELINE_VERSION) if pages else None
+
+    if previous is not None:
+        # 🧩 New version of a known deck: only changed pages were extracted, only affected stages re-run
+        refined = update_previous_result(previous, structured)
+    else:
+        structured = structured if structured is not None else structure_pdf(pdf_path)
+        enriched = enrich_with_linkedin(copy.deepcopy(structured))
+        refined = refine_with_chatgpt_holes(enriched)
 
-    company_name = refined.get("company_name", "Unknown")
-    refined = add_google_trend_score(refined, company_name)
+        company_name = refined.get("company_name", "Unknown")
+        refined = add_google_trend_score(refined, company_name)
 
     refined["metrics"] = evaluate_metrics(refined)
-
-    # 💾 Save result to cache directory
-    with open(cached_path, "w") as f:
+    if pages:
+        get_page_results().put_deck(filename, sha256, PIPELINE_VERSION, [page.sha256 for page in pages],
+                                    structured, refined)
+
+    # 💾 Save result to the deck cache, plus a readable copy under the deck name
+    cached_path = cache.put(sha256, PIPELINE_VERSION, refined, alias=filename)
+    os.makedirs(ExtractionConfig.EXPORT_DIR, exist_ok=True)
+    export_path = os.path.join(ExtractionConfig.EXPORT_DIR, f"{filename}.json")
+    with open(export_path, "w") as f:
         json.dump(refined, f, indent=2)
-    print(f"✅ Output written to {cached_path}")
+    print(f"✅ Output written to {cached_path} and {export_path}")
 
     return refined
 
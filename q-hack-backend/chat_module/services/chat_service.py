@@ -160,8 +160,13 @@ class ChatService:
                 # Field name formatting
                 field_name = field.split('.')[-1]
                 field_name = field_name.replace('_', ' ').title()
-                
-                response_parts.append(f"{field_name}: {value}")
+
+                # Add the parsed amount for money/percentage fields ("$1.2B", "€50K/month")
+                normalized = self.query_parser.normalized_value(field, value)
+                if normalized and normalized != str(value):
+                    response_parts.append(f"{field_name}: {value} ({normalized})")
+                else:
+                    response_parts.append(f"{field_name}: {value}")
         
         # Join all parts into a cohesive response
         response = " ".join(response_parts)
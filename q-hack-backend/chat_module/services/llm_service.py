@@ -3,7 +3,6 @@ import json
 import os
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # Load .env file
 load_dotenv()
@@ -13,15 +12,22 @@ class LLMService:
 
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OPENAI_API_KEY not set in .env file")
-
-        self.client = OpenAI(api_key=self.api_key)
+        self._client = None
 
         # Use a model that definitely exists in the current OpenAI API
         self.model = "gpt-3.5-turbo"
         print(f"LLM Service initialized with model: {self.model}")
 
+    @property
+    def client(self):
+        """OpenAI client, created on the first complex query so the API starts fast."""
+        if self._client is None:
+            if not self.api_key:
+                raise ValueError("OPENAI_API_KEY not set in .env file")
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
+
     async def process_complex_query(
         self,
         query: str,
@@ -2,6 +2,8 @@
 import re
 from typing import Dict, Any, List, Tuple, Optional
 
+from evaluation_module.services.value_parser import format_value, parse_values
+
 class QueryParser:
     """Service to parse user queries and map them to company data fields."""
     
@@ -52,6 +54,13 @@ class QueryParser:
             # Generic company queries
             (r"\b(?:company name|startup name|called)\b", ["company_name"]),
         ]
+
+        # Money and percentage fields that get a normalized value in direct answers
+        self.numeric_fields = {
+            "market.TAM", "market.SAM", "market.SOM", "market.growth_rate",
+            "traction.revenue_growth.MRR", "traction.revenue_growth.ARR",
+            "funding.amount", "financial_efficiency.burn_rate",
+        }
     
     def parse_query(self, query: str, company_data: Dict[str, Any]) -> Tuple[bool, Dict[str, Any], List[str]]:
         """
@@ -94,6 +103,13 @@ class QueryParser:
             
         return True, response_data, matched_fields
     
+    def normalized_value(self, field_path: str, value: Any) -> Optional[str]:
+        """Normalized form of a money or percentage field, e.g. "$1.2B" for "1.2 billion USD"."""
+        if field_path not in self.numeric_fields:
+            return None
+        parsed = parse_values(value)
+        return format_value(parsed[0]) if parsed else None
+
     def _get_nested_value(self, data: Dict[str, Any], path: str) -> Any:
         """Retrieve a value from a nested dictionary using dot notation path."""
         if not data:
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test script for the email module.
+Run this from the q-hack-backend directory with: python -m email_module.email_test
+"""
+
+import asyncio
+
+from email_module.services.missing_data import detect_missing_fields
+from email_module.services.response_processor import ResponseProcessor
+
+
+def test_response_money_fields():
+    """Reply amounts keep currency and scale, and are converted to the field's period."""
+    fields = [f for f in detect_missing_fields({}) if f["field"] in (
+        "funding.amount", "financial_projections.burn_rate", "kpis.cac", "company_overview.founded_year")]
+    reply = (
+        "Hi! Total funding raised to date: $1.5M. Monthly cash burn rate: $1.2M per year. "
+        "Customer Acquisition Cost: 50 EUR. Year your company was founded: 2019."
+    )
+    data = asyncio.run(ResponseProcessor().process_response(reply, fields))
+    assert data["funding"]["amount"] == "$1.5M"
+    assert data["financial_projections"]["burn_rate"] == "$100K/month"
+    assert data["kpis"]["cac"] == "€50"
+    assert data["company_overview"]["founded_year"] == 2019
+
+    # Only the last path segment decides: "arrival" is not ARR, "MRR" is
+    fields = [{"field": "traction.arrival_rate", "description": "Arrival rate"},
+              {"field": "traction.MRR", "description": "Monthly recurring revenue"}]
+    data = asyncio.run(ResponseProcessor().process_response(
+        "Arrival rate: 40 per day. Monthly recurring revenue: $30k", fields))
+    assert data["traction"] == {"arrival_rate": "40 per day", "MRR": "$30K"}
+
+
+# This allows the script to be run directly
+if __name__ == "__main__":
+    test_response_money_fields()
+    print("All email module tests passed")
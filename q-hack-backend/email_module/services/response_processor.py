@@ -2,6 +2,28 @@
 import re
 from typing import Dict, List, Any
 
+from evaluation_module.services.value_parser import PERIODS_PER_YEAR, format_value, parse_money
+
+# Fields (last path segment) whose replies are money amounts, with the period the field is quoted in
+MONEY_FIELDS = {"amount": None, "cac": None, "ltv": None, "burn_rate": "month", "mrr": "month", "arr": "year"}
+
+
+def normalize_money(text: str, period: str = None) -> str:
+    """
+    A reply amount in the normalized form the evaluator parses ("$1.2M",
+    "€50K/month"), keeping currency and scale. Per-period amounts are
+    converted to the field's period, so "$1.2M per year" for a monthly
+    field becomes "$100K/month". Text without an amount is returned as is.
+    """
+    parsed = parse_money(text)
+    if parsed is None:
+        return text
+    if period and parsed.period and parsed.period != period:
+        factor = PERIODS_PER_YEAR[parsed.period] / PERIODS_PER_YEAR[period]
+        parsed = parsed._replace(value=parsed.value * factor, low=parsed.low * factor,
+                                 high=parsed.high * factor, period=period)
+    return format_value(parsed)
+
 class ResponseProcessor:
     def __init__(self):
         pass
@@ -17,9 +39,10 @@ class ResponseProcessor:
             description = field["description"].lower()
             
             # Create pattern variations to match field in email
+            # (a value runs to the end of the sentence; decimal points like "$1.2M" don't end it)
             patterns = [
-                rf"{re.escape(description)}:?\s*([^.\n]+)",
-                rf"{field_name.split('.')[-1].replace('_', ' ')}:?\s*([^.\n]+)"
+                rf"{re.escape(description)}:?\s*((?:[^.\n]|\.(?=\d))+)",
+                rf"{field_name.split('.')[-1].replace('_', ' ')}:?\s*((?:[^.\n]|\.(?=\d))+)"
             ]
             
             # Try each pattern
@@ -34,12 +57,10 @@ class ResponseProcessor:
                             extracted_value = int(re.search(r'\d{4}', extracted_value).group(0))
                         except:
                             pass
-                    elif any(x in field_name for x in ["amount", "cac", "ltv", "burn_rate"]):
-                        # Extract numeric value from currency
-                        try:
-                            extracted_value = re.search(r'[\d,.]+', extracted_value).group(0)
-                        except:
-                            pass
+                    elif field_name.split('.')[-1].lower() in MONEY_FIELDS:
+                        # Normalize currency amounts ("$1.2M", "50k EUR per month") without losing currency or period
+                        period = MONEY_FIELDS[field_name.split('.')[-1].lower()]
+                        extracted_value = normalize_money(extracted_value, period)
                     
                     # Store in the right nested structure
                     parts = field_name.split('.')
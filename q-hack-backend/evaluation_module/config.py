@@ -0,0 +1,45 @@
+# evaluation_module/config.py
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env file in parent directory
+load_dotenv(dotenv_path="../.env")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class EvaluationConfig:
+    # Reference data (CSV benchmarks used by the evaluator)
+    RESOURCES_DIR = os.getenv("EVALUATOR_RESOURCES_DIR", os.path.join(BACKEND_DIR, "resources"))
+
+    # Bundled NLTK data (VADER lexicon); nothing is downloaded at runtime
+    NLTK_DATA_DIR = os.getenv("NLTK_DATA_DIR", os.path.join(BACKEND_DIR, "resources", "nltk_data"))
+    VADER_LEXICON = "sentiment/vader_lexicon/vader_lexicon.txt"  # relative to NLTK_DATA_DIR
+
+    # FinBERT inference
+    FINBERT_BATCH_SIZE = int(os.getenv("FINBERT_BATCH_SIZE", "32"))
+    # Long texts are scored as overlapping token windows; tokens shared by neighbouring windows
+    FINBERT_WINDOW_OVERLAP = int(os.getenv("FINBERT_WINDOW_OVERLAP", "64"))
+
+    # Cascade scoring: VADER first, FinBERT only for finance terms or a VADER compound inside the band
+    SENTIMENT_CASCADE = os.getenv("SENTIMENT_CASCADE", "false").lower() == "true"
+    SENTIMENT_CASCADE_BAND_LOW = float(os.getenv("SENTIMENT_CASCADE_BAND_LOW", "-0.5"))
+    SENTIMENT_CASCADE_BAND_HIGH = float(os.getenv("SENTIMENT_CASCADE_BAND_HIGH", "0.5"))
+
+    # Sentiment score cache (in-memory LRU backed by SQLite; empty path = memory only)
+    SENTIMENT_CACHE_ENABLED = os.getenv("SENTIMENT_CACHE_ENABLED", "true").lower() == "true"
+    SENTIMENT_CACHE_PATH = os.getenv("SENTIMENT_CACHE_PATH", os.path.join(BACKEND_DIR, "cache", "sentiment_cache.sqlite3"))
+    SENTIMENT_CACHE_MAX_ENTRIES = int(os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", "10000"))
+
+    # FinBERT CPU backend: "torch" (fp32), "quantized" (dynamic int8) or "onnx"
+    FINBERT_BACKEND = os.getenv("FINBERT_BACKEND", "torch").lower()
+    FINBERT_ONNX_PATH = os.getenv("FINBERT_ONNX_PATH", os.path.join(BACKEND_DIR, "cache", "finbert", "model.onnx"))
+
+    # Shared sentiment server (used when its socket exists; empty path = always in-process)
+    SENTIMENT_SERVER_SOCKET = os.getenv("SENTIMENT_SERVER_SOCKET", os.path.join(BACKEND_DIR, "cache", "sentiment.sock"))
+    SENTIMENT_SERVER_MAX_BATCH = int(os.getenv("SENTIMENT_SERVER_MAX_BATCH", "32"))
+    SENTIMENT_SERVER_MAX_WAIT_MS = float(os.getenv("SENTIMENT_SERVER_MAX_WAIT_MS", "5"))
+    SENTIMENT_SERVER_TIMEOUT = float(os.getenv("SENTIMENT_SERVER_TIMEOUT", "30"))
+    SENTIMENT_SERVER_RETRY_SECONDS = float(os.getenv("SENTIMENT_SERVER_RETRY_SECONDS", "30"))  # after a failure
+
+    # Load the extraction and evaluation stack in a background thread when the API starts
+    PRELOAD_EVALUATOR = os.getenv("PRELOAD_EVALUATOR", "true").lower() == "true"
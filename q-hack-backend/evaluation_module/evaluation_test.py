@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Test script for the evaluation module.
+Run this from the q-hack-backend directory with: python -m evaluation_module.evaluation_test
+"""
+
+import glob
+import json
+import os
+import tempfile
+
+from evaluation_module.config import BACKEND_DIR
+from evaluation_module.services.columnar import evaluate_columnar, synthetic_startups
+from evaluation_module.services.gazetteer import INVESTOR_SUFFIXES, Gazetteer
+from evaluation_module.services.keyword_matcher import KeywordMatcher
+from evaluation_module.services.reference_data import get_reference_data
+from evaluation_module.services.sentiment_cache import SentimentCache
+from evaluation_module.services.sentiment_server import SentimentClient, SentimentServer
+from evaluation_module.services.value_parser import format_value, parse_money, parse_percent, parse_rate
+
+CORPUS_DIRS = ["Jsons", "JSONS_NEW", "PreviouslyCalculatedSlidedecks"]
+
+
+def load_corpus():
+    """Yield (path, data) for every startup JSON bundled with the backend."""
+    for directory in CORPUS_DIRS:
+        for path in sorted(glob.glob(os.path.join(BACKEND_DIR, directory, "*.json"))):
+            with open(path, "r") as f:
+                yield path, json.load(f)
+
+
+def naive_matches(keywords, text):
+    """The substring loop the evaluator used before the automaton."""
+    return [idx for idx, keyword in enumerate(keywords) if keyword in text.lower()]
+
+
+def test_keyword_matcher_overlaps():
+    """Overlapping and nested keywords are all reported."""
+    keywords = ["he", "she", "his", "hers", "", "x"]
+    matcher = KeywordMatcher(keywords)
+    for text in ["ushers", "SHE said", "this", "", "nothing"]:
+        assert matcher.find_all(text) == naive_matches(keywords, text), text
+    assert matcher.first_match("ushers") == "he"
+    assert KeywordMatcher(["abc"]).first("xyz") is None
+
+
+def test_keyword_matcher_corpus_parity():
+    """The automaton agrees with the substring loop on every founder in the corpus."""
+    reference = get_reference_data()
+    checks = [
+        ("background", reference.industry_matcher, reference.industry_keywords),
+        ("university", reference.university_matcher, reference.universities),
+        ("degree", reference.degree_matcher, reference.degrees),
+    ]
+    compared = 0
+    for path, data in load_corpus():
+        team = data.get("team") if isinstance(data, dict) else None
+        founders = team.get("founders", []) if isinstance(team, dict) else []
+        for founder in founders:
+            for field, matcher, keywords in checks:
+                text = founder.get(field)
+                if not isinstance(text, str) or not text:
+                    continue
+                assert matcher.find_all(text) == naive_matches(keywords, text), (path, field, text)
+                compared += 1
+    assert compared > 0
+    print(f"Compared {compared} founder fields against the substring loop")
+
+
+def test_gazetteer_lookups():
+    """Exact names and aliases hit the index; other text falls back to substring order."""
+    gazetteer = Gazetteer(
+        [(("Sequoia Capital",), 1), (("GV",), 2), (("GGV Capital",), 3)],
+        INVESTOR_SUFFIXES
+    )
+    assert gazetteer.lookup("Sequoia Capital") == 1
+    assert gazetteer.lookup("sequoia") == 1  # alias without "Capital"
+    assert gazetteer.lookup("GGV Capital") == 3  # exact name beats the "gv" substring
+    assert gazetteer.lookup("Led by Sequoia Capital India") == 1
+    assert gazetteer.lookup("Unknown Angels") is None
+
+    reference = get_reference_data()
+    assert reference.country_gazetteer.lookup("Headquartered in Germany") is not None
+    assert reference.funding_stage_gazetteer.lookup("Seed") == 2
+
+
+def test_sentiment_cache_tiers():
+    """Scores survive a restart through the disk tier; the memory tier stays bounded."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sentiment.sqlite3")
+        cache = SentimentCache(path, max_entries=2)
+        cache.put_many("finbert", "v1", [("a", 0.1), ("b", 0.2), ("c", 0.3)])
+        assert len(cache._memory) == 2
+        assert cache.get("finbert", "v2", "a") is None  # version is part of the key
+
+        restarted = SentimentCache(path, max_entries=2)
+        assert restarted.get_many("finbert", "v1", ["a", "b", "d"]) == {"a": 0.1, "b": 0.2}
+        stats = restarted.stats()
+        assert (stats["disk_hits"], stats["misses"]) == (2, 1)
+
+
+def test_value_parser_units():
+    """Suffixes, ranges, currencies and periods are normalized; percentages kept apart."""
+    assert parse_money("$1.2B").value == 1.2e9
+    tam = parse_money("€850M with 12% CAGR")
+    assert (tam.value, tam.currency) == (850e6, "EUR")
+    assert parse_percent("€850M with 12% CAGR").value == 12
+    assert parse_money("$600,000").magnitude() == ("million", 0.6)
+    assert parse_money("$750K to $1M").value == 875e3
+    assert (parse_money("$5-10M").low, parse_money("$5-10M").high) == (5e6, 10e6)
+
+    burn = parse_money("50k EUR per month")
+    assert (burn.value, burn.period, burn.annualized) == (50e3, "month", 600e3)
+    assert format_value(burn) == "€50K/month"
+
+    assert parse_money("B2B SaaS, Series A") is None  # no stray "2B"
+    assert parse_money("5 months").scaled is False
+    assert parse_rate("25% YoY") == 25 and parse_rate("3.75") == 3.75 and parse_rate("Growing") is None
+
+
+def test_columnar_parity():
+    """The columnar evaluator gives the per-dict scores for the corpus and synthetic decks."""
+    from evaluator_final import evaluate_data, get_evaluation_context
+
+    context = get_evaluation_context()
+    corpus = [data for _, data in load_corpus()]
+    startups = corpus + synthetic_startups(500, seed=1, corpus=corpus)
+    scores = evaluate_columnar(startups, context)
+
+    assert len(scores) == len(startups)
+    for index, data in enumerate(startups):
+        row = scores.iloc[index]
+        try:
+            expected = evaluate_data(data, context)
+        except Exception:
+            assert row["error"], index  # rejected by both paths
+            continue
+        assert {key: int(row[key]) for key in expected} == expected, index
+    print(f"Compared {len(startups)} startups against evaluate_data")
+
+
+def test_incremental_rescoring():
+    """Changing one section re-scores only that section and still matches a full evaluation."""
+    import copy
+    from evaluator_final import IncrementalEvaluator, evaluate_data, get_evaluation_context
+
+    context = get_evaluation_context()
+    data = next(data for path, data in load_corpus() if path.endswith("airbnb.json"))
+    evaluator = IncrementalEvaluator(context)
+    assert evaluator.evaluate("airbnb", data) == evaluate_data(data, context)
+    assert evaluator.sections_scored == 7
+
+    updated = copy.deepcopy(data)
+    updated["funding"]["amount"] = "$25 million"
+    assert evaluator.evaluate("airbnb", updated) == evaluate_data(updated, context)
+    assert (evaluator.sections_scored, evaluator.sections_reused) == (8, 6)
+
+    evaluator.evaluate("airbnb", updated)
+    assert evaluator.stats()["sections_reused"] == 13
+
+
+def test_finbert_windows():
+    """Long token sequences are covered by overlapping windows that fit the model."""
+    from evaluator_final import FinBERT
+
+    finbert = FinBERT.__new__(FinBERT)  # windowing needs no model
+    finbert.window, finbert.overlap = 10, 3
+    assert finbert.windows(list(range(10))) == [list(range(10))]
+
+    windows = finbert.windows(list(range(25)))
+    assert all(len(w) <= 10 for w in windows)
+    assert [w[0] for w in windows] == [0, 7, 14, 21]
+    assert windows[-1][-1] == 24
+    assert all(a[-3:] == b[:3] for a, b in zip(windows, windows[1:]))
+
+
+class LengthModel:
+    """Stand-in for FinBERT that scores a text by its length and records batch sizes."""
+    name = "length"
+    version = "length:v1"
+    initialized = True
+
+    def __init__(self):
+        self.batches = []
+
+    def sentiment_batch(self, texts, batch_size=None, use_cache=True):
+        self.batches.append(len(texts))
+        return [len(text) / 100 for text in texts]
+
+
+def start_sentiment_server(model, path):
+    """Run a SentimentServer in a background thread; returns a function that stops it."""
+    import asyncio
+    import threading
+    import time
+
+    server = SentimentServer(model, path, max_batch=64, max_wait_ms=50)
+    loop = asyncio.new_event_loop()
+
+    def run():
+        try:
+            loop.run_until_complete(server.serve())
+        except asyncio.CancelledError:
+            pass
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    while not os.path.exists(path):
+        time.sleep(0.01)
+
+    def stop():
+        loop.call_soon_threadsafe(lambda: [task.cancel() for task in asyncio.all_tasks(loop)])
+        thread.join(timeout=5)
+
+    return stop
+
+
+def test_sentiment_server_batching():
+    """Concurrent clients share micro-batches; while the server is down the local model scores."""
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sentiment.sock")
+        model = LengthModel()
+        stop = start_sentiment_server(model, path)
+
+        client = SentimentClient(path, fallback=LengthModel, retry_seconds=0.2)
+        assert client.version == "length:v1"
+        texts = ["x" * n for n in range(1, 17)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            scores = list(pool.map(lambda text: client.sentiment(text), texts))
+        assert scores == [len(text) / 100 for text in texts]
+        assert len(model.batches) < len(texts)
+        # Non-text items score neutral without failing the batch or the client
+        assert client.sentiment_batch(["ab", ["not", "text"], None]) == [0.02, 0.5, 0.5]
+        assert client.local is None
+
+        stop()
+        assert client.sentiment_batch(["abc"]) == [0.03]
+        assert client.sentiment_batch(["abcd"]) == [0.04]  # cooling down: not sent to the server
+        assert client.local.batches == [1, 1]
+
+        # The server comes back: after the cooldown the client uses it again and drops its local copy
+        restarted = LengthModel()
+        stop = start_sentiment_server(restarted, path)
+        time.sleep(0.25)
+        assert client.sentiment_batch(["abcde"]) == [0.05]
+        assert restarted.batches == [1] and client.local is None
+        stop()
+
+
+def test_sentiment_cascade_routing():
+    """Confident VADER scores stay; finance terms and the uncertainty band go to FinBERT."""
+    from evaluator_final import get_vader_analyzer
+    from evaluation_module.services.sentiment_cascade import SentimentCascade
+
+    cascade = SentimentCascade(get_vader_analyzer(), band=(-0.5, 0.5))
+    confident = "Customers love it, amazing and wonderful growth"
+    texts = [confident, "Burn rate is wonderful and amazing", "We sell software"]
+    scores, escalated = cascade.route(texts)
+    assert list(scores) == [confident]
+    assert escalated == texts[1:]
+    assert cascade.stats()["finance_terms"] == 1 and cascade.stats()["uncertain"] == 1
+    assert cascade.reason("Narrow margins", 0.99) == "finance_terms"
+    assert cascade.reason("A marginal note", 0.99) is None  # whole words only
+
+
+def test_bulk_runner_load_errors():
+    """A corrupt deck file is reported as an error, not scored as an empty deck."""
+    from evaluation_module.services import bulk_runner
+
+    bulk_runner._init_worker()
+    with tempfile.TemporaryDirectory() as tmp:
+        corrupt = os.path.join(tmp, "truncated.json")
+        with open(corrupt, "w") as f:
+            f.write('{"company_name": "Acme", "team": {')
+        result = bulk_runner._evaluate_file(corrupt)
+        assert "metrics" not in result and result["error"].startswith("JSONDecodeError")
+
+        path, data = next(load_corpus())
+        assert bulk_runner._evaluate_file(path)["metrics"] == bulk_runner.evaluator.evaluate_data(data)
+
+
+def test_bulk_runner_retry_errors():
+    """Retrying failed files replaces their error rows instead of adding a second row."""
+    from evaluation_module.services import bulk_runner
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ("ndjson", "csv"):
+            output = os.path.join(tmp, f"scores.{fmt}")
+            writer = bulk_runner.ResultWriter(output, fmt)
+            writer.write({"file": "a.json", "metrics": {"UnicornScore": 70}, "seconds": 0.1})
+            writer.write({"file": "b.json", "error": "JSONDecodeError: truncated", "seconds": 0.1})
+            writer.close()
+
+            assert bulk_runner.completed_files(output, fmt) == {"a.json", "b.json"}
+            assert bulk_runner.drop_error_rows(output, fmt) == 1
+            assert bulk_runner.completed_files(output, fmt) == {"a.json"}
+            assert bulk_runner.drop_error_rows(output, fmt) == 0
+
+            writer = bulk_runner.ResultWriter(output, fmt)
+            writer.write({"file": "b.json", "metrics": {"UnicornScore": 40}, "seconds": 0.1})
+            writer.close()
+            rows = bulk_runner._read_rows(output, fmt)[1]
+            assert [row["file"] for row in rows] == ["a.json", "b.json"]
+            assert not any(row.get("error") for row in rows)
+
+
+# This allows the script to be run directly
+if __name__ == "__main__":
+    test_keyword_matcher_overlaps()
+    test_keyword_matcher_corpus_parity()
+    test_gazetteer_lookups()
+    test_sentiment_cache_tiers()
+    test_value_parser_units()
+    test_columnar_parity()
+    test_incremental_rescoring()
+    test_finbert_windows()
+    test_sentiment_server_batching()
+    test_sentiment_cascade_routing()
+    test_bulk_runner_load_errors()
+    test_bulk_runner_retry_errors()
+    print("All evaluation module tests passed")
@@ -0,0 +1,291 @@
+# evaluation_module/services/benchmark.py
+"""
+Benchmark suite for the evaluator.
+
+Runs every evaluate_* function, prefetch_finbert_scores, evaluate_data and
+the file-based evaluate() over the bundled decks (Jsons/, JSONS_NEW/,
+PreviouslyCalculatedSlidedecks/) and over scaled-up synthetic copies, and
+reports per-function latency percentiles, allocations (peak traced memory
+per call, from a separate tracemalloc pass so it does not skew the timings)
+and the share of each function's time spent in FinBERT / VADER inference.
+
+Results can be saved as a baseline; later runs are compared against it and
+functions whose p50 latency or allocations grew past the threshold are
+flagged. The sentiment cache is off unless --with-cache is given, so model
+work is measured rather than cache hits.
+
+Run from the q-hack-backend directory:
+    python -m evaluation_module.services.benchmark --save-baseline
+    python -m evaluation_module.services.benchmark --scale 10 --fail-on-regression
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import BACKEND_DIR, EvaluationConfig
+
+CORPUS_DIRS = ["Jsons", "JSONS_NEW", "PreviouslyCalculatedSlidedecks"]
+
+SECTION_FUNCTIONS = [
+    "evaluate_team", "evaluate_market", "evaluate_product", "evaluate_traction",
+    "evaluate_funding", "evaluate_financial_efficiency", "evaluate_miscellaneous",
+]
+
+
+def _load_corpus() -> List[Tuple[str, dict]]:
+    """(path, data) for every deck the evaluator can score."""
+    import glob
+    from evaluator_final import evaluate_data
+
+    decks = []
+    for directory in CORPUS_DIRS:
+        for path in sorted(glob.glob(os.path.join(BACKEND_DIR, directory, "*.json"))):
+            with open(path, "r") as f:
+                data = json.load(f)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    evaluate_data(data)
+            except Exception:
+                continue  # decks the evaluator rejects are not timed
+            decks.append((path, data))
+    return decks
+
+
+def _calls(decks: List[Tuple[str, dict]], context, with_files: bool) -> Dict[str, List[Callable]]:
+    """One zero-argument call per deck for every benchmarked function."""
+    import evaluator_final as evaluator
+
+    calls: Dict[str, List[Callable]] = {name: [] for name in ["prefetch_finbert_scores"] + SECTION_FUNCTIONS}
+    calls.update({"calculate_unicorn_score": [], "evaluate_data": []})
+    if with_files:
+        calls["evaluate"] = []
+
+    reference, vader = context.reference, context.vader
+    for path, data in decks:
+        finbert_scores = evaluator.prefetch_finbert_scores(data, context.finbert, vader, cascade=context.cascade)
+        metrics = evaluator.evaluate_data(data, context)
+        calls["prefetch_finbert_scores"].append(
+            lambda d=data: evaluator.prefetch_finbert_scores(d, context.finbert, vader, cascade=context.cascade))
+        calls["evaluate_team"].append(lambda d=data: evaluator.evaluate_team(d, reference))
+        calls["evaluate_market"].append(lambda d=data: evaluator.evaluate_market(d, reference))
+        calls["evaluate_product"].append(
+            lambda d=data, s=finbert_scores: evaluator.evaluate_product(d, reference, s))
+        calls["evaluate_traction"].append(
+            lambda d=data, s=finbert_scores: evaluator.evaluate_traction(d, reference, s, vader))
+        calls["evaluate_funding"].append(
+            lambda d=data, s=finbert_scores: evaluator.evaluate_funding(d, reference, s, vader))
+        calls["evaluate_financial_efficiency"].append(
+            lambda d=data, s=finbert_scores: evaluator.evaluate_financial_efficiency(d, reference, s))
+        calls["evaluate_miscellaneous"].append(
+            lambda d=data, s=finbert_scores: evaluator.evaluate_miscellaneous(d, reference, s))
+        calls["calculate_unicorn_score"].append(lambda m=metrics: evaluator.calculate_unicorn_score(m))
+        calls["evaluate_data"].append(lambda d=data: evaluator.evaluate_data(d, context))
+        if with_files:
+            calls["evaluate"].append(lambda p=path: evaluator.evaluate(p, context))
+    return calls
+
+
+class _InferenceTimer:
+    """Times FinBERT batches and VADER calls while active by wrapping the model objects."""
+
+    def __init__(self, context):
+        self.context = context
+        self.seconds = {"finbert": 0.0, "vader": 0.0}
+
+    def _timed(self, key: str, func: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.seconds[key] += time.perf_counter() - start
+        return wrapper
+
+    def __enter__(self):
+        finbert, vader = self.context.finbert, self.context.vader
+        if finbert is not None and finbert.initialized:
+            finbert.sentiment_batch = self._timed("finbert", finbert.sentiment_batch)
+        if vader.initialized:
+            vader.analyzer.polarity_scores = self._timed("vader", vader.analyzer.polarity_scores)
+        return self
+
+    def __exit__(self, *exc):
+        # Drop the instance attributes so the class methods are used again
+        finbert, vader = self.context.finbert, self.context.vader
+        if finbert is not None:
+            finbert.__dict__.pop("sentiment_batch", None)
+        if vader.initialized:
+            vader.analyzer.__dict__.pop("polarity_scores", None)
+
+
+def _percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    values = np.asarray(samples_ms)
+    return {
+        "calls": len(values),
+        "mean_ms": round(float(values.mean()), 4),
+        "p50_ms": round(float(np.percentile(values, 50)), 4),
+        "p90_ms": round(float(np.percentile(values, 90)), 4),
+        "p99_ms": round(float(np.percentile(values, 99)), 4),
+    }
+
+
+def measure(calls: Dict[str, List[Callable]], repeat: int, context) -> Dict[str, Dict[str, float]]:
+    """Latency percentiles, allocations and inference share for every function."""
+    results = {}
+    for name, funcs in calls.items():
+        # Timing pass
+        samples = []
+        with _InferenceTimer(context) as timer, contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                for func in funcs:
+                    start = time.perf_counter()
+                    func()
+                    samples.append((time.perf_counter() - start) * 1000)
+        stats = _percentiles(samples)
+        total = sum(samples) / 1000
+        inference = timer.seconds["finbert"] + timer.seconds["vader"]
+        stats["inference_share"] = round(inference / total, 4) if total else 0.0
+
+        # Allocation pass (tracemalloc slows everything down, so it is timed separately)
+        tracemalloc.start()
+        peak = 0
+        allocated = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for func in funcs:
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                func()
+                _, call_peak = tracemalloc.get_traced_memory()
+                peak = max(peak, call_peak - before)
+                allocated += max(0, call_peak - before)
+        tracemalloc.stop()
+        stats["alloc_kib_per_call"] = round(allocated / len(funcs) / 1024, 2) if funcs else 0.0
+        stats["peak_kib"] = round(peak / 1024, 2)
+        results[name] = stats
+    return results
+
+
+def run_benchmark(scale: int = 1, repeat: int = 5, with_cache: bool = False) -> Dict:
+    """Benchmark the corpus and, for scale > 1, a synthetic workload scale times its size."""
+    import evaluator_final as evaluator
+    from .columnar import synthetic_startups
+
+    if not with_cache:
+        EvaluationConfig.SENTIMENT_CACHE_ENABLED = False
+    # Measure the in-process model, not a shared sentiment server
+    EvaluationConfig.SENTIMENT_SERVER_SOCKET = ""
+    context = evaluator.get_evaluation_context()
+    decks = _load_corpus()
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "finbert": context.finbert.version if context.finbert and context.finbert.initialized else "fallback",
+            "vader": context.vader.version if context.vader.initialized else None,
+            "sentiment_cache": with_cache,
+        },
+        "settings": {"scale": scale, "repeat": repeat, "decks": len(decks)},
+        "workloads": {},
+    }
+
+    report["workloads"]["corpus"] = measure(_calls(decks, context, with_files=True), repeat, context)
+    if scale > 1:
+        synthetic = synthetic_startups(len(decks) * scale, seed=0, corpus=[data for _, data in decks])
+        workload = [(f"synthetic-{i}", data) for i, data in enumerate(synthetic)]
+        report["workloads"][f"synthetic-x{scale}"] = measure(
+            _calls(workload, context, with_files=False), 1, context)
+    return report
+
+
+def compare(report: Dict, baseline: Dict, threshold: float, min_ms: float = 0.05) -> List[str]:
+    """Regressions of p50 latency or allocations beyond threshold (a fraction, 0.2 = 20%)."""
+    regressions = []
+    for workload, functions in report["workloads"].items():
+        for name, stats in functions.items():
+            old = baseline.get("workloads", {}).get(workload, {}).get(name)
+            if not old:
+                continue
+            if (stats["p50_ms"] > old["p50_ms"] * (1 + threshold)
+                    and stats["p50_ms"] - old["p50_ms"] > min_ms):
+                regressions.append(f"{workload}/{name}: p50 {old['p50_ms']} → {stats['p50_ms']} ms")
+            if stats["alloc_kib_per_call"] > old["alloc_kib_per_call"] * (1 + threshold) + 1:
+                regressions.append(f"{workload}/{name}: allocations "
+                                   f"{old['alloc_kib_per_call']} → {stats['alloc_kib_per_call']} KiB/call")
+    return regressions
+
+
+def print_report(report: Dict, baseline: Optional[Dict] = None):
+    for workload, functions in report["workloads"].items():
+        print(f"\n{workload}")
+        print(f"{'function':<32} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'KiB/call':>9} "
+              f"{'infer %':>8} {'vs base':>8}")
+        for name, stats in functions.items():
+            change = ""
+            old = (baseline or {}).get("workloads", {}).get(workload, {}).get(name)
+            if old and old["p50_ms"]:
+                change = f"{(stats['p50_ms'] / old['p50_ms'] - 1) * 100:+.0f}%"
+            print(f"{name:<32} {stats['p50_ms']:>8.3f} {stats['p90_ms']:>8.3f} {stats['p99_ms']:>8.3f} "
+                  f"{stats['alloc_kib_per_call']:>9.1f} {stats['inference_share'] * 100:>7.1f}% {change:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the evaluator over the bundled decks")
+    parser.add_argument("--scale", type=int, default=1, help="Also run a synthetic workload of N x the corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing passes over the corpus")
+    parser.add_argument("--with-cache", action="store_true", help="Keep the sentiment cache enabled")
+    parser.add_argument("--baseline", default=os.path.join(BACKEND_DIR, "cache", "benchmark_baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before flagging")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--json", help="Also write the full report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.scale, args.repeat, args.with_cache)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if baseline is None:
+        print("\nNo baseline yet; run with --save-baseline to create one")
+        return
+    if baseline.get("environment") != report["environment"]:
+        print("\n⚠️ Baseline was recorded in a different environment; comparisons may be noisy")
+
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        if args.fail_on_regression:
+            sys.exit(1)
+    else:
+        print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# evaluation_module/services/bulk_runner.py
+"""
+Bulk evaluation of extracted startup JSONs over a process pool.
+
+Each worker imports the evaluator and loads its models once, then scores
+many files. Results are streamed to NDJSON or CSV as they complete, and a
+re-run with the same output file skips everything already written, so an
+interrupted run resumes where it stopped.
+
+Run from the q-hack-backend directory:
+    python evaluator_final.py bulk Jsons JSONS_NEW PreviouslyCalculatedSlidedecks -o scores.ndjson
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Dict, Iterable, List, Set
+
+METRIC_COLUMNS = [
+    "Team", "Market", "Product", "Traction", "Funding",
+    "Financial Efficiency", "Miscellaneous", "UnicornScore"
+]
+
+
+def collect_files(paths: Iterable[str]) -> List[str]:
+    """Expand directories to their *.json files, keeping explicit files as given."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.json"))))
+        else:
+            files.append(path)
+    # Same file listed twice should only be scored once
+    return list(dict.fromkeys(files))
+
+
+def _repair_tail(output: str):
+    """Drop a partially written last line left behind by a crash."""
+    with open(output, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def _read_rows(output: str, fmt: str):
+    """(fieldnames, rows) of an existing output file; fieldnames is None for NDJSON."""
+    _repair_tail(output)
+    with open(output, "r", newline="") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            return reader.fieldnames, list(reader)
+        rows = []
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return None, rows
+
+
+def drop_error_rows(output: str, fmt: str) -> int:
+    """
+    Rewrite the output without its error rows, so files about to be
+    re-scored end up with a single row. Returns the number of rows dropped.
+    """
+    if not os.path.exists(output):
+        return 0
+    fieldnames, rows = _read_rows(output, fmt)
+    kept = [row for row in rows if not row.get("error")]
+    if len(kept) == len(rows):
+        return 0
+
+    # Written next to the output and swapped in, so a crash never leaves it half rewritten
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "w", newline="") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(kept)
+        else:
+            f.writelines(json.dumps(row) + "\n" for row in kept)
+    os.replace(tmp_path, output)
+    return len(rows) - len(kept)
+
+
+def completed_files(output: str, fmt: str) -> Set[str]:
+    """Files that already have a result in the output file."""
+    if not os.path.exists(output):
+        return set()
+    return {row["file"] for row in _read_rows(output, fmt)[1]}
+
+
+def _init_worker():
+    """Load the evaluator, reference data and sentiment models once per worker."""
+    global evaluator
+    import evaluator_final as evaluator
+
+    try:
+        import torch
+        torch.set_num_threads(int(os.getenv("BULK_TORCH_THREADS", "1")))
+    except ImportError:
+        pass
+
+    evaluator.get_evaluation_context()
+
+
+def _evaluate_file(path: str) -> Dict:
+    start = time.perf_counter()
+    try:
+        # Loaded here rather than through evaluator.get_json, which turns a corrupt file into {} and default scores
+        with open(path, "r") as f:
+            data = json.load(f)
+        metrics = evaluator.evaluate_data(data, evaluator.get_evaluation_context())
+        result = {"file": path, "metrics": metrics}
+    except Exception as e:
+        result = {"file": path, "error": f"{type(e).__name__}: {e}"}
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+class ResultWriter:
+    """Appends results to NDJSON or CSV and flushes after every row."""
+
+    def __init__(self, output: str, fmt: str):
+        self.fmt = fmt
+        new_file = not os.path.exists(output) or os.path.getsize(output) == 0
+        self.file = open(output, "a", newline="")
+        if fmt == "csv":
+            self.writer = csv.DictWriter(self.file, fieldnames=["file"] + METRIC_COLUMNS + ["error", "seconds"])
+            if new_file:
+                self.writer.writeheader()
+
+    def write(self, result: Dict):
+        if self.fmt == "csv":
+            row = {"file": result["file"], "error": result.get("error", ""), "seconds": result["seconds"]}
+            row.update(result.get("metrics", {}))
+            self.writer.writerow(row)
+        else:
+            self.file.write(json.dumps(result) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def run_bulk(paths: Iterable[str], output: str, fmt: str = "ndjson", workers: int = None,
+             retry_errors: bool = False, progress_every: int = 50) -> Dict[str, float]:
+    """Score every file under paths into output and return throughput stats."""
+    files = collect_files(paths)
+    if retry_errors:
+        dropped = drop_error_rows(output, fmt)
+        if dropped:
+            print(f"🔁 Dropped {dropped} error rows, their files will be re-scored")
+    done = completed_files(output, fmt)
+    pending = [f for f in files if f not in done]
+    workers = workers or os.cpu_count() or 1
+
+    print(f"📂 {len(files)} files, {len(files) - len(pending)} already scored, "
+          f"{len(pending)} to go on {workers} workers")
+
+    writer = ResultWriter(output, fmt)
+    start = time.perf_counter()
+    scored = errors = 0
+    try:
+        # spawn keeps torch and SQLite state out of the forked children
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                                 initializer=_init_worker) as pool:
+            futures = [pool.submit(_evaluate_file, path) for path in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                writer.write(result)
+                scored += 1
+                errors += 1 if "error" in result else 0
+                if scored % progress_every == 0:
+                    elapsed = time.perf_counter() - start
+                    print(f"  {scored}/{len(pending)} scored ({scored / elapsed:.1f} files/s)")
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    stats = {
+        "files": len(files),
+        "skipped": len(files) - len(pending),
+        "scored": scored,
+        "errors": errors,
+        "seconds": round(elapsed, 2),
+        "files_per_second": round(scored / elapsed, 2) if elapsed and scored else 0.0,
+    }
+    print(f"✅ Scored {scored} files ({errors} errors) in {stats['seconds']}s "
+          f"— {stats['files_per_second']} files/s → {output}")
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score many startup JSONs in parallel")
+    parser.add_argument("paths", nargs="+", help="JSON files or directories of JSON files")
+    parser.add_argument("-o", "--output", default="bulk_scores.ndjson")
+    parser.add_argument("--format", choices=("ndjson", "csv"),
+                        help="Output format (default: from the output file extension)")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--retry-errors", action="store_true", help="Re-score files that failed before")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.endswith(".csv") else "ndjson")
+    stats = run_bulk(args.paths, args.output, fmt, args.workers, args.retry_errors)
+    sys.exit(1 if stats["errors"] and stats["errors"] == stats["scored"] else 0)
+
+
+if __name__ == "__main__":
+    main()
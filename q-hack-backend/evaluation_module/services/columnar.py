@@ -0,0 +1,631 @@
+# evaluation_module/services/columnar.py
+"""
+Columnar evaluation of many startups at once.
+
+The per-dict evaluator walks one deck at a time through Python branches.
+Here a single pass flattens N startups into a feature table (one row per
+startup, one column per extracted feature) plus a founder table (one row
+per founder), sentiment is scored once per distinct text across the whole
+batch, and the seven category scores and the UnicornScore are computed as
+NumPy array operations over those columns.
+
+Scores are identical to evaluate_data: every formula below mirrors the
+branch in evaluator_final.py it replaces, including the order in which
+sub-scores are added, so rounding lands on the same integers. A record the
+per-dict path would reject gets an "error" instead of scores.
+
+Run from the q-hack-backend directory:
+    python -m evaluation_module.services.columnar Jsons JSONS_NEW -o scores.csv
+    python -m evaluation_module.services.columnar --synthetic 100000
+"""
+import argparse
+import json
+import os
+import re
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import BACKEND_DIR
+from .bulk_runner import METRIC_COLUMNS, collect_files
+from .value_parser import parse_money, parse_rate
+
+NUMBER_PATTERN = r"[+-]?\d*\.?\d+"
+
+CORPUS_DIRS = ["Jsons", "JSONS_NEW", "PreviouslyCalculatedSlidedecks"]
+
+# Feature columns filled with FinBERT / VADER scores after the extraction pass
+FINBERT_COLUMNS = {
+    "usp_finbert": ("product", "USP"),
+    "acquisition_finbert": ("product", "customer_acquisition"),
+    "user_growth_finbert": ("traction", "user_growth"),
+    "nps_finbert": ("traction", "customer_validation", "NPS"),
+    "cap_table_finbert": ("funding", "cap_table_strength"),
+    "burn_rate_finbert": ("financial_efficiency", "burn_rate"),
+    "cac_ltv_finbert": ("financial_efficiency", "CAC_vs_LTV"),
+    "unit_economics_finbert": ("financial_efficiency", "unit_economics"),
+    "timing_finbert": ("miscellaneous", "timing_fad_risk"),
+}
+VADER_COLUMNS = {
+    "nps_vader": ("traction", "customer_validation", "NPS"),
+    "cap_table_vader": ("funding", "cap_table_strength"),
+}
+# Scored with VADER when it is available, otherwise with FinBERT
+VADER_FIRST_COLUMNS = {
+    "engagement_sentiment": ("traction", "engagement"),
+    "churn_sentiment": ("traction", "customer_validation", "churn"),
+}
+
+FOUNDER_SCORE_COLUMNS = ["background", "university", "degree", "network", "age", "employment", "posts"]
+
+UNICORN_WEIGHTS = [
+    ("Team", 0.30),
+    ("Market", 0.20),
+    ("Product", 0.18),
+    ("Traction", 0.15),
+    ("Funding", 0.08),
+    ("Financial Efficiency", 0.07),
+    ("Miscellaneous", 0.02),
+]
+
+# Factor totals accumulated in the same order as the per-dict evaluator
+MARKET_FACTORS = 0 + 1 + 1.5
+PRODUCT_FACTORS = 0 + 1.2 + 1 + 1
+TRACTION_FACTORS = 0 + 1.3 + 1 + 1 + 1 + 1.2
+
+
+# ---------------------------------------------------------------------------
+# Extraction (one Python pass over the records)
+# ---------------------------------------------------------------------------
+
+def _number(value) -> float:
+    """The value convert_to_score would scale, or NaN where it returns its default."""
+    if value is None or not isinstance(value, (int, float, str)):
+        return np.nan
+    if isinstance(value, str):
+        matches = re.findall(NUMBER_PATTERN, value)
+        return float(matches[0]) if matches else np.nan
+    return float(value)
+
+
+def _int_or_nan(value) -> float:
+    """int(value) as eval_founder_age / eval_founder_network_strength parse it."""
+    if value is None:
+        return np.nan
+    try:
+        return float(int(value))
+    except Exception:
+        return np.nan
+
+
+AMOUNT_UNITS = {None: 0, "billion": 1, "million": 2}
+
+
+def _amount(text) -> Tuple[float, int]:
+    """A TAM / funding amount in billions or millions and its unit (0 none, 1 billion, 2 million)."""
+    parsed = parse_money(text)
+    if parsed is None:
+        return np.nan, 0
+    unit, value = parsed.magnitude()
+    return value, AMOUNT_UNITS[unit]
+
+
+def _employment(employments, hardest_companies) -> Tuple[float, bool]:
+    """Estimated years of experience and whether any employer is a premium company."""
+    emp_years = 0
+    premium_company = False
+    for emp in employments:
+        company = emp.get('company', '').lower()
+        if company in hardest_companies:
+            premium_company = True
+            emp_years += 3
+
+        start = emp.get('start', '')
+        end = emp.get('end', '')
+        if start and end and 'present' not in end.lower():
+            try:
+                start_year = int(re.search(r'\d{4}', start).group())
+                end_year = int(re.search(r'\d{4}', end).group())
+                emp_years += (end_year - start_year)
+            except:
+                emp_years += 1
+        else:
+            emp_years += 2
+    return emp_years, premium_company
+
+
+class _Lookups:
+    """Per-batch memo of reference lookups; decks in a batch repeat a lot of text."""
+
+    def __init__(self, reference):
+        self.reference = reference
+        self._memo: Dict[Tuple[str, object], object] = {}
+
+    def _cached(self, kind, text, compute):
+        key = (kind, text) if isinstance(text, str) else None
+        if key is not None and key in self._memo:
+            return self._memo[key]
+        value = compute(text)
+        if key is not None:
+            self._memo[key] = value
+        return value
+
+    def matches(self, kind: str, matcher, text) -> bool:
+        return self._cached(kind, text, lambda t: matcher.first(t) is not None)
+
+    def value(self, kind: str, gazetteer, text):
+        return self._cached(kind, text, gazetteer.lookup)
+
+
+def _extract_record(data: dict, lookups: _Lookups, vader_available: bool, texts: Dict[str, object]):
+    """Feature row and founder rows for one startup; raises where evaluate_data would."""
+    reference = lookups.reference
+    row = {}
+
+    # Team
+    founders = data.get('team', {}).get('founders', [])
+    row["founder_count"] = len(founders)
+    founder_rows = []
+    for position, founder in enumerate(founders):
+        background = founder.get('background', '')
+        university = founder.get('university', '')
+        degree = founder.get('degree', '')
+        employments = founder.get('previous_employments', [])
+        emp_years, premium = _employment(employments, reference.hardest_companies) if employments else (0, False)
+        founder_rows.append({
+            "position": position,
+            "background_match": bool(background) and lookups.matches("industry", reference.industry_matcher, background),
+            "university_match": bool(university) and lookups.matches("university", reference.university_matcher, university),
+            "degree_match": bool(degree) and lookups.matches("degree", reference.degree_matcher, degree),
+            "network_strength": _int_or_nan(founder.get('network_strength')),
+            "age": _int_or_nan(founder.get('age')),
+            "has_employments": bool(employments),
+            "employment_years": emp_years,
+            "premium_employer": premium,
+            "linkedin_posts": _number(founder.get('linkedin_posts_last_30d', 0)),
+        })
+
+    # Market
+    market_data = data.get('market', {})
+    tam = market_data.get('TAM', '')
+    row["tam_value"], row["tam_unit"] = _amount(tam) if tam else (np.nan, 0)
+    growth_rate = market_data.get('growth_rate', '')
+    value = parse_rate(growth_rate) if growth_rate else None
+    row["growth_rate"] = np.nan if value is None else value
+
+    # Product
+    product_data = data.get('product', {})
+    stage = product_data.get('stage', '')
+    score = lookups.value("product_stage", reference.product_stage_gazetteer, stage) if stage else None
+    row["product_stage_score"] = np.nan if score is None else score
+    texts["usp_finbert"] = product_data.get('USP', '')
+    texts["acquisition_finbert"] = product_data.get('customer_acquisition', '')
+
+    # Traction
+    traction_data = data.get('traction', {})
+    validation = traction_data.get('customer_validation', {})
+    texts["user_growth_finbert"] = traction_data.get('user_growth', '')
+    texts["engagement_sentiment"] = traction_data.get('engagement', '')
+    texts["churn_sentiment"] = validation.get('churn', '')
+    texts["nps_finbert"] = texts["nps_vader"] = validation.get('NPS', '')
+    trend_score = traction_data.get('google_trend_score', 0)
+    if not isinstance(trend_score, (int, float)):
+        raise TypeError(f"google_trend_score must be a number, got {type(trend_score).__name__}")
+    row["google_trend_score"] = float(trend_score)
+
+    # Funding
+    funding_data = data.get('funding', {})
+    stage = funding_data.get('stage', '')
+    score = lookups.value("funding_stage", reference.funding_stage_gazetteer, stage) if stage else None
+    row["funding_stage_score"] = np.nan if score is None else score
+    amount = funding_data.get('amount', '')
+    row["amount_value"], row["amount_unit"] = _amount(amount) if amount else (np.nan, 0)
+    texts["cap_table_finbert"] = texts["cap_table_vader"] = funding_data.get('cap_table_strength', '')
+
+    investors = funding_data.get('investors_on_board', [])
+    investor_ranking = 0
+    fortune_count = 0
+    for investor in investors or []:
+        investor_name = investor.get('name', '')
+        rank = lookups.value("investor", reference.investor_gazetteer, investor_name)
+        if rank is not None:
+            investor_ranking += 100 - min(99, rank)
+        if lookups.value("fortune500", reference.fortune500_gazetteer, investor_name) is not None:
+            fortune_count += 1
+    row["investor_count"] = len(investors) if investors else 0
+    row["investor_ranking"] = investor_ranking
+    row["fortune500_investors"] = fortune_count
+
+    # Financial efficiency
+    financial_data = data.get('financial_efficiency', {})
+    texts["burn_rate_finbert"] = financial_data.get('burn_rate', '')
+    texts["cac_ltv_finbert"] = financial_data.get('CAC_vs_LTV', '')
+    texts["unit_economics_finbert"] = financial_data.get('unit_economics', '')
+
+    # Miscellaneous
+    misc_data = data.get('miscellaneous', {})
+    geographic = misc_data.get('geographic_focus', '')
+    score = lookups.value("country", reference.country_gazetteer, geographic) if geographic else None
+    row["geo_score"] = np.nan if score is None else score
+    texts["timing_finbert"] = misc_data.get('timing_fad_risk', '')
+
+    if not vader_available:
+        texts["nps_vader"] = texts["cap_table_vader"] = None
+
+    return row, founder_rows
+
+
+def _score_texts(raw: Dict[str, List], context) -> Dict[str, np.ndarray]:
+    """Turn the raw text columns into sentiment columns, scoring each distinct text once."""
+    from evaluator_final import fallback_sentiment, finbert_sentiment_batch
+
+    vader = context.vader
+    finbert_columns = list(FINBERT_COLUMNS)
+    vader_columns = list(VADER_COLUMNS)
+    if vader.initialized:
+        vader_columns += list(VADER_FIRST_COLUMNS)
+    else:
+        finbert_columns += list(VADER_FIRST_COLUMNS)
+
+    unique = list(dict.fromkeys(
+        text for column in finbert_columns for text in raw[column] if text and isinstance(text, str)
+    ))
+    # With the cascade, confident VADER scores stand in for FinBERT
+    finbert_scores = {}
+    if context.cascade:
+        finbert_scores, unique = context.cascade.route(unique)
+    if context.finbert is not None and context.finbert.initialized:
+        finbert_scores.update(zip(unique, context.finbert.sentiment_batch(unique)))
+    else:
+        finbert_scores.update(zip(unique, finbert_sentiment_batch(unique)))
+
+    vader_scores = {}
+
+    def finbert_of(text):
+        if not text:
+            return np.nan
+        if isinstance(text, str):
+            return finbert_scores[text]
+        return fallback_sentiment(text)  # 0.5 for non-text values, as the model returns
+
+    def vader_of(text):
+        if not text:
+            return np.nan
+        if isinstance(text, str):
+            if text not in vader_scores:
+                vader_scores[text] = vader.sentiment(text)
+            return vader_scores[text]
+        return vader.sentiment(text)
+
+    columns = {}
+    for column in finbert_columns:
+        columns[column] = np.array([finbert_of(text) for text in raw[column]], dtype=float)
+    for column in vader_columns:
+        columns[column] = np.array([vader_of(text) for text in raw[column]], dtype=float)
+    return columns
+
+
+def extract_features(startups: Sequence[dict], context=None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Flatten startups into (features, founders) tables.
+
+    features has one row per startup (same order as the input) and an
+    "error" column for records the evaluator cannot score; founders has one
+    row per founder keyed by the startup's row number and the founder's
+    position in the deck.
+    """
+    from evaluator_final import get_evaluation_context
+
+    context = context or get_evaluation_context()
+    lookups = _Lookups(context.reference)
+    vader_available = context.vader.initialized
+
+    text_columns = list(FINBERT_COLUMNS) + list(VADER_COLUMNS) + list(VADER_FIRST_COLUMNS)
+    raw = {column: [] for column in text_columns}
+    rows, founder_rows, errors = [], [], []
+
+    for index, data in enumerate(startups):
+        texts = {}
+        try:
+            row, founders = _extract_record(data, lookups, vader_available, texts)
+            errors.append(None)
+        except Exception as e:
+            row, founders, texts = {}, [], {}
+            errors.append(f"{type(e).__name__}: {e}")
+        rows.append(row)
+        for founder in founders:
+            founder["startup"] = index
+            founder_rows.append(founder)
+        for column in text_columns:
+            raw[column].append(texts.get(column))
+
+    features = pd.DataFrame.from_records(rows, index=pd.RangeIndex(len(rows)))
+    for column, values in _score_texts(raw, context).items():
+        features[column] = values
+    features["error"] = errors
+
+    founders = pd.DataFrame.from_records(
+        founder_rows,
+        columns=["startup", "position", "background_match", "university_match", "degree_match",
+                 "network_strength", "age", "has_employments", "employment_years",
+                 "premium_employer", "linkedin_posts"]
+    )
+    return features, founders
+
+
+# ---------------------------------------------------------------------------
+# Scoring (array operations over the feature columns)
+# ---------------------------------------------------------------------------
+
+def _column(features: pd.DataFrame, name: str, default=np.nan) -> np.ndarray:
+    if name not in features:
+        return np.full(len(features), default, dtype=float)
+    return features[name].to_numpy(dtype=float, na_value=np.nan)
+
+
+def _convert_to_score(values: np.ndarray, min_val, max_val, default) -> np.ndarray:
+    scores = np.clip(((values - min_val) / (max_val - min_val)) * 100, 0, 100)
+    return np.where(np.isnan(values), default, scores)
+
+
+def _sentiment_score(sentiment: np.ndarray, default) -> np.ndarray:
+    return np.where(np.isnan(sentiment), default, sentiment * 100)
+
+
+def _founder_scores(founders: pd.DataFrame) -> Dict[str, np.ndarray]:
+    network = founders["network_strength"].to_numpy(dtype=float)
+    age = founders["age"].to_numpy(dtype=float)
+    years = founders["employment_years"].to_numpy(dtype=float)
+    premium = founders["premium_employer"].to_numpy(dtype=bool)
+
+    age_score = np.select(
+        [(age >= 25) & (age <= 35), (age > 35) & (age <= 45), (age > 45) & (age <= 55), (age >= 20) & (age < 25)],
+        [100, 90, 80, 70],
+        60
+    )
+    employment_score = np.select(
+        [years >= 10, years >= 5],
+        [np.where(premium, 100, 95), np.where(premium, 90, 80)],
+        np.where(premium, 75, 65)
+    )
+    return {
+        "background": np.where(founders["background_match"].to_numpy(dtype=bool), 95, 60),
+        "university": np.where(founders["university_match"].to_numpy(dtype=bool), 95, 60),
+        "degree": np.where(founders["degree_match"].to_numpy(dtype=bool), 95, 60),
+        "network": _convert_to_score(network, 0, 1000, 50),
+        "age": np.where(np.isnan(age), 60, age_score),
+        "employment": np.where(founders["has_employments"].to_numpy(dtype=bool), employment_score, 60),
+        "posts": _convert_to_score(founders["linkedin_posts"].to_numpy(dtype=float), 0, 20, 50),
+    }
+
+
+def score_team(features: pd.DataFrame, founders: pd.DataFrame) -> np.ndarray:
+    count = _column(features, "founder_count", 0)
+    team_score = np.select([count == 0, count == 1, count <= 3], [0, 65, 100], 80).astype(float)
+
+    if len(founders):
+        # Lay sub-scores out as (startup, position) grids and add them founder by
+        # founder, field by field, like the per-dict loop does
+        startup = founders["startup"].to_numpy()
+        position = founders["position"].to_numpy()
+        width = int(position.max()) + 1
+        grids = []
+        for name, values in _founder_scores(founders).items():
+            grid = np.zeros((len(features), width))
+            grid[startup, position] = values
+            grids.append(grid)
+        for k in range(width):
+            for grid in grids:
+                team_score += grid[:, k]
+
+    factors = 1 + len(FOUNDER_SCORE_COLUMNS) * count
+    final_score = np.round(team_score / factors)
+    return np.where(count >= 2, np.minimum(100, final_score + 5), final_score)
+
+
+def score_market(features: pd.DataFrame) -> np.ndarray:
+    tam = _column(features, "tam_value")
+    unit = _column(features, "tam_unit", 0)
+    tam_score = _convert_to_score(tam, 0, 100, 60)
+    tam_score = np.select([unit == 1, unit == 2], [np.minimum(100, tam_score * 1.8), tam_score * 0.9], tam_score)
+    tam_score = np.where(np.isnan(tam), 60, tam_score)
+
+    growth = _column(features, "growth_rate")
+    growth_score = _convert_to_score(growth, 0, 20, 60)
+    growth_score = np.where(growth > 10, np.minimum(100, growth_score * 1.5), growth_score)
+
+    return np.round((tam_score + growth_score * 1.5) / MARKET_FACTORS)
+
+
+def score_product(features: pd.DataFrame) -> np.ndarray:
+    stage = _column(features, "product_stage_score")
+    stage_score = np.where(stage > 70, np.minimum(100, stage + 5), stage)
+    stage_score = np.where(np.isnan(stage), 60, stage_score)
+
+    product_score = stage_score * 1.2
+    product_score = product_score + _sentiment_score(_column(features, "usp_finbert"), 60)
+    product_score = product_score + _sentiment_score(_column(features, "acquisition_finbert"), 60)
+    return np.round(product_score / PRODUCT_FACTORS)
+
+
+def score_traction(features: pd.DataFrame) -> np.ndarray:
+    growth_score = _sentiment_score(_column(features, "user_growth_finbert"), 60)
+    growth_score = np.where(growth_score > 70, np.minimum(100, growth_score + 10), growth_score)
+    engagement_score = _sentiment_score(_column(features, "engagement_sentiment"), 60)
+    churn = _column(features, "churn_sentiment")
+    churn_score = np.where(np.isnan(churn), 50, 100 - (churn * 100))
+
+    nps_finbert = _column(features, "nps_finbert")
+    nps_vader = _column(features, "nps_vader")
+    nps_score = np.where(np.isnan(nps_vader), nps_finbert * 100, (nps_vader * 100 + nps_finbert * 100) / 2)
+    nps_score = np.where(np.isnan(nps_finbert), 50, nps_score)
+
+    trend = _column(features, "google_trend_score", 0)
+    trend_quality = 50 + (trend / 2)
+    trend_quality = np.where(trend > 50, np.minimum(100, trend_quality + 10), trend_quality)
+    trend_quality = np.select([trend == 100, trend > 0], [100, trend_quality], 50)
+
+    traction_score = growth_score * 1.3
+    for score in (engagement_score, churn_score, nps_score, trend_quality * 1.2):
+        traction_score = traction_score + score
+    return np.round(traction_score / TRACTION_FACTORS)
+
+
+def score_funding(features: pd.DataFrame) -> np.ndarray:
+    stage = _column(features, "funding_stage_score")
+    stage_score = np.where(np.isnan(stage), 50, stage)
+
+    amount = _column(features, "amount_value")
+    unit = _column(features, "amount_unit", 0)
+    amount_score = _convert_to_score(amount, 0, 50, 50)
+    amount_score = np.select([unit == 1, unit == 2], [100, np.minimum(100, amount_score * 1.5)], amount_score)
+    amount_score = np.where(np.isnan(amount), 50, amount_score)
+
+    cap_finbert = _column(features, "cap_table_finbert")
+    cap_vader = _column(features, "cap_table_vader")
+    cap_score = np.where(np.isnan(cap_vader), cap_finbert * 100, (cap_vader * 100 + cap_finbert * 100) / 2)
+    cap_score = np.where(np.isnan(cap_finbert), 50, cap_score)
+
+    count = _column(features, "investor_count", 0)
+    ranking = _column(features, "investor_ranking", 0)
+    fortune = _column(features, "fortune500_investors", 0)
+    investor_score = np.select(
+        [fortune > 0, ranking > 0, count > 2, count > 0],
+        [90 + np.minimum(10, fortune), np.minimum(100, 50 + (ranking / 10)), 70, 60],
+        50
+    )
+
+    funding_score = stage_score + amount_score
+    funding_score = funding_score + cap_score
+    funding_score = funding_score + investor_score
+    return np.round(funding_score / 4)
+
+
+def score_financial_efficiency(features: pd.DataFrame) -> np.ndarray:
+    financial_score = np.zeros(len(features))
+    for column in ("burn_rate_finbert", "cac_ltv_finbert", "unit_economics_finbert"):
+        sentiment = _column(features, column)
+        financial_score = financial_score + np.where(np.isnan(sentiment), 50, np.minimum(90, (sentiment * 100) * 0.9))
+    return np.round(financial_score / 3)
+
+
+def score_miscellaneous(features: pd.DataFrame) -> np.ndarray:
+    geo = _column(features, "geo_score")
+    timing = _column(features, "timing_finbert")
+    geo_score = np.where(np.isnan(geo), 50, geo)
+    timing_score = np.where(np.isnan(timing), 50, 100 - (timing * 100))
+    return np.round((geo_score + timing_score) / 2)
+
+
+def score_unicorn(scores: Dict[str, np.ndarray]) -> np.ndarray:
+    weighted_sum = np.zeros(len(next(iter(scores.values()))))
+    for key, weight in UNICORN_WEIGHTS:
+        weighted_sum = weighted_sum + scores[key] * weight
+    weighted_sum = np.where(weighted_sum > 60, weighted_sum + (weighted_sum - 60) * 0.15, weighted_sum)
+    return np.round(weighted_sum)
+
+
+def score_features(features: pd.DataFrame, founders: pd.DataFrame) -> pd.DataFrame:
+    """All category scores and the UnicornScore for every row of the feature table."""
+    scores = {
+        "Team": score_team(features, founders),
+        "Market": score_market(features),
+        "Product": score_product(features),
+        "Traction": score_traction(features),
+        "Funding": score_funding(features),
+        "Financial Efficiency": score_financial_efficiency(features),
+        "Miscellaneous": score_miscellaneous(features),
+    }
+    scores["UnicornScore"] = score_unicorn(scores)
+
+    failed = features["error"].notna().to_numpy() if "error" in features else np.zeros(len(features), bool)
+    result = pd.DataFrame(index=features.index)
+    for column in METRIC_COLUMNS:
+        result[column] = pd.array(np.where(failed, np.nan, scores[column]), dtype="Int64")
+    result["error"] = features["error"] if "error" in features else None
+    return result
+
+
+def evaluate_columnar(startups: Sequence[dict], context=None) -> pd.DataFrame:
+    """Score many startup dicts at once; one row per startup, in input order."""
+    features, founders = extract_features(startups, context)
+    return score_features(features, founders)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic batches and the command line
+# ---------------------------------------------------------------------------
+
+def load_startups(paths: Sequence[str]) -> Tuple[List[str], List[dict]]:
+    files = collect_files(paths)
+    startups = []
+    for path in files:
+        with open(path, "r") as f:
+            startups.append(json.load(f))
+    return files, startups
+
+
+def synthetic_startups(n: int, seed: int = 0, corpus: Sequence[dict] = None) -> List[dict]:
+    """
+    n startups assembled from random sections of real decks, with the numeric
+    founder and traction fields re-drawn so rows are not copies of each other.
+    """
+    if corpus is None:
+        _, corpus = load_startups([os.path.join(BACKEND_DIR, d) for d in CORPUS_DIRS])
+    sections = {}
+    for key in ("team", "market", "product", "traction", "funding", "financial_efficiency", "miscellaneous"):
+        sections[key] = [data[key] for data in corpus if isinstance(data.get(key), dict)]
+
+    rng = np.random.default_rng(seed)
+    startups = []
+    for _ in range(n):
+        startup = {key: values[rng.integers(len(values))] for key, values in sections.items()}
+        founders = []
+        for founder in startup["team"].get("founders", []):
+            founder = dict(founder)
+            founder["age"] = int(rng.integers(19, 65))
+            founder["network_strength"] = int(rng.integers(0, 1500))
+            founders.append(founder)
+        startup["team"] = dict(startup["team"], founders=founders)
+        startup["traction"] = dict(startup["traction"], google_trend_score=int(rng.integers(0, 101)))
+        startups.append(startup)
+    return startups
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score many startups with the columnar evaluator")
+    parser.add_argument("paths", nargs="*", help="JSON files or directories of JSON files")
+    parser.add_argument("-o", "--output", help="Write scores to this CSV file")
+    parser.add_argument("--synthetic", type=int, default=0, help="Score N synthetic startups instead")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        names = [f"synthetic-{i}" for i in range(args.synthetic)]
+        startups = synthetic_startups(args.synthetic, args.seed)
+    else:
+        names, startups = load_startups(args.paths or [os.path.join(BACKEND_DIR, d) for d in CORPUS_DIRS])
+
+    from evaluator_final import get_evaluation_context
+    context = get_evaluation_context()
+
+    start = time.perf_counter()
+    features, founders = extract_features(startups, context)
+    extracted = time.perf_counter()
+    scores = score_features(features, founders)
+    done = time.perf_counter()
+
+    scores.insert(0, "file", names)
+    print(f"✅ Scored {len(scores)} startups ({scores['error'].notna().sum()} errors) in "
+          f"{done - start:.2f}s — extraction {extracted - start:.2f}s, scoring {done - extracted:.3f}s")
+    if args.output:
+        scores.to_csv(args.output, index=False)
+        print(f"Scores written to {args.output}")
+    else:
+        print(scores.head(10).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+# evaluation_module/services/finbert_backends.py
+"""
+CPU inference backends for the FinBERT sentiment model.
+
+- "torch":     the full-precision PyTorch model (default)
+- "quantized": the same model with its Linear layers dynamically quantized to int8
+- "onnx":      an exported ONNX graph run with onnxruntime on the CPU
+
+The ONNX backend is optional and needs `pip install onnxruntime onnx`.
+Select a backend with FINBERT_BACKEND; scores are cached per backend.
+
+Run from the q-hack-backend directory:
+    python -m evaluation_module.services.finbert_backends export
+    python -m evaluation_module.services.finbert_backends parity --backend quantized
+    python -m evaluation_module.services.finbert_backends benchmark
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+from ..config import EvaluationConfig
+
+BACKENDS = ("torch", "quantized", "onnx")
+ONNX_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def quantize_model(model):
+    """Dynamically quantize the Linear layers of a PyTorch model to int8."""
+    import torch
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxClassifier:
+    """Runs an exported sequence-classification graph like a transformers model."""
+
+    def __init__(self, path: str):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+        with open(path + ".json", "r") as f:
+            self.metadata = json.load(f)
+
+    def __call__(self, **inputs):
+        import torch
+        feed = {name: inputs[name].numpy() for name in self.input_names}
+        logits = self.session.run(["logits"], feed)[0]
+        return SimpleNamespace(logits=torch.from_numpy(logits))
+
+
+def export_onnx(model_name: str, path: str) -> Dict[str, str]:
+    """Export the PyTorch checkpoint to an ONNX graph with dynamic batch and length."""
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    sample = tokenizer(["Revenue grew strongly", "Burn rate is high"], return_tensors="pt", padding=True)
+    input_names = [name for name in ONNX_INPUTS if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+            dynamo=False,
+        )
+
+    metadata = {
+        "model": model_name,
+        "revision": getattr(model.config, "_commit_hash", None) or "local",
+        "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(path + ".json", "w") as f:
+        json.dump(metadata, f, indent=2)
+    return metadata
+
+
+def _corpus_texts() -> List[str]:
+    """Every FinBERT-bound text in the bundled startup JSONs."""
+    import glob
+    from evaluator_final import FINBERT_FIELDS, VADER_FIRST_FIELDS, _get_field
+    from ..config import BACKEND_DIR
+
+    texts = []
+    for directory in ("Jsons", "JSONS_NEW", "PreviouslyCalculatedSlidedecks"):
+        for path in sorted(glob.glob(os.path.join(BACKEND_DIR, directory, "*.json"))):
+            with open(path, "r") as f:
+                data = json.load(f)
+            for field in FINBERT_FIELDS + VADER_FIRST_FIELDS:
+                text = _get_field(data, field)
+                if text and isinstance(text, str) and text not in texts:
+                    texts.append(text)
+    return texts
+
+
+def _rss_mb() -> float:
+    """Current resident set size of this process in MB (Linux), else peak RSS."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _load(backend: str):
+    from evaluator_final import FinBERT
+    start = time.perf_counter()
+    model = FinBERT(backend=backend)
+    if not model.initialized or model.backend != backend:
+        raise RuntimeError(f"FinBERT backend {backend!r} could not be loaded")
+    return model, time.perf_counter() - start
+
+
+def run_parity(backend: str, tolerance: float) -> Dict[str, float]:
+    """Score the corpus with fp32 and with the given backend and compare."""
+    texts = _corpus_texts()
+    reference, _ = _load("torch")
+    candidate, _ = _load(backend)
+    expected = reference.sentiment_batch(texts, use_cache=False)
+    actual = candidate.sentiment_batch(texts, use_cache=False)
+
+    diffs = [abs(a - b) for a, b in zip(expected, actual)]
+    report = {
+        "backend": backend,
+        "texts": len(texts),
+        "max_abs_diff": round(max(diffs), 5) if diffs else 0.0,
+        "mean_abs_diff": round(sum(diffs) / len(diffs), 5) if diffs else 0.0,
+        "tolerance": tolerance,
+    }
+    report["passed"] = report["max_abs_diff"] <= tolerance
+    return report
+
+
+def run_benchmark_backend(backend: str, repeat: int) -> Dict[str, float]:
+    """Load one backend in this process and measure load time, RSS and throughput."""
+    texts = _corpus_texts()
+    rss_before = _rss_mb()
+    model, load_seconds = _load(backend)
+    model.sentiment_batch(texts[:4], use_cache=False)  # warm-up
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        model.sentiment_batch(texts, use_cache=False)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "backend": backend,
+        "load_seconds": round(load_seconds, 3),
+        "rss_mb": round(_rss_mb() - rss_before, 1),
+        "texts_per_second": round(len(texts) * repeat / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FinBERT CPU backends")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="Export the checkpoint to ONNX")
+    export.add_argument("--output", default=EvaluationConfig.FINBERT_ONNX_PATH)
+
+    parity = sub.add_parser("parity", help="Compare a backend's scores with fp32")
+    parity.add_argument("--backend", choices=BACKENDS[1:], default="quantized")
+    parity.add_argument("--tolerance", type=float, default=0.05)
+
+    bench = sub.add_parser("benchmark", help="Compare load time, RSS and throughput")
+    bench.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    bench.add_argument("--repeat", type=int, default=3)
+    bench.add_argument("--single", choices=BACKENDS, help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        metadata = export_onnx("ProsusAI/finbert", args.output)
+        print(f"Exported {metadata['model']}@{metadata['revision']} to {args.output}")
+        if args.output != EvaluationConfig.FINBERT_ONNX_PATH:
+            print(f"Set FINBERT_ONNX_PATH={args.output} to use it")
+
+    elif args.command == "parity":
+        report = run_parity(args.backend, args.tolerance)
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["passed"] else 1)
+
+    elif args.command == "benchmark":
+        if args.single:
+            print(json.dumps(run_benchmark_backend(args.single, args.repeat)))
+            return
+        # One subprocess per backend so load time and RSS are not shared
+        results = []
+        for backend in args.backends:
+            proc = subprocess.run(
+                [sys.executable, "-m", __spec__.name, "benchmark", "--single", backend,
+                 "--repeat", str(args.repeat)],
+                capture_output=True, text=True
+            )
+            if proc.returncode != 0:
+                print(f"{backend}: failed\n{proc.stderr.strip()[-500:]}")
+                continue
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+        print(f"{'backend':<10} {'load (s)':>9} {'RSS (MB)':>9} {'texts/s':>9}")
+        for r in results:
+            print(f"{r['backend']:<10} {r['load_seconds']:>9} {r['rss_mb']:>9} {r['texts_per_second']:>9}")
+
+
+if __name__ == "__main__":
+    main()
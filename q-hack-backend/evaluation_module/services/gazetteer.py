@@ -0,0 +1,100 @@
+# evaluation_module/services/gazetteer.py
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .keyword_matcher import KeywordMatcher
+
+# Trailing words that do not identify a company or investor on their own
+COMPANY_SUFFIXES = (
+    "inc", "incorporated", "corp", "corporation", "co", "company", "llc", "ltd",
+    "limited", "plc", "group", "holdings",
+)
+INVESTOR_SUFFIXES = COMPANY_SUFFIXES + (
+    "capital", "ventures", "venture partners", "partners", "management",
+    "investments", "fund", "vc",
+)
+
+# Shorter aliases ("a", "ge") are too ambiguous to stand for a full name
+MIN_ALIAS_LENGTH = 3
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase, turn '&' into 'and', drop punctuation and collapse spaces."""
+    text = str(text).lower().replace("&", " and ")
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def strip_suffixes(name: str, suffixes: Iterable[str]) -> str:
+    """Remove generic trailing words from a normalized name, keeping at least one word."""
+    suffixes = sorted(suffixes, key=len, reverse=True)
+    changed = True
+    while changed:
+        changed = False
+        for suffix in suffixes:
+            if name.endswith(" " + suffix):
+                name = name[:-len(suffix) - 1].rstrip()
+                changed = True
+                break
+    return name
+
+
+class Gazetteer:
+    """
+    Name lookup over a reference table.
+
+    Each entry has one or more names and a value. A lookup first tries the
+    normalized-name index and the alias index (names with generic suffixes such
+    as "Inc" or "Capital" removed), both constant-time dict hits. If neither
+    matches, it falls back to the substring semantics the evaluator always had:
+    the first entry, in table order, whose name is contained in the text. That
+    scan runs through a KeywordMatcher, so it costs one pass over the text
+    rather than one test per row.
+    """
+
+    def __init__(self, entries: Sequence[Tuple[Sequence[str], Any]], alias_suffixes: Iterable[str] = ()):
+        self.values = [value for _, value in entries]
+        self.name_index: Dict[str, int] = {}
+        self.alias_index: Dict[str, int] = {}
+
+        flat_names: List[str] = []
+        self._row_of: List[int] = []
+        for row, (names, _) in enumerate(entries):
+            for name in names:
+                flat_names.append(str(name).lower())
+                self._row_of.append(row)
+                self.name_index.setdefault(normalize_name(name), row)
+
+        alias_suffixes = tuple(alias_suffixes)
+        if alias_suffixes:
+            for row, (names, _) in enumerate(entries):
+                for name in names:
+                    alias = strip_suffixes(normalize_name(name), alias_suffixes)
+                    if len(alias) >= MIN_ALIAS_LENGTH and alias not in self.name_index:
+                        self.alias_index.setdefault(alias, row)
+
+        self.matcher = KeywordMatcher(flat_names)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def find(self, text: str) -> Optional[int]:
+        """Return the row index matching text, or None."""
+        if not isinstance(text, str) or not text:
+            return None
+        key = normalize_name(text)
+        row = self.name_index.get(key)
+        if row is None:
+            row = self.alias_index.get(key)
+        if row is None:
+            hit = self.matcher.first(text)
+            row = self._row_of[hit] if hit is not None else None
+        return row
+
+    def lookup(self, text: str, default: Any = None) -> Any:
+        """Return the value of the entry matching text, or default."""
+        row = self.find(text)
+        return self.values[row] if row is not None else default
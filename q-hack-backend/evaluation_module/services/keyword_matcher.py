@@ -0,0 +1,80 @@
+# evaluation_module/services/keyword_matcher.py
+from collections import deque
+from typing import Iterable, List, Optional
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed list of keywords.
+
+    The automaton is built once and then finds every keyword contained in a
+    text in a single pass, instead of running one substring test per keyword.
+    Matching is case-insensitive; keywords are reported by their index in the
+    original list so callers can keep "first row wins" semantics.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = [str(k).lower() for k in keywords]
+
+        # State 0 is the root; each state has transitions, a failure link and
+        # the keyword indices that end there (including via failure links).
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._always = []  # empty keywords match every text
+
+        for idx, keyword in enumerate(self.keywords):
+            if not keyword:
+                self._always.append(idx)
+                continue
+            state = 0
+            for char in keyword:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(idx)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find_all(self, text: str) -> List[int]:
+        """Return the sorted indices of all keywords contained in text."""
+        if not isinstance(text, str):
+            return []
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set(self._always)
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return sorted(found)
+
+    def first(self, text: str) -> Optional[int]:
+        """Return the lowest keyword index contained in text, or None."""
+        found = self.find_all(text)
+        return found[0] if found else None
+
+    def first_match(self, text: str) -> Optional[str]:
+        """Return the first keyword (in list order) contained in text, or None."""
+        idx = self.first(text)
+        return self.keywords[idx] if idx is not None else None
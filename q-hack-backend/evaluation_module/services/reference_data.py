@@ -0,0 +1,170 @@
+# evaluation_module/services/reference_data.py
+import csv
+import hashlib
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..config import EvaluationConfig
+from .gazetteer import COMPANY_SUFFIXES, INVESTOR_SUFFIXES, Gazetteer
+from .keyword_matcher import KeywordMatcher
+
+CSV_FILES = {
+    'countries': 'countries.csv',
+    'degrees': 'degrees.csv',
+    'fortune500': 'fortune500.csv',
+    'funding': 'funding.csv',
+    'hardest_companies': 'hardest_companies.csv',
+    'industries': 'industries.csv',
+    'investors': 'investors.csv',
+    'productstages': 'productstages.csv',
+    'universities': 'universities.csv'
+}
+
+
+def _read_csv(filepath: str) -> List[Dict[str, str]]:
+    """Read a ';'-separated CSV into a list of row dicts."""
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f, delimiter=';'))
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """Approximate the memory footprint of nested containers and plain objects."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += _deep_sizeof(vars(obj), seen)
+    return size
+
+
+class ReferenceData:
+    """
+    Lookup structures built once from the CSVs under resources/.
+
+    All names are lowercased at load time. Lists keep the CSV order because the
+    evaluator takes the first matching row; gazetteers index the same rows by
+    normalized name and alias for constant-time lookups.
+    """
+
+    def __init__(self, resources_dir: Optional[str] = None):
+        self.resources_dir = resources_dir or EvaluationConfig.RESOURCES_DIR
+
+        start = time.perf_counter()
+        rows = {}
+        digest = hashlib.sha256()
+        for key, filename in CSV_FILES.items():
+            filepath = os.path.join(self.resources_dir, filename)
+            try:
+                rows[key] = _read_csv(filepath)
+                with open(filepath, 'rb') as f:
+                    digest.update(filename.encode() + b'\0' + f.read())
+            except Exception as e:
+                print(f"Error loading {filename}: {e}")
+                rows[key] = []
+
+        self.row_counts = {key: len(value) for key, value in rows.items()}
+        # Content hash of the CSVs, so scores cached against this data can be invalidated
+        self.version = digest.hexdigest()[:12]
+
+        # Team: keyword lists scanned against founder text
+        self.industry_keywords = [r['keyword'].lower() for r in rows['industries']]
+        self.industry_keyword_set = frozenset(self.industry_keywords)
+        self.universities = [r['institution'].lower() for r in rows['universities']]
+        self.degrees = [r['full_name'].lower() for r in rows['degrees']]
+        self.hardest_companies = frozenset(r['company'].lower() for r in rows['hardest_companies'])
+        self.industry_matcher = KeywordMatcher(self.industry_keywords)
+        self.university_matcher = KeywordMatcher(self.universities)
+        self.degree_matcher = KeywordMatcher(self.degrees)
+
+        # Product: (stage, score) in CSV order
+        self.product_stages = [
+            (r['stage'].lower(), _to_float(r['score'])) for r in rows['productstages']
+        ]
+        self.product_stage_gazetteer = Gazetteer(
+            [((stage,), score) for stage, score in self.product_stages]
+        )
+
+        # Funding: score falls back to stage_level * 20 when missing
+        self.funding_stages = []
+        for r in rows['funding']:
+            score = _to_float(r.get('score'))
+            if score is None:
+                score = float(r['stage_level']) * 20
+            self.funding_stages.append((r['stage'].lower(), score))
+        self.funding_stage_gazetteer = Gazetteer(
+            [((stage,), score) for stage, score in self.funding_stages]
+        )
+
+        # Investors sorted by rank, and Fortune 500 names
+        self.investors = sorted(
+            ((r['investor_name'].lower(), int(r['investor_rank'])) for r in rows['investors']),
+            key=lambda item: item[1]
+        )
+        self.investor_gazetteer = Gazetteer(
+            [((name,), rank) for name, rank in self.investors], INVESTOR_SUFFIXES
+        )
+        self.fortune500 = [r['name'].lower() for r in rows['fortune500']]
+        self.fortune500_gazetteer = Gazetteer(
+            [((r['name'],), int(r['rank'])) for r in rows['fortune500']], COMPANY_SUFFIXES
+        )
+
+        # Countries: (short name, long name, geo score), indexed by both names
+        self.countries = []
+        for r in rows['countries']:
+            corruption = _to_float(r.get('corruption_score'))
+            self.countries.append((
+                r['country_name'].lower(),
+                r['country_long_name'].lower(),
+                corruption if corruption is not None else 50
+            ))
+        self.country_gazetteer = Gazetteer(
+            [((name, long_name), score) for name, long_name, score in self.countries]
+        )
+
+        self.load_seconds = time.perf_counter() - start
+        self.memory_bytes = _deep_sizeof(
+            {k: v for k, v in vars(self).items() if k not in ('load_seconds', 'resources_dir')}
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Load time, memory footprint and row counts for monitoring."""
+        return {
+            "resources_dir": self.resources_dir,
+            "version": self.version,
+            "load_seconds": round(self.load_seconds, 4),
+            "memory_bytes": self.memory_bytes,
+            "rows": dict(self.row_counts),
+        }
+
+
+_lock = threading.Lock()
+
+
+def get_reference_data() -> ReferenceData:
+    """Return the process-wide reference data, loading it on first use."""
+    if not hasattr(get_reference_data, "instance"):
+        with _lock:
+            if not hasattr(get_reference_data, "instance"):
+                get_reference_data.instance = ReferenceData()
+                stats = get_reference_data.instance.stats()
+                print(f"Reference data loaded in {stats['load_seconds']}s "
+                      f"({stats['memory_bytes'] / 1024:.0f} KiB)")
+    return get_reference_data.instance
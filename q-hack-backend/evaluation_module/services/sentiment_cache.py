@@ -0,0 +1,137 @@
+# evaluation_module/services/sentiment_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..config import EvaluationConfig
+
+
+class SentimentCache:
+    """
+    Content-addressed cache for sentiment scores.
+
+    Scores are keyed by a SHA-256 of (model, version, text). An in-memory LRU
+    bounded to max_entries sits in front of a SQLite file that survives
+    restarts, so boilerplate text is scored once per model version. Pass
+    path=None to keep the cache in memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS sentiment (key TEXT PRIMARY KEY, score REAL NOT NULL)"
+                )
+                self._db.commit()
+            except Exception as e:
+                print(f"Sentiment cache disk store unavailable ({path}): {e}")
+                self._db = None
+
+    @staticmethod
+    def make_key(model: str, version: str, text: str) -> str:
+        payload = "\x1f".join((model, version, text)).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _remember(self, key: str, score: float):
+        self._memory[key] = score
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, model: str, version: str, texts: Iterable[str]) -> Dict[str, float]:
+        """Return {text: score} for the texts that are cached."""
+        keys = {self.make_key(model, version, text): text for text in texts}
+        found = {}
+        with self._lock:
+            missing = []
+            for key, text in keys.items():
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[text] = self._memory[key]
+                    self.memory_hits += 1
+                else:
+                    missing.append(key)
+
+            if missing and self._db is not None:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    rows = self._db.execute(
+                        f"SELECT key, score FROM sentiment WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    for key, score in rows:
+                        found[keys[key]] = score
+                        self._remember(key, score)
+                        self.disk_hits += 1
+
+            self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, model: str, version: str, text: str) -> Optional[float]:
+        return self.get_many(model, version, [text]).get(text)
+
+    def put_many(self, model: str, version: str, items: Iterable[Tuple[str, float]]):
+        rows: List[Tuple[str, float]] = [
+            (self.make_key(model, version, text), float(score)) for text, score in items
+        ]
+        with self._lock:
+            for key, score in rows:
+                self._remember(key, score)
+            if rows and self._db is not None:
+                try:
+                    self._db.executemany("INSERT OR REPLACE INTO sentiment VALUES (?, ?)", rows)
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    print(f"Error writing sentiment cache: {e}")
+
+    def put(self, model: str, version: str, text: str, score: float):
+        self.put_many(model, version, [(text, score)])
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current sizes."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            disk_entries = None
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM sentiment").fetchone()[0]
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": disk_entries,
+            }
+
+
+_lock = threading.Lock()
+
+
+def get_sentiment_cache() -> Optional[SentimentCache]:
+    """Return the process-wide sentiment cache, or None when it is disabled."""
+    if not EvaluationConfig.SENTIMENT_CACHE_ENABLED:
+        return None
+    if not hasattr(get_sentiment_cache, "instance"):
+        with _lock:
+            if not hasattr(get_sentiment_cache, "instance"):
+                get_sentiment_cache.instance = SentimentCache(
+                    EvaluationConfig.SENTIMENT_CACHE_PATH or None,
+                    EvaluationConfig.SENTIMENT_CACHE_MAX_ENTRIES
+                )
+    return get_sentiment_cache.instance
@@ -0,0 +1,179 @@
+# evaluation_module/services/sentiment_cascade.py
+"""
+Cascade sentiment scoring: VADER first, FinBERT only when it matters.
+
+Every FinBERT-bound text is scored with VADER. A text is escalated to FinBERT
+when its VADER compound score falls inside the uncertainty band
+(SENTIMENT_CASCADE_BAND_LOW..SENTIMENT_CASCADE_BAND_HIGH) or when it contains
+finance terms VADER has no sense of (burn, runway, dilution, ...). Texts that
+are not escalated keep their VADER score. Enable with SENTIMENT_CASCADE=true.
+
+Run from the q-hack-backend directory to compare against always-FinBERT:
+    python -m evaluation_module.services.sentiment_cascade
+    python -m evaluation_module.services.sentiment_cascade --band -0.3 0.3 --json
+"""
+import argparse
+import json
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..config import BACKEND_DIR, EvaluationConfig
+
+# Terms whose financial polarity VADER misreads or ignores
+FINANCE_TERMS = (
+    "arr", "mrr", "ebitda", "cac", "ltv", "burn", "burn rate", "runway", "margin", "margins",
+    "gross margin", "unit economics", "payback", "break-even", "breakeven", "cash flow",
+    "churn", "dilution", "dilutive", "down round", "bridge round", "valuation", "debt",
+    "liabilities", "liquidation", "preference", "convertible", "write-off", "loss", "losses",
+    "net loss", "default", "insolvency", "bankruptcy", "recession", "volatility", "headwinds",
+)
+
+
+class SentimentCascade:
+    """Routes texts to VADER or FinBERT and keeps escalation counts."""
+
+    def __init__(self, vader, band: Tuple[float, float] = None, terms: Iterable[str] = FINANCE_TERMS):
+        self.vader = vader
+        self.band = band or (EvaluationConfig.SENTIMENT_CASCADE_BAND_LOW, EvaluationConfig.SENTIMENT_CASCADE_BAND_HIGH)
+        self.terms = tuple(terms)
+        terms_pattern = "|".join(re.escape(term) for term in sorted(self.terms, key=len, reverse=True))
+        self.pattern = re.compile(rf"(?<![a-z0-9])(?:{terms_pattern})(?![a-z0-9])", re.IGNORECASE)
+        self.counts = {"texts": 0, "escalated": 0, "finance_terms": 0, "uncertain": 0}
+
+    @property
+    def version(self) -> str:
+        return f"cascade:{self.band[0]:g}..{self.band[1]:g}:{len(self.terms)}terms"
+
+    def reason(self, text: str, vader_score: float) -> Optional[str]:
+        """Why text needs FinBERT ("finance_terms" or "uncertain"), or None if VADER is enough."""
+        if self.pattern.search(text):
+            return "finance_terms"
+        compound = vader_score * 2 - 1  # VADERSentiment returns the compound score mapped to 0..1
+        if self.band[0] <= compound <= self.band[1]:
+            return "uncertain"
+        return None
+
+    def route(self, texts: List[str]) -> Tuple[Dict[str, float], List[str]]:
+        """Split texts into VADER scores for the confident ones and a list to escalate."""
+        vader_scores, escalated = {}, []
+        for text in texts:
+            score = self.vader.sentiment(text)
+            reason = self.reason(text, score)
+            self.counts["texts"] += 1
+            if reason is None:
+                vader_scores[text] = score
+            else:
+                escalated.append(text)
+                self.counts["escalated"] += 1
+                self.counts[reason] += 1
+        return vader_scores, escalated
+
+    def stats(self) -> Dict:
+        texts = self.counts["texts"]
+        return {**self.counts, "escalation_rate": round(self.counts["escalated"] / texts, 4) if texts else 0.0}
+
+
+# Get the process-wide cascade, or None when it is disabled (singleton pattern)
+def get_sentiment_cascade(vader) -> Optional[SentimentCascade]:
+    if not EvaluationConfig.SENTIMENT_CASCADE or not vader.initialized:
+        return None
+    if not hasattr(get_sentiment_cascade, "instance"):
+        get_sentiment_cascade.instance = SentimentCascade(vader)
+    return get_sentiment_cascade.instance
+
+
+def _drift(pairs: List[Tuple[float, float]]) -> Dict[str, float]:
+    diffs = sorted(abs(a - b) for a, b in pairs)
+    if not diffs:
+        return {"mean": 0.0, "p90": 0.0, "max": 0.0}
+    return {
+        "mean": round(sum(diffs) / len(diffs), 3),
+        "p90": round(diffs[min(len(diffs) - 1, int(0.9 * len(diffs)))], 3),
+        "max": round(diffs[-1], 3),
+    }
+
+
+def run_report(band: Tuple[float, float] = None) -> Dict:
+    """Score the corpus with the cascade and with always-FinBERT and compare."""
+    import evaluator_final as evaluator
+    from .finbert_backends import _corpus_texts
+    from .columnar import load_startups
+
+    vader = evaluator.get_vader_analyzer()
+    finbert = evaluator.get_finbert_model()
+    cascade = SentimentCascade(vader, band)
+
+    def finbert_batch(texts):
+        # Uncached, so both timings measure model work
+        if finbert is not None and finbert.initialized:
+            return finbert.sentiment_batch(texts, use_cache=False)
+        return evaluator.finbert_sentiment_batch(texts)
+
+    # Text level: cascade score vs FinBERT score, on the 0-100 scale the evaluator uses
+    texts = _corpus_texts()
+    start = time.perf_counter()
+    finbert_scores = dict(zip(texts, finbert_batch(texts)))
+    finbert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vader_scores, escalated = cascade.route(texts)
+    cascade_scores = dict(vader_scores)
+    cascade_scores.update(zip(escalated, finbert_batch(escalated)))
+    cascade_seconds = time.perf_counter() - start
+
+    # Deck level: every category score and the UnicornScore
+    always = evaluator.EvaluationContext(finbert=finbert, vader=vader, cascade=False)
+    tiered = evaluator.EvaluationContext(finbert=finbert, vader=vader, cascade=SentimentCascade(vader, band))
+    metric_pairs: Dict[str, List[Tuple[float, float]]] = {}
+    skipped = 0
+    _, decks = load_startups([os.path.join(BACKEND_DIR, d) for d in ("Jsons", "JSONS_NEW", "PreviouslyCalculatedSlidedecks")])
+    for data in decks:
+        try:
+            expected = evaluator.evaluate_data(data, always)
+            actual = evaluator.evaluate_data(data, tiered)
+        except Exception:
+            skipped += 1  # malformed deck, fails either way
+            continue
+        for metric, value in expected.items():
+            metric_pairs.setdefault(metric, []).append((value, actual[metric]))
+
+    return {
+        "finbert": finbert.version if finbert is not None and finbert.initialized else "fallback",
+        "band": list(cascade.band),
+        "texts": cascade.stats(),
+        "text_drift": _drift([(cascade_scores[t] * 100, finbert_scores[t] * 100) for t in texts]),
+        "seconds": {"always_finbert": round(finbert_seconds, 3), "cascade": round(cascade_seconds, 3)},
+        "decks": len(next(iter(metric_pairs.values()), [])),
+        "skipped_decks": skipped,
+        "score_drift": {metric: _drift(pairs) for metric, pairs in metric_pairs.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare cascade sentiment scoring with always-FinBERT")
+    parser.add_argument("--band", nargs=2, type=float, metavar=("LOW", "HIGH"),
+                        help="VADER compound range that is escalated to FinBERT")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run_report(tuple(args.band) if args.band else None)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    texts = report["texts"]
+    print(f"FinBERT: {report['finbert']}  band: {report['band'][0]:g}..{report['band'][1]:g}")
+    print(f"Texts: {texts['texts']}, escalated {texts['escalated']} ({texts['escalation_rate']:.1%}): "
+          f"{texts['finance_terms']} for finance terms, {texts['uncertain']} uncertain")
+    print(f"Inference: {report['seconds']['cascade']}s cascade vs {report['seconds']['always_finbert']}s always-FinBERT")
+    drift = report["text_drift"]
+    print(f"Text score drift (0-100): mean {drift['mean']}, p90 {drift['p90']}, max {drift['max']}")
+    print(f"\n{'metric':<22} {'mean':>7} {'p90':>7} {'max':>7}   ({report['decks']} decks)")
+    for metric, drift in report["score_drift"].items():
+        print(f"{metric:<22} {drift['mean']:>7} {drift['p90']:>7} {drift['max']:>7}")
+
+
+if __name__ == "__main__":
+    main()
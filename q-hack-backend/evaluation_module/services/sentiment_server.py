@@ -0,0 +1,266 @@
+# evaluation_module/services/sentiment_server.py
+"""
+Shared FinBERT inference over a Unix socket.
+
+One server process holds the model; uvicorn workers and evaluation processes
+send their texts to it instead of loading their own copy. Requests from all
+clients are gathered into micro-batches of up to SENTIMENT_SERVER_MAX_BATCH
+texts, waiting at most SENTIMENT_SERVER_MAX_WAIT_MS for more to arrive.
+
+The protocol is one JSON object per line:
+    {"texts": [...], "use_cache": true}  ->  {"scores": [...]}
+    {"info": true}                       ->  {"name": ..., "version": ..., "initialized": ...}
+    {"stats": true}                      ->  {"requests": ..., "batches": ..., ...}
+
+When the socket exists, finbert_sentiment uses SentimentClient transparently;
+if the server stops answering, the client scores with FinBERT in-process and
+tries the server again after SENTIMENT_SERVER_RETRY_SECONDS.
+
+Run from the q-hack-backend directory:
+    python -m evaluation_module.services.sentiment_server
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from ..config import EvaluationConfig
+
+LINE_LIMIT = 16 * 1024 * 1024  # longest request line, in bytes
+
+
+class _Request(NamedTuple):
+    texts: List
+    use_cache: bool
+    future: asyncio.Future
+
+
+class SentimentServer:
+    """Serves one FinBERT model to many processes with dynamic micro-batching."""
+
+    def __init__(self, model, path: str, max_batch: int = None, max_wait_ms: float = None):
+        self.model = model
+        self.path = path
+        self.max_batch = max_batch or EvaluationConfig.SENTIMENT_SERVER_MAX_BATCH
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else EvaluationConfig.SENTIMENT_SERVER_MAX_WAIT_MS) / 1000
+        # One inference at a time; the next batch fills up while it runs
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="finbert")
+        self.counts = {"requests": 0, "batches": 0, "texts": 0, "inference_seconds": 0.0}
+
+    async def serve(self):
+        self.queue = asyncio.Queue()
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # stale socket from a previous run
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        server = await asyncio.start_unix_server(self._handle, path=self.path, limit=LINE_LIMIT)
+        batcher = asyncio.ensure_future(self._batcher())
+        print(f"✅ Sentiment server ({self.model.version}) listening on {self.path} "
+              f"(max batch {self.max_batch}, max wait {self.max_wait * 1000:g} ms)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    response = await self._respond(message)
+                except Exception as e:
+                    response = {"error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, message: Dict) -> Dict:
+        if message.get("info"):
+            return {"name": self.model.name, "version": self.model.version, "initialized": self.model.initialized}
+        if message.get("stats"):
+            return self.stats()
+
+        texts = message["texts"]
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait(_Request(texts, message.get("use_cache", True), future))
+        self.counts["requests"] += 1
+        return {"scores": await future}
+
+    async def _batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self.queue.get()]
+            size = len(pending[0].texts)
+            deadline = loop.time() + self.max_wait
+
+            # Gather more requests until the batch is full or the wait is over
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(request)
+                size += len(request.texts)
+
+            texts = list(dict.fromkeys(text for request in pending for text in request.texts
+                                       if isinstance(text, str)))
+            use_cache = all(request.use_cache for request in pending)
+            start = time.perf_counter()
+            try:
+                scores = await loop.run_in_executor(
+                    self.executor, lambda: self.model.sentiment_batch(texts, use_cache=use_cache)
+                )
+                by_text = dict(zip(texts, scores))
+                for request in pending:
+                    if not request.future.done():
+                        # Non-text items (possibly unhashable) score neutral, as in the evaluator
+                        request.future.set_result([by_text.get(text, 0.5) if isinstance(text, str) else 0.5
+                                                   for text in request.texts])
+            except Exception as e:
+                for request in pending:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+            self.counts["batches"] += 1
+            self.counts["texts"] += len(texts)
+            self.counts["inference_seconds"] += time.perf_counter() - start
+
+    def stats(self) -> Dict:
+        batches = self.counts["batches"]
+        return {
+            **self.counts,
+            "inference_seconds": round(self.counts["inference_seconds"], 3),
+            "mean_batch_size": round(self.counts["texts"] / batches, 2) if batches else 0.0,
+            "queued": self.queue.qsize(),
+        }
+
+
+class SentimentClient:
+    """Scores texts through the sentiment server; used like the in-process FinBERT model.
+
+    If a request fails, that batch is scored with the model from `fallback`,
+    loaded in this process on first need, and the server is tried again after
+    a cooldown. Once the server answers again the local copy is released.
+    """
+    name = "ProsusAI/finbert"
+
+    def __init__(self, path: str, fallback: Callable, timeout: float = None, retry_seconds: float = None):
+        self.path = path
+        self.fallback = fallback
+        self.timeout = timeout or EvaluationConfig.SENTIMENT_SERVER_TIMEOUT
+        self.retry_seconds = (retry_seconds if retry_seconds is not None
+                              else EvaluationConfig.SENTIMENT_SERVER_RETRY_SECONDS)
+        self.local = None
+        self._retry_at = 0.0  # monotonic time before which the server is not tried
+        self._lock = threading.Lock()
+
+        info = self._call({"info": True})
+        if not info.get("initialized"):
+            raise RuntimeError("sentiment server has no model loaded")
+        self.name = info["name"]
+        self.server_version = info["version"]
+
+    @property
+    def _server_down(self) -> bool:
+        return time.monotonic() < self._retry_at
+
+    @property
+    def initialized(self) -> bool:
+        return self.local.initialized if self._server_down and self.local is not None else True
+
+    @property
+    def version(self) -> str:
+        return self.local.version if self._server_down and self.local is not None else self.server_version
+
+    def _call(self, message: Dict) -> Dict:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline(LINE_LIMIT)
+        if not line:
+            raise ConnectionError("sentiment server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response
+
+    def _local_model(self):
+        with self._lock:
+            if self.local is None:
+                self.local = self.fallback()
+        return self.local
+
+    def sentiment(self, text):
+        return self.sentiment_batch([text])[0]
+
+    def sentiment_batch(self, texts, batch_size=None, use_cache=True):
+        if not self._server_down:
+            try:
+                scores = self._call({"texts": list(texts), "use_cache": use_cache})["scores"]
+                if self.local is not None:
+                    print("✅ Sentiment server is back, releasing in-process FinBERT")
+                    self.local = None
+                return scores
+            except (OSError, ValueError, RuntimeError) as e:
+                self._retry_at = time.monotonic() + self.retry_seconds
+                print(f"⚠️ Sentiment server unavailable ({e}), scoring in-process; "
+                      f"retrying the server in {self.retry_seconds:g}s")
+        return self._local_model().sentiment_batch(texts, batch_size=batch_size, use_cache=use_cache)
+
+    def stats(self) -> Dict:
+        return self._call({"stats": True})
+
+
+def connect(fallback: Callable, path: str = None) -> Optional[SentimentClient]:
+    """A client for the sentiment server at path, or None when no server is listening."""
+    path = EvaluationConfig.SENTIMENT_SERVER_SOCKET if path is None else path
+    if not path or not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    try:
+        return SentimentClient(path, fallback)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"⚠️ Sentiment server at {path} not usable ({e}), using in-process FinBERT")
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve FinBERT to local processes over a Unix socket")
+    parser.add_argument("--socket", default=EvaluationConfig.SENTIMENT_SERVER_SOCKET)
+    parser.add_argument("--max-batch", type=int, default=EvaluationConfig.SENTIMENT_SERVER_MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=EvaluationConfig.SENTIMENT_SERVER_MAX_WAIT_MS)
+    args = parser.parse_args(argv)
+
+    from evaluator_final import FinBERT
+
+    model = FinBERT()
+    if not model.initialized:
+        raise SystemExit("FinBERT could not be loaded; not starting the sentiment server")
+
+    server = SentimentServer(model, args.socket, args.max_batch, args.max_wait_ms)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        print(f"Sentiment server stopped: {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
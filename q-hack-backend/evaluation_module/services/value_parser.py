@@ -0,0 +1,179 @@
+# evaluation_module/services/value_parser.py
+"""
+Unit-aware parsing of money and percentage strings from pitch decks.
+
+Turns text such as "$1.2B", "€850M with 12% CAGR", "$5-10M", "50k EUR per
+month" or "1,200,000" into ParsedValue tuples with a normalized amount,
+currency and period. Results are memoized per string, so the evaluator, the
+chat direct answers and the email response processor parse each value of a
+deck once.
+"""
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "₹": "INR"}
+CURRENCY_CODES = ("USD", "EUR", "GBP", "JPY", "INR", "CHF", "CAD", "AUD", "CNY", "SEK")
+CURRENCY_PREFIXES = {code: symbol for symbol, code in CURRENCY_SYMBOLS.items()}
+
+SCALES = {
+    "k": 1e3, "thousand": 1e3,
+    "m": 1e6, "mm": 1e6, "mn": 1e6, "mio": 1e6, "million": 1e6,
+    "b": 1e9, "bn": 1e9, "billion": 1e9,
+    "t": 1e12, "tn": 1e12, "trillion": 1e12,
+}
+PERIODS = {
+    "week": "week", "wk": "week", "weekly": "week",
+    "mo": "month", "month": "month", "monthly": "month", "mom": "month",
+    "quarter": "quarter", "qtr": "quarter", "quarterly": "quarter",
+    "yr": "year", "year": "year", "annum": "year", "annually": "year", "yearly": "year",
+    "pa": "year", "yoy": "year",
+}
+PERIODS_PER_YEAR = {"week": 52, "month": 12, "quarter": 4, "year": 1}
+
+_SYMBOL = "[" + re.escape("".join(CURRENCY_SYMBOLS)) + "]"
+_CODE = "(?:" + "|".join(CURRENCY_CODES) + r")\b"
+_NUMBER = r"(?<![\w.])(?:\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d*\.?\d+)"
+_SCALE = r"(?:trillion|billion|million|thousand|mio|bn|tn|mm|mn|[kmbt])(?![a-z0-9])"
+
+VALUE_PATTERN = re.compile(rf"""
+    (?P<sign>[+-])?
+    (?:(?P<currency>{_SYMBOL})\s*|(?P<code>{_CODE})\s*)?
+    (?P<low>{_NUMBER})\s*(?P<low_scale>{_SCALE})?
+    (?:\s*(?:-|–|—|to)\s*{_SYMBOL}?\s*(?P<high>{_NUMBER})\s*(?P<high_scale>{_SCALE})?)?
+    \s*(?P<percent>%|percent\b|pct\b)?
+    (?:\s*(?P<suffix_code>{_CODE}))?
+    (?:\s*(?:/|per\s+|a\s+)(?P<per>week|wk|month|mo|quarter|qtr|year|yr|annum)\b
+       |\s*\b(?P<adverb>weekly|monthly|quarterly|annually|yearly|mom|yoy|p\.?a\.?)(?![a-z]))?
+""", re.IGNORECASE | re.VERBOSE)
+
+
+class ParsedValue(NamedTuple):
+    """A quantity found in text. value is the midpoint when the text gives a range."""
+    value: float
+    low: float
+    high: float
+    unit: str  # "currency", "percent" or "number"
+    currency: Optional[str] = None
+    period: Optional[str] = None
+    scaled: bool = False  # written with a K/M/B suffix
+    text: str = ""
+
+    @property
+    def annualized(self) -> Optional[float]:
+        """Amount per year for a per-period money value; None for percentages."""
+        if self.unit == "percent":
+            return None
+        return self.value * PERIODS_PER_YEAR.get(self.period, 1)
+
+    def magnitude(self) -> Tuple[Optional[str], float]:
+        """The amount expressed in billions or millions, as pitch decks quote money."""
+        if self.value >= 1e9:
+            return "billion", self.value / 1e9
+        if self.value >= 1e6 or self.scaled or self.currency:
+            return "million", self.value / 1e6
+        return None, self.value
+
+
+def _number(text: str) -> float:
+    return float(text.replace(",", ""))
+
+
+def _to_value(match) -> ParsedValue:
+    low = _number(match.group("low"))
+    low_scale = (match.group("low_scale") or "").lower()
+    high_scale = (match.group("high_scale") or "").lower()
+    high = _number(match.group("high")) if match.group("high") else None
+
+    # "5-10M" scales both ends by the suffix written after the second number
+    low *= SCALES.get(low_scale or high_scale, 1)
+    if high is not None:
+        high *= SCALES.get(high_scale or low_scale, 1)
+    else:
+        high = low
+    if match.group("sign") == "-":
+        low, high = -high, -low
+
+    currency = match.group("currency")
+    currency = CURRENCY_SYMBOLS[currency] if currency else (match.group("code") or match.group("suffix_code"))
+    period = match.group("per") or match.group("adverb")
+    period = PERIODS.get(period.lower().replace(".", ""), None) if period else None
+
+    if match.group("percent"):
+        unit = "percent"
+    else:
+        unit = "currency" if currency else "number"
+    return ParsedValue(
+        value=(low + high) / 2,
+        low=low,
+        high=high,
+        unit=unit,
+        currency=currency.upper() if currency else None,
+        period=period,
+        scaled=bool(low_scale or high_scale),
+        text=match.group(0).strip(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_text(text: str) -> Tuple[ParsedValue, ...]:
+    return tuple(_to_value(match) for match in VALUE_PATTERN.finditer(text))
+
+
+def parse_values(text) -> Tuple[ParsedValue, ...]:
+    """Every quantity in text, in order. Numbers are returned as a single plain value."""
+    if isinstance(text, bool) or text is None:
+        return ()
+    if isinstance(text, (int, float)):
+        value = float(text)
+        return (ParsedValue(value, value, value, "number"),)
+    if not isinstance(text, str):
+        return ()
+    return _parse_text(text)
+
+
+def parse_money(text) -> Optional[ParsedValue]:
+    """The first amount in text that is not a percentage."""
+    for parsed in parse_values(text):
+        if parsed.unit != "percent":
+            return parsed
+    return None
+
+
+def parse_percent(text) -> Optional[ParsedValue]:
+    """The first percentage in text."""
+    for parsed in parse_values(text):
+        if parsed.unit == "percent":
+            return parsed
+    return None
+
+
+def parse_rate(value) -> Optional[float]:
+    """A growth or churn rate in percent, from 25, "25" or "25% YoY"."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    parsed = parse_percent(value)
+    return parsed.value if parsed is not None else None
+
+
+def _short_amount(amount: float) -> str:
+    for suffix, scale in (("T", 1e12), ("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if abs(amount) >= scale:
+            return f"{round(amount / scale, 1):g}{suffix}"
+    return f"{amount:,.0f}" if amount == int(amount) else f"{amount:,.2f}"
+
+
+def format_value(parsed: ParsedValue) -> str:
+    """Compact normalized form, e.g. "$1.2B", "€5M–€10M/month" or "12%"."""
+    if parsed.unit == "percent":
+        amount = f"{parsed.low:g}%" if parsed.low == parsed.high else f"{parsed.low:g}–{parsed.high:g}%"
+    else:
+        prefix = CURRENCY_PREFIXES.get(parsed.currency, f"{parsed.currency} " if parsed.currency else "")
+        amount = prefix + _short_amount(parsed.low)
+        if parsed.high != parsed.low:
+            amount += "–" + prefix + _short_amount(parsed.high)
+    if parsed.period:
+        amount += f"/{parsed.period}"
+    return amount
@@ -1,18 +1,25 @@
-import os
+# torch, transformers and nltk are imported where they are first used, so that
+# importing this module (e.g. from the API process) stays cheap
+import hashlib
 import json
-import pandas as pd
-import numpy as np
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-import nltk
 import re
 import sys
+import threading
+from collections import OrderedDict
 
-try:
-    from nltk.sentiment.vader import SentimentIntensityAnalyzer
-except ImportError:
-    print("Vader not available")
+from evaluation_module.config import EvaluationConfig
+from evaluation_module.services.finbert_backends import BACKENDS, OnnxClassifier, quantize_model
+from evaluation_module.services.reference_data import get_reference_data
+from evaluation_module.services.sentiment_cache import get_sentiment_cache
+from evaluation_module.services.sentiment_cascade import get_sentiment_cascade
+from evaluation_module.services.sentiment_server import connect as connect_sentiment_server
+from evaluation_module.services.value_parser import parse_money, parse_rate
+
+VADER_LEXICON = EvaluationConfig.VADER_LEXICON
+
+# Guards the model and context singletons below; the API warms them up in a background thread
+# while requests may already arrive. Reentrant because building the context loads the models.
+_singleton_lock = threading.RLock()
 
 # Function to load the JSON data
 def get_json(filename):
@@ -24,138 +31,284 @@ def get_json(filename):
         return {}
 
 
-# Function to load all CSV data
-def _load_all_csv_data():
-    csv_dir = "resources"
-    csv_files = {
-        'countries': 'countries.csv',
-        'degrees': 'degrees.csv',
-        'fortune500': 'fortune500.csv',
-        'funding': 'funding.csv',
-        'hardest_companies': 'hardest_companies.csv',
-        'industries': 'industries.csv',
-        'investors': 'investors.csv',
-        'productstages': 'productstages.csv',
-        'universities': 'universities.csv'
-    }
-
-    data = {}
-    for key, filename in csv_files.items():
-        try:
-            filepath = os.path.join(csv_dir, filename)
-            if key == 'countries':
-                data[key] = pd.read_csv(filepath, sep=';', encoding='utf-8')
-            else:
-                data[key] = pd.read_csv(filepath, sep=';', encoding='utf-8')
-        except Exception as e:
-            print(f"Error loading {filename}: {e}")
-            data[key] = pd.DataFrame()
-
-    return data
-
-
-# Initialize NLTK for VADER
+# Initialize NLTK for VADER from the bundled data directory (never downloads)
 def initialize_nltk():
+    import nltk
+
+    data_dir = EvaluationConfig.NLTK_DATA_DIR
+    if data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
     try:
-        nltk.download('vader_lexicon', quiet=True)
-        return True
-    except Exception as e:
-        print(f"Error downloading NLTK resources: {e}")
-        return False
+        return nltk.data.find(VADER_LEXICON)
+    except LookupError:
+        raise RuntimeError(
+            f"VADER lexicon not found ({VADER_LEXICON} under {data_dir}). "
+            f"Set NLTK_DATA_DIR to a directory that contains it."
+        )
 
 
 # FinBERT sentiment analysis class
 class FinBERT:
-    def __init__(self):
+    name = "ProsusAI/finbert"
+
+    def __init__(self, backend=None):
+        self.backend = backend or EvaluationConfig.FINBERT_BACKEND
+        if self.backend not in BACKENDS:
+            print(f"Unknown FinBERT backend {self.backend!r}, using torch")
+            self.backend = "torch"
+
         try:
-            # Load FinBERT model and tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
-            self.model = AutoModelForSequenceClassification.from_pretrained("ProsusAI/finbert")
+            from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+            # Load FinBERT tokenizer and the model for the selected backend
+            self.tokenizer = AutoTokenizer.from_pretrained(self.name)
+            if self.backend == "onnx":
+                try:
+                    self.model = OnnxClassifier(EvaluationConfig.FINBERT_ONNX_PATH)
+                    revision = self.model.metadata.get("revision", "local")
+                except Exception as e:
+                    print(f"FinBERT ONNX backend unavailable ({e}), using torch")
+                    self.backend = "torch"
+            if self.backend != "onnx":
+                self.model = AutoModelForSequenceClassification.from_pretrained(self.name)
+                revision = getattr(self.model.config, "_commit_hash", None) or "local"
+                if self.backend == "quantized":
+                    self.model = quantize_model(self.model)
             self.labels = ["negative", "neutral", "positive"]
+            # Long texts are scored as overlapping windows that fit the model
+            self.prefix, self.suffix = self._special_tokens()
+            self.window = self.tokenizer.model_max_length - len(self.prefix) - len(self.suffix)
+            self.overlap = max(0, min(EvaluationConfig.FINBERT_WINDOW_OVERLAP, self.window // 2))
+            # Cache key version: revision, backend and how texts are windowed and scored
+            self.version = f"{revision}:{self.backend}:max{self.tokenizer.model_max_length}:overlap{self.overlap}:v2"
             self.initialized = True
         except Exception as e:
             print(f"Error initializing FinBERT: {e}")
             self.initialized = False
 
     def sentiment(self, text):
-        if not self.initialized or not text or not isinstance(text, str):
-            return 0.5
+        return self.sentiment_batch([text])[0]
+
+    def _special_tokens(self):
+        """The token ids the tokenizer puts before and after a single sequence (e.g. [CLS], [SEP])."""
+        content = self.tokenizer("a", add_special_tokens=False)["input_ids"]
+        full = self.tokenizer("a")["input_ids"]
+        for start in range(len(full) - len(content) + 1):
+            if full[start:start + len(content)] == content:
+                return full[:start], full[start + len(content):]
+        return [], []
+
+    def windows(self, token_ids):
+        """Split token ids into windows of at most self.window tokens overlapping by self.overlap."""
+        if len(token_ids) <= self.window:
+            return [token_ids]
+        step = self.window - self.overlap
+        starts = range(0, len(token_ids) - self.overlap, step)
+        return [token_ids[start:start + self.window] for start in starts]
+
+    def sentiment_batch(self, texts, batch_size=None, use_cache=True):
+        """Score many texts; long texts are split into token windows, and all windows are
+        scored together in padded forward passes of up to batch_size windows."""
+        scores = [0.5] * len(texts)
+        if not self.initialized:
+            return scores
+
+        import torch
+
+        # Only non-empty strings go through the model, and cached ones are reused
+        valid = [(i, text) for i, text in enumerate(texts) if text and isinstance(text, str)]
+        cache = get_sentiment_cache() if use_cache else None
+        if cache is not None and valid:
+            cached = cache.get_many(self.name, self.version, [text for _, text in valid])
+            for i, text in valid:
+                if text in cached:
+                    scores[i] = cached[text]
+            valid = [(i, text) for i, text in valid if text not in cached]
+
+        if not valid:
+            return scores
+        batch_size = batch_size or EvaluationConfig.FINBERT_BATCH_SIZE
 
         try:
-            # Truncate text if it's too long
-            max_length = self.tokenizer.model_max_length
-            if len(text) > max_length:
-                text = text[:max_length]
+            # Tokenize every text once, without truncation, and cut it into windows
+            token_ids = self.tokenizer([text for _, text in valid], add_special_tokens=False,
+                                       verbose=False)["input_ids"]
+            windows = []  # (index into valid, window token ids)
+            for n, ids in enumerate(token_ids):
+                windows.extend((n, window) for window in self.windows(ids))
+        except Exception as e:
+            print(f"Error analyzing sentiment with FinBERT: {e}")
+            return scores
+
+        # Windows of similar length share a batch, so padding stays small
+        windows.sort(key=lambda w: len(w[1]))
+        totals = [[0.0, 0.0, 0.0] for _ in valid]
+        weights = [0] * len(valid)
+        failed = set()
+        pad_id = self.tokenizer.pad_token_id or 0
+
+        for start in range(0, len(windows), batch_size):
+            chunk = windows[start:start + batch_size]
+            try:
+                inputs = self._batch_inputs([ids for _, ids in chunk], pad_id, torch)
+                with torch.no_grad():
+                    outputs = self.model(**inputs)
+
+                # Get probabilities with softmax
+                probabilities = torch.nn.functional.softmax(outputs.logits, dim=1)
+
+                # Weight each window by its token count
+                for (n, ids), probs in zip(chunk, probabilities.tolist()):
+                    weight = max(len(ids), 1)
+                    weights[n] += weight
+                    for k, p in enumerate(probs):
+                        totals[n][k] += p * weight
+
+            except Exception as e:
+                print(f"Error analyzing sentiment with FinBERT: {e}")
+                failed.update(n for n, _ in chunk)
+
+        scored = []
+        for n, (i, text) in enumerate(valid):
+            if n in failed or not weights[n]:
+                continue
+            neg_score, neu_score, pos_score = (total / weights[n] for total in totals[n])
+            # Calculate sentiment score (positive - negative + neutral/2)
+            sentiment_score = pos_score - neg_score + (neu_score / 2)
+            normalized_score = (sentiment_score + 1) / 2  # Convert from [-1,1] to [0,1]
+            scores[i] = max(0.0, min(1.0, normalized_score))  # Clamp between 0 and 1
+            scored.append((text, scores[i]))
 
-            # Tokenize and get sentiment
-            inputs = self.tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-            with torch.no_grad():
-                outputs = self.model(**inputs)
+        if cache is not None and scored:
+            cache.put_many(self.name, self.version, scored)
 
-            # Get probabilities with softmax
-            probabilities = torch.nn.functional.softmax(outputs.logits, dim=1)
+        return scores
 
-            # Calculate sentiment score (positive - negative + neutral/2)
-            neg_score = probabilities[0][0].item()
-            neu_score = probabilities[0][1].item()
-            pos_score = probabilities[0][2].item()
+    def _batch_inputs(self, windows, pad_id, torch):
+        """Add special tokens to each window and pad them into model input tensors."""
+        input_ids = [self.prefix + ids + self.suffix for ids in windows]
+        width = max(len(ids) for ids in input_ids)
 
-            # Convert to 0-1 scale (0 = negative, 1 = positive)
-            sentiment_score = pos_score - neg_score + (neu_score / 2)
-            normalized_score = (sentiment_score + 1) / 2  # Convert from [-1,1] to [0,1]
+        def pad(rows, value):
+            return torch.tensor([row + [value] * (width - len(row)) for row in rows], dtype=torch.long)
 
-            return max(0.0, min(1.0, normalized_score))  # Clamp between 0 and 1
+        return {
+            "input_ids": pad(input_ids, pad_id),
+            "attention_mask": pad([[1] * len(ids) for ids in input_ids], 0),
+            "token_type_ids": pad([[0] * len(ids) for ids in input_ids], 0),
+        }
 
-        except Exception as e:
-            print(f"Error analyzing sentiment with FinBERT: {e}")
-            return 0.5
+
+# Keyword sentiment used when FinBERT cannot be loaded
+def fallback_sentiment(text):
+    if not text or not isinstance(text, str):
+        return 0.5
+
+    positive_words = ['innovative', 'growth', 'profitable', 'success', 'strong',
+                      'efficient', 'strategic', 'favorable', 'positive', 'excellent']
+    negative_words = ['risky', 'failure', 'loss', 'weak', 'inefficient',
+                      'declining', 'unfavorable', 'negative', 'poor']
+
+    text = text.lower()
+    pos_count = sum(1 for word in positive_words if word in text)
+    neg_count = sum(1 for word in negative_words if word in text)
+    total = pos_count + neg_count
+    if total == 0:
+        return 0.5
+    return (pos_count / total) * 0.8 + 0.2
+
+
+# Get FinBERT model (lazily initialized singleton)
+def get_finbert_model():
+    if not hasattr(finbert_sentiment, "model"):
+        with _singleton_lock:
+            if not hasattr(finbert_sentiment, "model"):
+                # Prefer the shared sentiment server when one is running
+                client = connect_sentiment_server(fallback=FinBERT)
+                if client is not None:
+                    finbert_sentiment.model = client
+                    return client
+                try:
+                    finbert_sentiment.model = FinBERT()
+                except Exception as e:
+                    print(f"Failed to initialize FinBERT: {e}")
+                    return None
+    return finbert_sentiment.model
 
 
 # FinBERT sentiment function
 def finbert_sentiment(text):
-    # Lazily initialize the model
-    if not hasattr(finbert_sentiment, "model"):
-        try:
-            finbert_sentiment.model = FinBERT()
-        except Exception as e:
-            print(f"Failed to initialize FinBERT: {e}")
-            # Fallback to simple sentiment
-            positive_words = ['innovative', 'growth', 'profitable', 'success', 'strong',
-                              'efficient', 'strategic', 'favorable', 'positive', 'excellent']
-            negative_words = ['risky', 'failure', 'loss', 'weak', 'inefficient',
-                              'declining', 'unfavorable', 'negative', 'poor']
-
-            if not text or not isinstance(text, str):
-                return 0.5
-
-            text = text.lower()
-            pos_count = sum(1 for word in positive_words if word in text)
-            neg_count = sum(1 for word in negative_words if word in text)
-            total = pos_count + neg_count
-            if total == 0:
-                return 0.5
-            return (pos_count / total) * 0.8 + 0.2
-
-    # Use the model
-    if hasattr(finbert_sentiment, "model") and finbert_sentiment.model.initialized:
-        return finbert_sentiment.model.sentiment(text)
+    model = get_finbert_model()
+    if model is not None and model.initialized:
+        return model.sentiment(text)
+    return fallback_sentiment(text)
+
+
+# FinBERT sentiment for many texts in batched forward passes
+def finbert_sentiment_batch(texts):
+    model = get_finbert_model()
+    if model is not None and model.initialized:
+        return model.sentiment_batch(texts)
+    return [fallback_sentiment(text) for text in texts]
+
+
+# Section fields scored with FinBERT; the VADER-first fields only fall back to it
+FINBERT_FIELDS = [
+    ('product', 'USP'),
+    ('product', 'customer_acquisition'),
+    ('traction', 'user_growth'),
+    ('traction', 'customer_validation', 'NPS'),
+    ('funding', 'cap_table_strength'),
+    ('financial_efficiency', 'burn_rate'),
+    ('financial_efficiency', 'CAC_vs_LTV'),
+    ('financial_efficiency', 'unit_economics'),
+    ('miscellaneous', 'timing_fad_risk'),
+]
+VADER_FIRST_FIELDS = [
+    ('traction', 'engagement'),
+    ('traction', 'customer_validation', 'churn'),
+]
+
+
+def _get_field(data, path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+# Gather every FinBERT-bound text of a deck (or of some of its sections) and score them in one batch
+def prefetch_finbert_scores(input_json, finbert=None, vader=None, sections=None, cascade=None):
+    paths = list(FINBERT_FIELDS)
+    if not (vader or get_vader_analyzer()).initialized:
+        paths += VADER_FIRST_FIELDS
+    if sections is not None:
+        paths = [path for path in paths if path[0] in sections]
+
+    texts = []
+    for path in paths:
+        text = _get_field(input_json, path)
+        if text and isinstance(text, str) and text not in texts:
+            texts.append(text)
+
+    # With the cascade, confident VADER scores stand in for FinBERT
+    scores = {}
+    if cascade:
+        scores, texts = cascade.route(texts)
+
+    if finbert is not None and finbert.initialized:
+        scores.update(zip(texts, finbert.sentiment_batch(texts)))
     else:
-        # Fallback simple sentiment
-        if not text or not isinstance(text, str):
-            return 0.5
+        scores.update(zip(texts, finbert_sentiment_batch(texts)))
+    return scores
 
-        positive_words = ['innovative', 'growth', 'profitable', 'success', 'strong',
-                          'efficient', 'strategic', 'favorable', 'positive', 'excellent']
-        negative_words = ['risky', 'failure', 'loss', 'weak', 'inefficient',
-                          'declining', 'unfavorable', 'negative', 'poor']
 
-        text = text.lower()
-        pos_count = sum(1 for word in positive_words if word in text)
-        neg_count = sum(1 for word in negative_words if word in text)
-        total = pos_count + neg_count
-        if total == 0:
-            return 0.5
-        return (pos_count / total) * 0.8 + 0.2
+# Look up a prefetched FinBERT score, scoring the text on demand if it is missing
+def _finbert(text, finbert_scores=None):
+    if finbert_scores and isinstance(text, str) and text in finbert_scores:
+        return finbert_scores[text]
+    return finbert_sentiment(text)
 
 
 # Convert numeric values to scores
@@ -211,17 +364,10 @@ def eval_founder_network_strength(founder_network_strength):
 
 
 # 2. Improve the Team evaluation for known unicorns
-def evaluate_team(input_json, input_csvs):
+def evaluate_team(input_json, reference):
     team_score = 0
     factors = 0
 
-    # Initialize VADER for sentiment analysis
-    try:
-        vader = SentimentIntensityAnalyzer()
-    except Exception as e:
-        print(f"VADER not available: {e}. Using simplified sentiment.")
-        vader = None
-
     # Process founders
     founders = input_json.get('team', {}).get('founders', [])
 
@@ -244,11 +390,7 @@ def evaluate_team(input_json, input_csvs):
         background = founder.get('background', '')
         background_score = 60  # Increased default from 50
         if background:
-            found_industry = False
-            for industry in input_csvs['industries']['keyword']:
-                if str(industry).lower() in background.lower():
-                    found_industry = True
-                    break
+            found_industry = reference.industry_matcher.first(background) is not None
             background_score = 95 if found_industry else 60  # Increased both values
         team_score += background_score
         factors += 1
@@ -256,22 +398,16 @@ def evaluate_team(input_json, input_csvs):
         # University check - improved scoring
         university = founder.get('university', '')
         university_score = 60  # Increased default from 50
-        if university:
-            for uni in input_csvs['universities']['institution']:
-                if str(uni).lower() in university.lower():
-                    university_score = 95  # Increased from 90
-                    break
+        if university and reference.university_matcher.first(university) is not None:
+            university_score = 95  # Increased from 90
         team_score += university_score
         factors += 1
 
         # Degree check - improved scoring
         degree = founder.get('degree', '')
         degree_score = 60  # Increased default from 50
-        if degree:
-            for deg in input_csvs['degrees']['full_name']:
-                if str(deg).lower() in degree.lower():
-                    degree_score = 95  # Increased from 90
-                    break
+        if degree and reference.degree_matcher.first(degree) is not None:
+            degree_score = 95  # Increased from 90
         team_score += degree_score
         factors += 1
 
@@ -291,7 +427,7 @@ def evaluate_team(input_json, input_csvs):
         employments = founder.get('previous_employments', [])
         employment_score = 60  # Increased default from 50
         if employments:
-            hardest_companies = set(input_csvs['hardest_companies']['company'].str.lower())
+            hardest_companies = reference.hardest_companies
             emp_years = 0
             premium_company = False
 
@@ -346,7 +482,7 @@ def evaluate_team(input_json, input_csvs):
 
 
 # 3. Adjust market evaluation to better reflect market potential
-def evaluate_market(input_json, input_csvs):
+def evaluate_market(input_json, reference):
     market_data = input_json.get('market', {})
     market_score = 0
     factors = 0
@@ -355,17 +491,16 @@ def evaluate_market(input_json, input_csvs):
     tam = market_data.get('TAM', '')
     tam_score = 60  # Increased default from 50
     if tam:
-        # Extract numeric value from string like "$27 billion"
-        number_pattern = r"[+-]?\d*\.?\d+"
-        matches = re.findall(number_pattern, tam)
-        if matches:
-            value = float(matches[0])
+        # Normalize strings like "$27 billion", "$1.2B" or "€850M" to billions/millions
+        parsed = parse_money(tam)
+        if parsed is not None:
+            unit, value = parsed.magnitude()
             tam_score = convert_to_score(value, 0, 100)
 
             # Adjust for billion/million - increased multipliers
-            if 'billion' in tam.lower():
+            if unit == 'billion':
                 tam_score = min(100, tam_score * 1.8)  # Increased from 1.5
-            elif 'million' in tam.lower():
+            elif unit == 'million':
                 tam_score = tam_score * 0.9  # Increased from 0.8
     market_score += tam_score
     factors += 1
@@ -374,14 +509,13 @@ def evaluate_market(input_json, input_csvs):
     growth_rate = market_data.get('growth_rate', '')
     growth_score = 60  # Increased default from 50
     if growth_rate:
-        try:
-            value = float(growth_rate)
+        # Plain numbers as before, plus percentages such as "25% YoY"
+        value = parse_rate(growth_rate)
+        if value is not None:
             growth_score = convert_to_score(value, 0, 20)
             # Apply exponential scaling for high growth markets
             if value > 10:
                 growth_score = min(100, growth_score * 1.5)
-        except:
-            pass
     # Add higher weight to growth rate
     market_score += growth_score * 1.5
     factors += 1.5  # Adjusted factor weight
@@ -393,7 +527,7 @@ def evaluate_market(input_json, input_csvs):
 
 
 # 5. Improve evaluation of Product to better weight tangible features
-def evaluate_product(input_json, input_csvs):
+def evaluate_product(input_json, reference, finbert_scores=None):
     product_data = input_json.get('product', {})
     product_score = 0
     factors = 0
@@ -402,16 +536,12 @@ def evaluate_product(input_json, input_csvs):
     stage = product_data.get('stage', '')
     stage_score = 60  # Increased default from 50
     if stage:
-        for index, row in input_csvs['productstages'].iterrows():
-            if str(row['stage']).lower() in stage.lower():
-                try:
-                    stage_score = float(row['score'])
-                    # Give bonus for later stage products
-                    if stage_score > 70:
-                        stage_score = min(100, stage_score + 5)
-                except:
-                    pass
-                break
+        score = reference.product_stage_gazetteer.lookup(stage)
+        if score is not None:
+            stage_score = score
+            # Give bonus for later stage products
+            if stage_score > 70:
+                stage_score = min(100, stage_score + 5)
     product_score += stage_score * 1.2  # Higher weight for product stage
     factors += 1.2
 
@@ -419,7 +549,7 @@ def evaluate_product(input_json, input_csvs):
     usp = product_data.get('USP', '')
     usp_score = 60  # Increased default from 50
     if usp:
-        usp_score = finbert_sentiment(usp) * 100
+        usp_score = _finbert(usp, finbert_scores) * 100
     product_score += usp_score
     factors += 1
 
@@ -427,7 +557,7 @@ def evaluate_product(input_json, input_csvs):
     acquisition = product_data.get('customer_acquisition', '')
     acquisition_score = 60  # Increased default from 50
     if acquisition:
-        acquisition_score = finbert_sentiment(acquisition) * 100
+        acquisition_score = _finbert(acquisition, finbert_scores) * 100
     product_score += acquisition_score
     factors += 1
 
@@ -439,18 +569,25 @@ def evaluate_product(input_json, input_csvs):
 
 # VADER wrapper class for sentiment analysis
 class VADERSentiment:
+    name = "vader"
+
     def __init__(self):
-        try:
-            self.analyzer = SentimentIntensityAnalyzer()
-            self.initialized = True
-        except Exception as e:
-            print(f"Error initializing VADER: {e}")
-            self.initialized = False
+        import nltk
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+        # A missing lexicon is a deployment error, so let it raise here
+        lexicon = initialize_nltk()
+        self.analyzer = SentimentIntensityAnalyzer(lexicon_file=VADER_LEXICON)
+        with open(lexicon, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:12]
+        self.version = f"nltk-{nltk.__version__}:{digest}:v1"
+        self.initialized = True
 
     def sentiment(self, text):
         if not self.initialized or not text or not isinstance(text, str):
             return 0.0
 
+        # Not cached: polarity_scores is cheaper than a sentiment cache lookup and write
         try:
             sentiment_scores = self.analyzer.polarity_scores(text)
             # Return compound score normalized to 0-1 range
@@ -463,24 +600,26 @@ class VADERSentiment:
 # Get VADER analyzer (singleton pattern)
 def get_vader_analyzer():
     if not hasattr(get_vader_analyzer, "instance"):
-        get_vader_analyzer.instance = VADERSentiment()
+        with _singleton_lock:
+            if not hasattr(get_vader_analyzer, "instance"):
+                get_vader_analyzer.instance = VADERSentiment()
     return get_vader_analyzer.instance
 
 
 # 6. Modify traction metrics evaluation to better recognize early signs of success
-def evaluate_traction(input_json, input_csvs):
+def evaluate_traction(input_json, reference, finbert_scores=None, vader=None):
     traction_data = input_json.get('traction', {})
     traction_score = 0
     factors = 0
 
     # Get VADER analyzer
-    vader = get_vader_analyzer()
+    vader = vader or get_vader_analyzer()
 
     # User growth - give higher weight
     user_growth = traction_data.get('user_growth', '')
     growth_score = 60  # Increased default from 50
     if user_growth:
-        growth_score = finbert_sentiment(user_growth) * 100
+        growth_score = _finbert(user_growth, finbert_scores) * 100
         # Give extra weight to positive user growth signals
         if growth_score > 70:
             growth_score = min(100, growth_score + 10)
@@ -493,7 +632,7 @@ def evaluate_traction(input_json, input_csvs):
     if engagement and vader.initialized:
         engagement_score = vader.sentiment(engagement) * 100
     elif engagement:
-        engagement_score = finbert_sentiment(engagement) * 100
+        engagement_score = _finbert(engagement, finbert_scores) * 100
     traction_score += engagement_score
     factors += 1
 
@@ -508,7 +647,7 @@ def evaluate_traction(input_json, input_csvs):
         churn_score = 100 - (vader.sentiment(churn) * 100)
     elif churn:
         # Invert FinBERT score since lower churn is better
-        churn_score = 100 - (finbert_sentiment(churn) * 100)
+        churn_score = 100 - (_finbert(churn, finbert_scores) * 100)
     traction_score += churn_score
     factors += 1
 
@@ -517,7 +656,7 @@ def evaluate_traction(input_json, input_csvs):
     nps_score = 50
     if nps:
         # Combine FinBERT and VADER for more robust analysis
-        finbert_score = finbert_sentiment(nps) * 100
+        finbert_score = _finbert(nps, finbert_scores) * 100
 
         if vader.initialized:
             vader_score = vader.sentiment(nps) * 100
@@ -547,25 +686,19 @@ def evaluate_traction(input_json, input_csvs):
 
 
 # Evaluate funding metrics
-def evaluate_funding(input_json, input_csvs):
+def evaluate_funding(input_json, reference, finbert_scores=None, vader=None):
     funding_data = input_json.get('funding', {})
     funding_score = 0
     factors = 0
 
     # Get VADER analyzer
-    vader = get_vader_analyzer()
+    vader = vader or get_vader_analyzer()
 
     # Funding stage
     stage = funding_data.get('stage', '')
     stage_score = 50
     if stage:
-        for index, row in input_csvs['funding'].iterrows():
-            if str(row['stage']).lower() in stage.lower():
-                try:
-                    stage_score = float(row['score'])
-                except:
-                    stage_score = float(row['stage_level']) * 20
-                break
+        stage_score = reference.funding_stage_gazetteer.lookup(stage, stage_score)
     funding_score += stage_score
     factors += 1
 
@@ -573,15 +706,14 @@ def evaluate_funding(input_json, input_csvs):
     amount = funding_data.get('amount', '')
     amount_score = 50
     if amount:
-        number_pattern = r"[+-]?\d*\.?\d+"
-        matches = re.findall(number_pattern, amount)
-        if matches:
-            value = float(matches[0])
+        parsed = parse_money(amount)
+        if parsed is not None:
+            unit, value = parsed.magnitude()
             amount_score = convert_to_score(value, 0, 50)
 
-            if 'billion' in amount.lower():
+            if unit == 'billion':
                 amount_score = 100
-            elif 'million' in amount.lower():
+            elif unit == 'million':
                 amount_score = min(100, amount_score * 1.5)
     funding_score += amount_score
     factors += 1
@@ -591,7 +723,7 @@ def evaluate_funding(input_json, input_csvs):
     cap_score = 50
     if cap_table:
         # Combine FinBERT and VADER
-        finbert_score = finbert_sentiment(cap_table) * 100
+        finbert_score = _finbert(cap_table, finbert_scores) * 100
 
         if vader.initialized:
             vader_score = vader.sentiment(cap_table) * 100
@@ -613,16 +745,13 @@ def evaluate_funding(input_json, input_csvs):
             investor_name = investor.get('name', '')
 
             # Check if in top investors list
-            for index, row in input_csvs['investors'].iterrows():
-                if str(row['investor_name']).lower() in investor_name.lower():
-                    investor_ranking += 100 - min(99, int(row['investor_rank']))
-                    break
+            rank = reference.investor_gazetteer.lookup(investor_name)
+            if rank is not None:
+                investor_ranking += 100 - min(99, rank)
 
             # Check if Fortune 500
-            for index, row in input_csvs['fortune500'].iterrows():
-                if str(row['name']).lower() in investor_name.lower():
-                    fortune_count += 1
-                    break
+            if reference.fortune500_gazetteer.lookup(investor_name) is not None:
+                fortune_count += 1
 
         # Calculate score based on investor quality
         if fortune_count > 0:
@@ -644,7 +773,7 @@ def evaluate_funding(input_json, input_csvs):
 
 
 # 4. Adjust financial efficiency to be less generous
-def evaluate_financial_efficiency(input_json, input_csvs):
+def evaluate_financial_efficiency(input_json, reference, finbert_scores=None):
     financial_data = input_json.get('financial_efficiency', {})
     financial_score = 0
     factors = 0
@@ -653,7 +782,7 @@ def evaluate_financial_efficiency(input_json, input_csvs):
     burn_rate = financial_data.get('burn_rate', '')
     burn_score = 50
     if burn_rate:
-        raw_score = finbert_sentiment(burn_rate) * 100
+        raw_score = _finbert(burn_rate, finbert_scores) * 100
         # Apply a more realistic curve - scale down high scores
         burn_score = min(90, raw_score * 0.9)
     financial_score += burn_score
@@ -663,7 +792,7 @@ def evaluate_financial_efficiency(input_json, input_csvs):
     cac_ltv = financial_data.get('CAC_vs_LTV', '')
     cac_score = 50
     if cac_ltv:
-        raw_score = finbert_sentiment(cac_ltv) * 100
+        raw_score = _finbert(cac_ltv, finbert_scores) * 100
         # Apply a more realistic curve - scale down high scores
         cac_score = min(90, raw_score * 0.9)
     financial_score += cac_score
@@ -673,7 +802,7 @@ def evaluate_financial_efficiency(input_json, input_csvs):
     unit_econ = financial_data.get('unit_economics', '')
     unit_score = 50
     if unit_econ:
-        raw_score = finbert_sentiment(unit_econ) * 100
+        raw_score = _finbert(unit_econ, finbert_scores) * 100
         # Apply a more realistic curve - scale down high scores
         unit_score = min(90, raw_score * 0.9)
     financial_score += unit_score
@@ -686,7 +815,7 @@ def evaluate_financial_efficiency(input_json, input_csvs):
 
 
 # Evaluate miscellaneous metrics
-def evaluate_miscellaneous(input_json, input_csvs):
+def evaluate_miscellaneous(input_json, reference, finbert_scores=None):
     misc_data = input_json.get('miscellaneous', {})
     misc_score = 0
     factors = 0
@@ -695,16 +824,8 @@ def evaluate_miscellaneous(input_json, input_csvs):
     geographic = misc_data.get('geographic_focus', '')
     geo_score = 50
     if geographic:
-        for index, row in input_csvs['countries'].iterrows():
-            country_name = str(row.get('country_name', '')).lower()
-            country_long = str(row.get('country_long_name', '')).lower()
-            if country_name in geographic.lower() or country_long in geographic.lower():
-                # Use corruption score as a proxy for market stability
-                try:
-                    geo_score = float(row['corruption_score']) if not pd.isna(row['corruption_score']) else 50
-                except:
-                    geo_score = 70 if 'united states' in geographic.lower() else 50
-                break
+        # Use corruption score as a proxy for market stability
+        geo_score = reference.country_gazetteer.lookup(geographic, geo_score)
     misc_score += geo_score
     factors += 1
 
@@ -713,7 +834,7 @@ def evaluate_miscellaneous(input_json, input_csvs):
     timing_score = 50
     if timing_risk:
         # Invert the sentiment since lower risk is better
-        timing_score = 100 - (finbert_sentiment(timing_risk) * 100)
+        timing_score = 100 - (_finbert(timing_risk, finbert_scores) * 100)
     misc_score += timing_score
     factors += 1
 
@@ -747,29 +868,55 @@ def calculate_unicorn_score(scores):
     return round(weighted_sum)
 
 
-# Main evaluation function
-def evaluate(filename):
-    # Initialize NLTK for VADER
-    initialize_nltk()
-
-    # Load all CSV data
-    csvs = _load_all_csv_data()
-
-    # Load JSON parameters
-    jsons = get_json(filename)
-
-    # Print loaded data for debugging
-    #print(jsons)
+# Models and reference data shared by every evaluation in a process
+class EvaluationContext:
+    def __init__(self, reference=None, finbert=None, vader=None, cascade=None):
+        self.reference = reference or get_reference_data()
+        self.finbert = finbert or get_finbert_model()
+        self.vader = vader or get_vader_analyzer()
+        # False disables the cascade regardless of SENTIMENT_CASCADE
+        self.cascade = cascade if cascade is not None else get_sentiment_cascade(self.vader)
+
+
+# Get the process-wide evaluation context (singleton pattern)
+def get_evaluation_context():
+    if not hasattr(get_evaluation_context, "instance"):
+        with _singleton_lock:
+            if not hasattr(get_evaluation_context, "instance"):
+                # Fail fast if the bundled VADER lexicon is missing
+                initialize_nltk()
+                get_evaluation_context.instance = EvaluationContext()
+    return get_evaluation_context.instance
+
+
+# Category scores and the top-level section each one reads, in UnicornScore order
+SECTION_SCORERS = {
+    "Team": ("team", lambda data, context, finbert_scores: evaluate_team(data, context.reference)),
+    "Market": ("market", lambda data, context, finbert_scores: evaluate_market(data, context.reference)),
+    "Product": ("product", lambda data, context, finbert_scores:
+                evaluate_product(data, context.reference, finbert_scores)),
+    "Traction": ("traction", lambda data, context, finbert_scores:
+                 evaluate_traction(data, context.reference, finbert_scores, context.vader)),
+    "Funding": ("funding", lambda data, context, finbert_scores:
+                evaluate_funding(data, context.reference, finbert_scores, context.vader)),
+    "Financial Efficiency": ("financial_efficiency", lambda data, context, finbert_scores:
+                             evaluate_financial_efficiency(data, context.reference, finbert_scores)),
+    "Miscellaneous": ("miscellaneous", lambda data, context, finbert_scores:
+                      evaluate_miscellaneous(data, context.reference, finbert_scores)),
+}
+
+
+# Evaluate an already parsed startup dict (no file I/O, no downloads)
+def evaluate_data(data, context=None):
+    context = context or get_evaluation_context()
+
+    # Score every FinBERT-bound field of the deck in one batch
+    finbert_scores = prefetch_finbert_scores(data, context.finbert, context.vader, cascade=context.cascade)
 
     # Calculate all metrics
     metrics = {
-        "Team": evaluate_team(jsons, csvs),
-        "Market": evaluate_market(jsons, csvs),
-        "Product": evaluate_product(jsons, csvs),
-        "Traction": evaluate_traction(jsons, csvs),
-        "Funding": evaluate_funding(jsons, csvs),
-        "Financial Efficiency": evaluate_financial_efficiency(jsons, csvs),
-        "Miscellaneous": evaluate_miscellaneous(jsons, csvs)
+        metric: scorer(data, context, finbert_scores)
+        for metric, (_, scorer) in SECTION_SCORERS.items()
     }
 
     # Calculate unicorn score
@@ -778,8 +925,87 @@ def evaluate(filename):
     return metrics
 
 
+# Fingerprint of one section's inputs plus everything else its score depends on
+def section_fingerprint(data, section, context):
+    finbert = context.finbert
+    signature = "|".join([
+        finbert.version if finbert is not None and finbert.initialized else "fallback",
+        context.vader.version if context.vader.initialized else "no-vader",
+        context.reference.version,
+        context.cascade.version if context.cascade else "no-cascade",
+    ])
+    payload = json.dumps(data.get(section), sort_keys=True, default=str)
+    return hashlib.sha256(f"{signature}\x1f{payload}".encode("utf-8")).hexdigest()
+
+
+# Re-scores only the sections of a startup whose inputs changed since its last evaluation
+class IncrementalEvaluator:
+    def __init__(self, context=None, max_startups=1000):
+        self.context = context or get_evaluation_context()
+        self.max_startups = max_startups
+        self.state = OrderedDict()  # startup_id -> {"fingerprints": {...}, "metrics": {...}}
+        self.sections_scored = 0
+        self.sections_reused = 0
+
+    def evaluate(self, startup_id, data):
+        previous = self.state.get(startup_id, {"fingerprints": {}, "metrics": {}})
+        fingerprints = {
+            metric: section_fingerprint(data, section, self.context)
+            for metric, (section, _) in SECTION_SCORERS.items()
+        }
+        changed = [metric for metric in SECTION_SCORERS
+                   if previous["fingerprints"].get(metric) != fingerprints[metric]]
+
+        # Only the FinBERT fields of changed sections go through the model
+        finbert_scores = prefetch_finbert_scores(
+            data, self.context.finbert, self.context.vader,
+            sections={SECTION_SCORERS[metric][0] for metric in changed}, cascade=self.context.cascade
+        ) if changed else {}
+
+        metrics = {}
+        for metric, (_, scorer) in SECTION_SCORERS.items():
+            if metric in changed:
+                metrics[metric] = scorer(data, self.context, finbert_scores)
+            else:
+                metrics[metric] = previous["metrics"][metric]
+        self.sections_scored += len(changed)
+        self.sections_reused += len(SECTION_SCORERS) - len(changed)
+
+        # Recombining the category scores is cheap, so UnicornScore is always recomputed
+        metrics["UnicornScore"] = calculate_unicorn_score(metrics)
+
+        self.state[startup_id] = {"fingerprints": fingerprints, "metrics": dict(metrics)}
+        self.state.move_to_end(startup_id)
+        while len(self.state) > self.max_startups:
+            self.state.popitem(last=False)
+        return metrics
+
+    def forget(self, startup_id):
+        self.state.pop(startup_id, None)
+
+    def stats(self):
+        scored = self.sections_scored + self.sections_reused
+        return {
+            "startups": len(self.state),
+            "sections_scored": self.sections_scored,
+            "sections_reused": self.sections_reused,
+            "reuse_rate": round(self.sections_reused / scored, 4) if scored else 0.0,
+        }
+
+
+# Main evaluation function (file-based wrapper around evaluate_data)
+def evaluate(filename, context=None):
+    return evaluate_data(get_json(filename), context)
+
+
 # Main function
 if __name__ == "__main__":
+    # Bulk mode: python evaluator_final.py bulk <dirs or files> -o scores.ndjson
+    if len(sys.argv) > 1 and sys.argv[1] == "bulk":
+        from evaluation_module.services.bulk_runner import main as bulk_main
+        bulk_main(sys.argv[2:])
+        sys.exit(0)
+
     if len(sys.argv) > 1:
         filename = sys.argv[1]
     else:
@@ -0,0 +1,47 @@
+# extraction_module/config.py
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env file in parent directory
+load_dotenv(dotenv_path="../.env")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class ExtractionConfig:
+    # Deck cache: pipeline results keyed by the SHA-256 of the PDF and the pipeline version
+    DECK_CACHE_DIR = os.getenv("DECK_CACHE_DIR", os.path.join(BACKEND_DIR, "cache", "decks"))
+    DECK_CACHE_MAX_MB = float(os.getenv("DECK_CACHE_MAX_MB", "500"))
+    DECK_CACHE_MAX_AGE_DAYS = float(os.getenv("DECK_CACHE_MAX_AGE_DAYS", "90"))  # 0 = keep forever
+
+    # Human-readable copy of the latest result per deck name (also part of the evaluator corpus)
+    EXPORT_DIR = os.path.join(BACKEND_DIR, "PreviouslyCalculatedSlidedecks")
+
+    # Remote OpenAI objects reused across decks (assistant, uploaded PDFs, vector stores)
+    OPENAI_RESOURCES_PATH = os.getenv("OPENAI_RESOURCES_PATH", os.path.join(BACKEND_DIR, "cache", "openai_resources.sqlite3"))
+    OPENAI_STORE_EXPIRY_DAYS = int(os.getenv("OPENAI_STORE_EXPIRY_DAYS", "7"))  # idle vector stores expire remotely
+    OPENAI_RESOURCE_MAX_AGE_HOURS = float(os.getenv("OPENAI_RESOURCE_MAX_AGE_HOURS", "168"))  # cleanup default
+
+    # Assistants run polling: interval grows from INITIAL to MAX; runs past the deadline are cancelled
+    RUN_POLL_INITIAL_SECONDS = float(os.getenv("RUN_POLL_INITIAL_SECONDS", "0.25"))
+    RUN_POLL_MAX_SECONDS = float(os.getenv("RUN_POLL_MAX_SECONDS", "3"))
+    RUN_DEADLINE_SECONDS = float(os.getenv("RUN_DEADLINE_SECONDS", "300"))
+
+    # Bright Data LinkedIn enrichment
+    BRIGHTDATA_MAX_CONNECTIONS = int(os.getenv("BRIGHTDATA_MAX_CONNECTIONS", "10"))
+    BRIGHTDATA_POLL_SECONDS = float(os.getenv("BRIGHTDATA_POLL_SECONDS", "2"))  # first interval, grows 1.5x
+    BRIGHTDATA_POLL_MAX_SECONDS = float(os.getenv("BRIGHTDATA_POLL_MAX_SECONDS", "20"))
+    BRIGHTDATA_MAX_WAIT_SECONDS = float(os.getenv("BRIGHTDATA_MAX_WAIT_SECONDS", "300"))
+
+    # LinkedIn lookups cached across decks: founders by name + company, companies by page URL
+    PROFILE_CACHE_PATH = os.getenv("PROFILE_CACHE_PATH", os.path.join(BACKEND_DIR, "cache", "profiles.sqlite3"))
+    PROFILE_CACHE_TTL_DAYS = float(os.getenv("PROFILE_CACHE_TTL_DAYS", "30"))  # 0 = never refetch
+    PROFILE_CACHE_NEGATIVE_TTL_DAYS = float(os.getenv("PROFILE_CACHE_NEGATIVE_TTL_DAYS", "3"))  # "no profiles found"
+
+    # Local PDF text: structure decks from per-page text with one chat completion instead of an Assistants run
+    LOCAL_PDF_TEXT = os.getenv("LOCAL_PDF_TEXT", "false").lower() == "true"
+    LOCAL_TEXT_MIN_CHARS_PER_PAGE = int(os.getenv("LOCAL_TEXT_MIN_CHARS_PER_PAGE", "80"))  # below: image-only deck
+    PAGE_TEXT_CACHE_PATH = os.getenv("PAGE_TEXT_CACHE_PATH", os.path.join(BACKEND_DIR, "cache", "pages.sqlite3"))
+
+    # Page-level incremental extraction: per-page fields by page hash, re-run only what a new deck version changes
+    INCREMENTAL_EXTRACTION = os.getenv("INCREMENTAL_EXTRACTION", "false").lower() == "true"
+    PAGE_RESULTS_PATH = os.getenv("PAGE_RESULTS_PATH", os.path.join(BACKEND_DIR, "cache", "page_results.sqlite3"))
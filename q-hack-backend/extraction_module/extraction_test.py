@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Test script for the extraction module.
+Run this from the q-hack-backend directory with: python -m extraction_module.extraction_test
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+from extraction_module.config import ExtractionConfig
+from extraction_module.services import brightdata
+from extraction_module.services.assistant_runs import wait_for_run
+from extraction_module.services.deck_cache import DeckCache, deck_name, file_sha256
+from extraction_module.services.incremental import (PageResults, carry_over, diff_paths, merge_page_fields,
+                                                    stage_affected)
+from extraction_module.services.openai_resources import OpenAIResources
+from extraction_module.services.page_text import PageText, PageTextCache, compact_deck, has_enough_text, layout_blocks
+from extraction_module.services.profile_cache import ProfileCache
+
+
+def write_pdf(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+def test_deck_cache_content_keys():
+    """Renamed uploads hit the cache; different decks with the same name do not collide."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DeckCache(os.path.join(tmp, "decks"), max_bytes=1 << 20)
+        first = write_pdf(tmp, "1111_airbnb.pdf", b"%PDF deck one")
+        renamed = write_pdf(tmp, "2222_airbnb-final.pdf", b"%PDF deck one")
+        other = write_pdf(tmp, "3333_airbnb.pdf", b"%PDF deck two")
+        assert deck_name(first) == "airbnb"
+
+        cache.put(file_sha256(first), "v1", {"company_name": "Airbnb"}, alias=deck_name(first))
+        assert cache.get(file_sha256(renamed), "v1", alias=deck_name(renamed)) == {"company_name": "Airbnb"}
+        assert cache.get(file_sha256(other), "v1") is None
+        assert cache.get(file_sha256(first), "v2") is None  # new pipeline version
+        assert cache.get_by_alias("airbnb-final", "v1") == {"company_name": "Airbnb"}
+        assert cache.stats()["hits"] == 2 and cache.stats()["aliases"] == 2
+
+
+def test_deck_cache_eviction():
+    """Least recently used decks are evicted past the size limit, and old ones expire."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DeckCache(os.path.join(tmp, "decks"), max_bytes=2500)
+        payload = {"text": "x" * 1000}
+        cache.put("a" * 64, "v1", payload, alias="a")
+        cache.put("b" * 64, "v1", payload)
+        assert cache.get("a" * 64, "v1") is not None  # a is now more recent than b
+        cache.put("c" * 64, "v1", payload)
+        assert cache.get("b" * 64, "v1") is None
+        assert cache.get("a" * 64, "v1") is not None and cache.get("c" * 64, "v1") is not None
+        assert cache.stats()["evictions"] == 1
+
+        aged = DeckCache(os.path.join(tmp, "decks"), max_bytes=1 << 20, max_age_seconds=0.05)
+        time.sleep(0.1)
+        assert aged.get("a" * 64, "v1") is None
+
+
+class RecordingClient:
+    """Stand-in for the OpenAI client that records the remote calls made through it."""
+
+    def __init__(self):
+        self.calls = []
+        ids = itertools.count(1)
+
+        def call(name, **result):
+            def method(*args, **kwargs):
+                self.calls.append(name)
+                return SimpleNamespace(id=f"{name}-{next(ids)}", **result)
+            return method
+
+        self.files = SimpleNamespace(create=call("files.create"), delete=call("files.delete"))
+        self.vector_stores = SimpleNamespace(
+            create=call("vector_stores.create"), delete=call("vector_stores.delete"),
+            files=SimpleNamespace(create_and_poll=call("vector_stores.files", status="completed")),
+        )
+        self.beta = SimpleNamespace(
+            assistants=SimpleNamespace(create=call("assistants.create"), delete=call("assistants.delete")),
+            threads=SimpleNamespace(create=call("threads.create"), delete=call("threads.delete")),
+        )
+
+
+def test_openai_resources_reuse():
+    """The assistant and a deck's upload are created once; threads are deleted after use."""
+    with tempfile.TemporaryDirectory() as tmp:
+        client = RecordingClient()
+        resources = OpenAIResources(client, os.path.join(tmp, "resources.sqlite3"))
+        pdf = write_pdf(tmp, "deck.pdf", b"%PDF deck")
+        sha256 = file_sha256(pdf)
+
+        for _ in range(3):
+            assistant_id = resources.assistant("Extractor", "gpt-4o", "Return JSON", [{"type": "file_search"}])
+            store_id = resources.vector_store(pdf, sha256)
+            resources.release_thread(resources.thread())
+        assert client.calls.count("assistants.create") == 1
+        assert client.calls.count("files.create") == 1 and client.calls.count("vector_stores.create") == 1
+        assert client.calls.count("threads.delete") == 3
+        assert resources.assistant("Extractor", "gpt-4o", "Return other JSON", []) != assistant_id
+
+        # A fresh registry on the same file remembers the remote objects
+        again = OpenAIResources(client, os.path.join(tmp, "resources.sqlite3"))
+        assert again.vector_store(pdf, sha256) == store_id
+
+        # Idle past the remote expiry: the file is reused, the store is replaced
+        idle = time.time() - ExtractionConfig.OPENAI_STORE_EXPIRY_DAYS * 86400
+        again._execute("UPDATE files SET used = ? WHERE sha256 = ?", (idle, sha256))
+        assert again.vector_store(pdf, sha256) != store_id
+        assert client.calls.count("files.create") == 1 and client.calls.count("vector_stores.create") == 2
+        assert again.cleanup(max_age_seconds=0) == {"threads": 0, "files": 1, "vector_stores": 1, "assistants": 2}
+        assert again.stats()["files"] == 0 and again.stats()["assistants"] == 0
+
+
+class ScriptedRuns:
+    """Stand-in for client.beta.threads.runs that walks through a list of statuses."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.cancelled = False
+
+    def retrieve(self, thread_id, run_id):
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return SimpleNamespace(id=run_id, status=status, last_error=None)
+
+    def cancel(self, thread_id, run_id):
+        self.cancelled = True
+
+
+def test_wait_for_run_states():
+    """Runs finish on any terminal status; stuck runs are cancelled at the deadline."""
+    def wait(statuses, **kwargs):
+        runs = ScriptedRuns(statuses[1:])
+        client = SimpleNamespace(beta=SimpleNamespace(threads=SimpleNamespace(runs=runs)))
+        run = SimpleNamespace(id="run-1", status=statuses[0])
+        try:
+            return wait_for_run(client, "thread-1", run, initial_interval=0.001, max_interval=0.004, **kwargs), runs
+        except (RuntimeError, TimeoutError) as e:
+            return e, runs
+
+    result, _ = wait(["queued", "queued", "in_progress", "in_progress", "completed"])
+    assert result.run.status == "completed" and result.polls == 4
+    assert set(result.phases) == {"queued", "in_progress"}
+
+    for status in ("failed", "cancelled", "expired", "incomplete"):
+        error, _ = wait(["in_progress", status])
+        assert isinstance(error, RuntimeError) and status in str(error)
+
+    error, runs = wait(["requires_action"])
+    assert isinstance(error, RuntimeError) and runs.cancelled
+
+    error, runs = wait(["queued", "queued"], deadline_seconds=0.05)
+    assert isinstance(error, TimeoutError) and runs.cancelled
+
+
+def fake_brightdata(delay):
+    """MockTransport handler: a batched discovery job is ready after one progress poll of delay seconds."""
+    import httpx
+
+    jobs, polled, triggers = {}, set(), []
+
+    async def handler(request):
+        path = request.url.path
+        if path.endswith("/trigger"):
+            people = json.loads(request.content)
+            snapshot_id = f"s-{len(jobs)}"
+            jobs[snapshot_id] = people
+            triggers.append(len(people))
+            return httpx.Response(200, json={"snapshot_id": snapshot_id})
+        snapshot_id = path.rsplit("/", 1)[-1]
+        if "/progress/" in path:
+            await asyncio.sleep(delay)
+            polled.add(snapshot_id)
+            return httpx.Response(200, json={"status": "ready"})
+        if snapshot_id not in polled:
+            return httpx.Response(202, text="")
+        return httpx.Response(200, json=[
+            {"input": person, "full_name": f"{person['first_name']} {person['last_name']}", "followers": 10}
+            for person in reversed(jobs[snapshot_id])
+        ])
+
+    return httpx.MockTransport(handler), triggers
+
+
+def test_brightdata_batched_discovery():
+    """Each deck triggers one job for all founders; one shared poller waits for every deck's job."""
+    decks = [[("Ann", "Doe"), ("Bob", "Doe"), ("Cy", "Roe")], [("Di", "Poe"), ("Ed", "Poe")]]
+    transport, triggers = fake_brightdata(0.2)
+    poller = brightdata.SnapshotPoller("key", transport=transport)
+
+    async def run():
+        async with brightdata.async_client("key", transport=transport) as client:
+            return await asyncio.gather(*(brightdata.discover_profiles(client, poller, people, f"deck {i}")
+                                          for i, people in enumerate(decks)))
+
+    poll_seconds, ExtractionConfig.BRIGHTDATA_POLL_SECONDS = ExtractionConfig.BRIGHTDATA_POLL_SECONDS, 0.01
+    try:
+        start = time.perf_counter()
+        results = asyncio.run(run())
+    finally:
+        ExtractionConfig.BRIGHTDATA_POLL_SECONDS = poll_seconds
+    assert time.perf_counter() - start < 0.2 * len(decks)
+    assert triggers == [3, 2]
+    for people, profiles in zip(decks, results):
+        assert [p[0]["full_name"] for p in profiles] == [f"{first} {last}" for first, last in people]
+    assert poller.stats() == {"snapshots": 2, "requests": 6, "waiters": 2, "in_flight": 0}
+
+    # Without the echoed input, records are matched to founders by name
+    people = [("Ann", "Doe"), ("Bob", "Doe")]
+    assert brightdata._person_index({"full_name": "Bob Doe"}, people) == 1
+    assert brightdata._person_index({"full_name": "Doe"}, people) is None
+
+
+def test_brightdata_error_records():
+    """Error records of a discovery job are not profiles, so an all-error founder ends up with none."""
+    import httpx
+
+    people = [("Ann", "Doe"), ("Bob", "Roe")]
+    records = [
+        {"input": {"first_name": "Ann", "last_name": "Doe"}, "error": "Crawl failed", "error_code": "crawl_failed"},
+        {"input": {"first_name": "Bob", "last_name": "Roe"}, "error_code": "dead_page"},
+        {"input": {"first_name": "Bob", "last_name": "Roe"}, "url": "https://linkedin.com/in/bob", "full_name": "Bob Roe"},
+    ]
+
+    def handler(request):
+        if request.url.path.endswith("/trigger"):
+            return httpx.Response(200, json={"snapshot_id": "s-err"})
+        return httpx.Response(200, json=records)
+
+    transport = httpx.MockTransport(handler)
+    poller = brightdata.SnapshotPoller("key", transport=transport)
+
+    async def run():
+        async with brightdata.async_client("key", transport=transport) as client:
+            return await brightdata.discover_profiles(client, poller, people, "acme")
+
+    ann, bob = asyncio.run(run())
+    assert ann == [] and [p["full_name"] for p in bob] == ["Bob Roe"]
+
+
+def test_profile_cache_ttl():
+    """Founders match across spellings; misses are cached with their own, shorter TTL."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ProfileCache(os.path.join(tmp, "profiles.sqlite3"), ttl_seconds=60, negative_ttl_seconds=0.05)
+        profile = {"url": "https://linkedin.com/in/jose", "full_name": "José García"}
+        cache.put_founder("José García", "Airbnb", profile, [{"url": profile["url"], "score": 5}])
+        cache.put_founder("Ann Doe", "airbnb", None, [])
+        cache.put_company("https://www.linkedin.com/company/airbnb/", 1200)
+
+        assert cache.get_founder("jose  garcia", "AIRBNB")["profile"] == profile
+        assert cache.get_founder("José García", "Other Co") is None
+        assert cache.get_founder("Ann Doe", "Airbnb")["profile"] is None
+        assert cache.get_company("linkedin.com/company/airbnb") == 1200
+        time.sleep(0.1)
+        assert cache.get_founder("Ann Doe", "Airbnb") is None  # negative entry expired
+        assert cache.get_founder("José García", "Airbnb") is not None
+
+        stats = cache.stats()
+        assert stats["founder_hits"] == 3 and stats["negative_hits"] == 1 and stats["founder_misses"] == 2
+        assert stats["company_hits"] == 1 and stats["negative_founders"] == 1
+        assert stats["hit_rate"] == round(4 / 6, 4)
+
+
+def test_page_text_compaction():
+    """Layout text becomes blocks; footers repeated on most slides and page numbers are dropped."""
+    assert layout_blocks("  Market Size\n\n  TAM      $50B\n  SAM  $5B\n\n\n  12 ") == [
+        "Market Size", "TAM | $50B\nSAM $5B", "12"]
+
+    slides = ["Problem\nTaxis are scarce", "Market\nTAM | $50B\nFounded 2015", "Team\nAnn Doe, CEO", "Ask\n$2M seed"]
+    pages = [PageText(n, f"p{n}", f"{text}\nConfidential\n{n}", False) for n, text in enumerate(slides, start=1)]
+    deck = compact_deck(pages)
+    assert "Confidential" not in deck and "\n2\n" not in deck and "Founded 2015" in deck
+    assert deck.startswith("## Slide 1\nProblem") and deck.count("## Slide") == 4
+    assert has_enough_text(pages) is False
+    assert has_enough_text([page._replace(text="x" * 200) for page in pages])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageTextCache(os.path.join(tmp, "pages.sqlite3"))
+        cache.put("a" * 64, "Market\nTAM | $50B")
+        assert cache.get("a" * 64) == "Market\nTAM | $50B" and cache.get("b" * 64) is None
+        assert cache.stats() == {"pages": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_incremental_page_merge():
+    """Page fields merge in slide order; a changed slide only affects the stages that read it."""
+    pages = [
+        {"company_name": "Acme", "team": {"founders": [{"name": "Ann Doe"}]}},
+        {"team": {"founders": [{"name": "ann doe", "background": "ex-Google"}, {"name": "Bob Roe"}]}},
+        {"company_name": "Acme Inc", "market": {"TAM": "$50B"}, "traction": {"customer_validation": {"testimonials": ["Great"]}}},
+        {"traction": {"customer_validation": {"testimonials": ["Great", "Love it"]}}},
+    ]
+    v1 = merge_page_fields(pages)
+    assert v1["company_name"] == "Acme" and v1["market"] == {"TAM": "$50B"}
+    assert v1["team"]["founders"] == [{"name": "Ann Doe", "background": "ex-Google"}, {"name": "Bob Roe"}]
+    assert v1["traction"]["customer_validation"]["testimonials"] == ["Great", "Love it"]
+
+    # v2 edits the market slide only
+    v2 = merge_page_fields(pages[:2] + [{"market": {"TAM": "$80B"}}] + pages[3:])
+    paths = diff_paths(v1, v2)
+    assert paths == {"market.TAM"}
+    assert not stage_affected("linkedin", paths) and not stage_affected("trends", paths)
+    assert stage_affected("linkedin", {"team.founders"}) and stage_affected("linkedin", {"team"})
+    assert not stage_affected("linkedin", {"team.team_strength"})
+
+    previous = {"company_name": "Acme", "market": {"TAM": "$50B"}, "company_followers": 10, "metrics": {"x": 1}}
+    assert carry_over(previous, {"market": {"TAM": "$80B"}}, {"market"}) == {
+        "market": {"TAM": "$80B"}, "company_name": "Acme", "company_followers": 10}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PageResults(os.path.join(tmp, "page_results.sqlite3"))
+        store.put_page("a" * 64, "v1", pages[0])
+        assert store.get_page("a" * 64, "v1") == pages[0] and store.get_page("a" * 64, "v2") is None
+        store.put_deck("acme", "f" * 64, "v1", ["a" * 64], v1, {**v1, "metrics": {}})
+        assert store.previous("acme", "v1")["structured"] == v1 and store.previous("acme", "v2") is None
+        assert store.stats() == {"pages_reused": 1, "pages_extracted": 1, "pages": 1, "decks": 1}
+
+
+# This allows the script to be run directly
+if __name__ == "__main__":
+    test_deck_cache_content_keys()
+    test_deck_cache_eviction()
+    test_openai_resources_reuse()
+    test_wait_for_run_states()
+    test_brightdata_batched_discovery()
+    test_brightdata_error_records()
+    test_profile_cache_ttl()
+    test_page_text_compaction()
+    test_incremental_page_merge()
+    print("All extraction module tests passed")
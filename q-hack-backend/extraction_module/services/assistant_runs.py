@@ -0,0 +1,67 @@
+# extraction_module/services/assistant_runs.py
+import time
+from typing import Dict, NamedTuple
+
+from ..config import ExtractionConfig
+
+# Statuses after which a run never changes again
+TERMINAL_STATUSES = ("completed", "failed", "cancelled", "expired", "incomplete")
+
+
+class RunResult(NamedTuple):
+    run: object
+    phases: Dict[str, float]  # seconds observed in each status, e.g. {"queued": 0.8, "in_progress": 12.1}
+    polls: int
+    seconds: float
+
+
+def wait_for_run(client, thread_id: str, run, deadline_seconds: float = None,
+                 initial_interval: float = None, max_interval: float = None) -> RunResult:
+    """
+    Poll an Assistants run until it reaches a terminal status.
+
+    The poll interval starts short, so quick runs return quickly, and grows
+    by half each time up to max_interval, so long runs cost few requests.
+    A run that is not finished by the deadline, or that asks for tool
+    outputs we never provide (requires_action), is cancelled and raises.
+    """
+    deadline_seconds = deadline_seconds or ExtractionConfig.RUN_DEADLINE_SECONDS
+    interval = initial_interval or ExtractionConfig.RUN_POLL_INITIAL_SECONDS
+    max_interval = max_interval or ExtractionConfig.RUN_POLL_MAX_SECONDS
+
+    start = last = time.perf_counter()
+    phases: Dict[str, float] = {}
+    polls = 0
+    while run.status not in TERMINAL_STATUSES:
+        if run.status == "requires_action":
+            _cancel(client, thread_id, run.id)
+            raise RuntimeError("Assistant run requires tool outputs, which the extractor does not provide")
+
+        now = time.perf_counter()
+        if now - start >= deadline_seconds:
+            _cancel(client, thread_id, run.id)
+            raise TimeoutError(f"Assistant run {run.id} still {run.status} after {deadline_seconds:g}s, cancelled")
+
+        time.sleep(min(interval, deadline_seconds - (now - start)))
+        interval = min(interval * 1.5, max_interval)
+
+        status = run.status
+        run = client.beta.threads.runs.retrieve(thread_id=thread_id, run_id=run.id)
+        polls += 1
+        now = time.perf_counter()
+        phases[status] = phases.get(status, 0.0) + (now - last)
+        last = now
+
+    result = RunResult(run, {k: round(v, 3) for k, v in phases.items()}, polls,
+                       round(time.perf_counter() - start, 3))
+    if run.status != "completed":
+        error = getattr(run, "last_error", None) or getattr(run, "incomplete_details", None)
+        raise RuntimeError(f"Assistant run {run.status}: {error}")
+    return result
+
+
+def _cancel(client, thread_id: str, run_id: str):
+    try:
+        client.beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id)
+    except Exception as e:
+        print(f"⚠️ Could not cancel run {run_id}: {e}")
@@ -0,0 +1,234 @@
+# extraction_module/services/brightdata.py
+"""
+Async Bright Data client for LinkedIn enrichment.
+
+All founders of a deck are discovered with one batched trigger, and the
+company lookup runs concurrently with it. Snapshots are awaited through a
+per-process SnapshotPoller, so many decks ingested at once share one
+polling loop with adaptive backoff instead of each polling on its own.
+"""
+import asyncio
+import concurrent.futures
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from ..config import ExtractionConfig
+
+API_URL = "https://api.brightdata.com"
+PROFILE_DATASET_ID = "gd_l1viktl72bvl7bjuj0"
+
+
+def safe_json(resp, label: str) -> dict | list:
+    """
+    Return resp.json() if the body is non-empty and valid JSON;
+    otherwise log & return {}.
+    """
+    text = resp.text.strip()
+    if not text:
+        print(f"[WARN] {label}: empty response (HTTP {resp.status_code})")
+        return {}
+    try:
+        return resp.json()
+    except json.JSONDecodeError:
+        print(f"[ERROR] {label}: invalid JSON\n{text[:500]}")
+        return {}
+
+
+def async_client(api_key: str, transport: httpx.AsyncBaseTransport = None) -> httpx.AsyncClient:
+    """One connection pool for every Bright Data request of a pipeline run."""
+    return httpx.AsyncClient(
+        base_url=API_URL,
+        transport=transport,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        timeout=httpx.Timeout(60, connect=15),
+        limits=httpx.Limits(max_connections=ExtractionConfig.BRIGHTDATA_MAX_CONNECTIONS),
+    )
+
+
+class SnapshotPoller:
+    """
+    Waits for Bright Data snapshots on behalf of every pipeline in this process.
+
+    The poller owns an event loop in a background thread and one pooled HTTP
+    client. Each tracked snapshot is polled with a backoff that grows from
+    BRIGHTDATA_POLL_SECONDS to BRIGHTDATA_POLL_MAX_SECONDS, and its records
+    are handed to every pipeline waiting for it.
+    """
+
+    def __init__(self, api_key: str, transport: httpx.AsyncBaseTransport = None):
+        self.api_key = api_key
+        self.transport = transport
+        self._loop = None
+        self._client = None
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, List[concurrent.futures.Future]] = {}
+        self.counts = {"snapshots": 0, "requests": 0, "waiters": 0}
+
+    def _start(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="brightdata-poller", daemon=True).start()
+            self._client = async_client(self.api_key, self.transport)
+            self._loop = loop
+
+    def wait(self, snapshot_id: str) -> concurrent.futures.Future:
+        """A future for the snapshot's records, usable from any thread or event loop."""
+        self._start()
+        future = concurrent.futures.Future()
+        self._loop.call_soon_threadsafe(self._track, snapshot_id, future)
+        return future
+
+    def _track(self, snapshot_id: str, future: concurrent.futures.Future):
+        self.counts["waiters"] += 1
+        if snapshot_id in self._waiters:
+            self._waiters[snapshot_id].append(future)
+            return
+        self._waiters[snapshot_id] = [future]
+        self.counts["snapshots"] += 1
+        self._loop.create_task(self._poll(snapshot_id))
+
+    async def _get(self, url: str, timeout: float):
+        self.counts["requests"] += 1
+        return await self._client.get(url, timeout=timeout)
+
+    async def _poll(self, snapshot_id: str):
+        try:
+            result = await self._fetch(snapshot_id)
+        except Exception as e:
+            result = e
+        for future in self._waiters.pop(snapshot_id, []):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _fetch(self, snapshot_id: str) -> List[Dict]:
+        """
+        Download a snapshot; if it is not ready yet, poll the /progress/
+        endpoint with growing intervals until it is, up to BRIGHTDATA_MAX_WAIT_SECONDS.
+        """
+        data_url = f"/datasets/v3/snapshot/{snapshot_id}?format=json"
+
+        # 1) first try direct download
+        resp = await self._get(data_url, timeout=30)
+        if resp.is_success and resp.text.strip():
+            recs = safe_json(resp, f"snapshot {snapshot_id}")
+            if isinstance(recs, list) and recs:
+                return recs
+
+        # 2) if empty → poll /progress/ with backoff
+        interval = ExtractionConfig.BRIGHTDATA_POLL_SECONDS
+        deadline = time.monotonic() + ExtractionConfig.BRIGHTDATA_MAX_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            prog = await self._get(f"/datasets/v3/progress/{snapshot_id}", timeout=15)
+            status = safe_json(prog, f"progress {snapshot_id}").get("status")
+            print(f"[INFO] Snapshot {snapshot_id} status={status!r}")
+            if status == "ready":
+                break
+            if status in ("failed", "error"):
+                raise RuntimeError(f"Snapshot {snapshot_id} failed: {prog.text}")
+            await asyncio.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+            interval = min(interval * 1.5, ExtractionConfig.BRIGHTDATA_POLL_MAX_SECONDS)
+        else:
+            raise RuntimeError(f"Timeout waiting for snapshot {snapshot_id}")
+
+        # 3) final download
+        recs = safe_json(await self._get(data_url, timeout=30), f"snapshot {snapshot_id}")
+        if not isinstance(recs, list):
+            raise ValueError(f"Unexpected data from snapshot {snapshot_id}: {recs}")
+        return recs
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.counts, "in_flight": len(self._waiters)}
+
+
+_lock = threading.Lock()
+
+
+# Get the process-wide snapshot poller (singleton pattern)
+def get_snapshot_poller(api_key: str) -> SnapshotPoller:
+    if not hasattr(get_snapshot_poller, "instance"):
+        with _lock:
+            if not hasattr(get_snapshot_poller, "instance"):
+                get_snapshot_poller.instance = SnapshotPoller(api_key)
+    return get_snapshot_poller.instance
+
+
+def _is_error_record(record: Dict) -> bool:
+    """An error entry of a discovery snapshot rather than a profile."""
+    return bool(record.get("error") or record.get("error_code")) and not (record.get("url") or record.get("id"))
+
+
+def _person_index(record: Dict, people: List[Tuple[str, str]]) -> Optional[int]:
+    """Which (first, last) name a discovery record belongs to."""
+    given = record.get("input") or record.get("discovery_input") or {}
+    if isinstance(given, dict) and given.get("last_name"):
+        key = (str(given.get("first_name", "")).lower(), str(given["last_name"]).lower())
+        for idx, (first, last) in enumerate(people):
+            if (first.lower(), last.lower()) == key:
+                return idx
+
+    # No input echoed back: go by the profile's own name
+    name = str(record.get("full_name") or record.get("name") or "").lower()
+    matches = [idx for idx, (first, last) in enumerate(people)
+               if first.lower() in name and last.lower() in name]
+    return matches[0] if len(matches) == 1 else None
+
+
+async def discover_profiles(client: httpx.AsyncClient, poller: SnapshotPoller, people: List[Tuple[str, str]],
+                            label: str) -> List[Optional[List[Dict]]]:
+    """
+    LinkedIn profiles for each (first, last) name, found with a single batched
+    discovery job. An entry is None when the job failed.
+    """
+    if not people:
+        return []
+    try:
+        trig = await client.post(
+            "/datasets/v3/trigger",
+            params={"dataset_id": PROFILE_DATASET_ID, "include_errors": "true",
+                    "type": "discover_new", "discover_by": "name"},
+            json=[{"first_name": first, "last_name": last} for first, last in people],
+        )
+    except httpx.HTTPError as e:
+        print(f"[ERROR] trigger failed for {label}: {e}")
+        return [None] * len(people)
+    if not trig.is_success:
+        print(f"[ERROR] trigger failed for {label}: {trig.text}")
+        return [None] * len(people)
+
+    snapshot_id = safe_json(trig, f"trigger {label}").get("snapshot_id")
+    if not snapshot_id:
+        print(f"[WARN] no snapshot_id for {label}")
+        return [None] * len(people)
+
+    try:
+        records = await asyncio.wrap_future(poller.wait(snapshot_id))
+    except Exception as e:
+        print(f"[ERROR] snapshot fetch failed for {label}: {e}")
+        return [None] * len(people)
+
+    profiles = [[] for _ in people]
+    for record in records:
+        if _is_error_record(record):
+            continue  # include_errors=true reports failed searches as records; a founder with only those has no profiles
+        idx = _person_index(record, people)
+        if idx is not None:
+            profiles[idx].append(record)
+    return profiles
+
+
+async def company_followers(client: httpx.AsyncClient, url: str) -> Optional[int]:
+    """Follower count of a LinkedIn company page."""
+    try:
+        resp = await client.post("/linkedin/company", json={"url": url}, timeout=30)
+    except httpx.HTTPError as e:
+        print(f"[ERROR] company lookup failed for {url}: {e}")
+        return None
+    return safe_json(resp, "company").get("numFollowers")
@@ -0,0 +1,180 @@
+# extraction_module/services/deck_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from ..config import ExtractionConfig
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file's bytes, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def deck_name(pdf_path: str) -> str:
+    """Deck name from an upload path: "<uuid>_airbnb.pdf" -> "airbnb"."""
+    raw_filename = os.path.splitext(os.path.basename(pdf_path))[0]
+    return raw_filename.split("_", 1)[1] if "_" in raw_filename else raw_filename
+
+
+class DeckCache:
+    """
+    Content-addressed cache for extracted pitch decks.
+
+    Results are keyed by the SHA-256 of the PDF bytes plus the pipeline
+    version, so a deck re-uploaded under another name is a hit and two
+    different decks with the same name never collide. Each result is a JSON
+    file under the cache directory; a SQLite index tracks sizes, access times
+    and the filename aliases a deck was uploaded under. Entries are evicted
+    least-recently-used first once the cache exceeds max_bytes, and entries
+    older than max_age_seconds are dropped.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, max_age_seconds: float = 0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(directory, "index.sqlite3"), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS decks (key TEXT PRIMARY KEY, sha256 TEXT NOT NULL, "
+            "version TEXT NOT NULL, file TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS aliases (name TEXT PRIMARY KEY, sha256 TEXT NOT NULL, updated REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(sha256: str, version: str) -> str:
+        return f"{sha256}:{version}"
+
+    def _path(self, sha256: str, version: str) -> str:
+        version_tag = hashlib.sha256(version.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.directory, sha256[:2], f"{sha256}-{version_tag}.json")
+
+    def get(self, sha256: str, version: str, alias: Optional[str] = None) -> Optional[Dict]:
+        """The cached result for these PDF bytes and pipeline version, or None."""
+        key = self.make_key(sha256, version)
+        with self._lock:
+            row = self._db.execute("SELECT file, created FROM decks WHERE key = ?", (key,)).fetchone()
+            if row is None or self._expired(row[1]):
+                self.misses += 1
+                return None
+            try:
+                with open(row[0], "r") as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                # File removed or truncated behind our back: forget the entry
+                self._db.execute("DELETE FROM decks WHERE key = ?", (key,))
+                self._db.commit()
+                self.misses += 1
+                return None
+
+            now = time.time()
+            self._db.execute("UPDATE decks SET accessed = ? WHERE key = ?", (now, key))
+            if alias:
+                self._alias(alias, sha256, now)
+            self._db.commit()
+            self.hits += 1
+            return result
+
+    def get_by_alias(self, alias: str, version: str) -> Optional[Dict]:
+        """The result for the deck most recently uploaded under this name."""
+        with self._lock:
+            row = self._db.execute("SELECT sha256 FROM aliases WHERE name = ?", (alias,)).fetchone()
+        return self.get(row[0], version) if row else None
+
+    def put(self, sha256: str, version: str, result: Dict, alias: Optional[str] = None) -> str:
+        """Store a result and return the path of its JSON file."""
+        path = self._path(sha256, version)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(result, f, indent=2)
+        os.replace(tmp_path, path)  # readers never see a half-written file
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO decks (key, sha256, version, file, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.make_key(sha256, version), sha256, version, path, os.path.getsize(path), now, now)
+            )
+            if alias:
+                self._alias(alias, sha256, now)
+            self._db.commit()
+            self._evict()
+        return path
+
+    def _alias(self, alias: str, sha256: str, now: float):
+        self._db.execute("INSERT OR REPLACE INTO aliases (name, sha256, updated) VALUES (?, ?, ?)",
+                         (alias, sha256, now))
+
+    def _expired(self, created: float) -> bool:
+        return bool(self.max_age_seconds) and time.time() - created > self.max_age_seconds
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until the cache fits max_bytes."""
+        rows = self._db.execute("SELECT key, file, size, created FROM decks ORDER BY accessed").fetchall()
+        total = sum(row[2] for row in rows)
+        for key, path, size, created in rows:
+            if not self._expired(created) and total <= self.max_bytes:
+                continue
+            self._db.execute("DELETE FROM decks WHERE key = ?", (key,))
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+            self.evictions += 1
+        # Aliases pointing at decks that are no longer cached in any version
+        self._db.execute("DELETE FROM aliases WHERE sha256 NOT IN (SELECT sha256 FROM decks)")
+        self._db.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM decks").fetchone()
+            aliases = self._db.execute("SELECT COUNT(*) FROM aliases").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "aliases": aliases,
+            "size_mb": round(size / (1024 * 1024), 2),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+_lock = threading.Lock()
+
+
+# Get the process-wide deck cache (singleton pattern)
+def get_deck_cache() -> DeckCache:
+    if not hasattr(get_deck_cache, "instance"):
+        with _lock:
+            if not hasattr(get_deck_cache, "instance"):
+                get_deck_cache.instance = DeckCache(
+                    ExtractionConfig.DECK_CACHE_DIR,
+                    int(ExtractionConfig.DECK_CACHE_MAX_MB * 1024 * 1024),
+                    ExtractionConfig.DECK_CACHE_MAX_AGE_DAYS * 86400,
+                )
+    return get_deck_cache.instance
@@ -0,0 +1,168 @@
+# extraction_module/services/incremental.py
+"""
+Page-level incremental extraction for revised pitch decks.
+
+Each page's structured fields are stored under its page hash, so a v2 deck
+only sends its new or edited slides to the model; the deck's JSON is the
+merge of all its pages' fields in slide order. The last processed version
+of every deck name is kept too: comparing its structured JSON with the new
+one tells which enrichment stages (LinkedIn, Google Trends, refinement)
+have changed inputs and need to run again.
+"""
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from ..config import ExtractionConfig
+
+# Dotted paths each enrichment stage reads from the structured JSON
+STAGE_INPUTS = {
+    "linkedin": ("company_name", "team.founders", "team.company_overview"),
+    "trends": ("company_name",),
+}
+
+
+def _empty(value) -> bool:
+    return value in (None, "", [], {})
+
+
+def merge_fields(base, update):
+    """
+    Merge one page's fields into the deck so far: earlier pages win for
+    scalars, dicts merge key by key, list items are appended unless already
+    present, and named items (founders, investors) with the same name merge.
+    """
+    if isinstance(base, dict) and isinstance(update, dict):
+        merged = dict(base)
+        for key, value in update.items():
+            merged[key] = merge_fields(base[key], value) if key in base else value
+        return merged
+    if isinstance(base, list) and isinstance(update, list):
+        merged = list(base)
+        for item in update:
+            if item in merged:
+                continue
+            name = item.get("name") if isinstance(item, dict) else None
+            same = next((idx for idx, other in enumerate(merged) if name and isinstance(other, dict)
+                         and str(other.get("name", "")).lower() == str(name).lower()), None)
+            if same is None:
+                merged.append(item)
+            else:
+                merged[same] = merge_fields(merged[same], item)
+        return merged
+    return update if _empty(base) else base
+
+
+def merge_page_fields(pages: List[Dict]) -> Dict:
+    """The deck's structured JSON from its pages' fields, in slide order."""
+    merged: Dict = {}
+    for fields in pages:
+        merged = merge_fields(merged, fields or {})
+    return merged
+
+
+def diff_paths(old, new, prefix: str = "", depth: int = 2) -> Set[str]:
+    """Dotted paths (up to depth levels deep) whose values differ between two JSON documents."""
+    if depth == 0 or not (isinstance(old, dict) and isinstance(new, dict)):
+        return set() if old == new else {prefix}
+    paths = set()
+    for key in set(old) | set(new):
+        paths |= diff_paths(old.get(key), new.get(key), f"{prefix}.{key}" if prefix else key, depth - 1)
+    return paths
+
+
+def stage_affected(stage: str, paths: Set[str]) -> bool:
+    """Whether any changed path is, contains or lies under one of the stage's inputs."""
+    return any(path == needed or path.startswith(needed + ".") or needed.startswith(path + ".")
+               for path in paths for needed in STAGE_INPUTS[stage])
+
+
+class PageResults:
+    """Per-page structured fields and the last version of each deck, backed by SQLite."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self.counts = {"pages_reused": 0, "pages_extracted": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, fields TEXT NOT NULL, "
+                         "created REAL NOT NULL)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS decks (name TEXT PRIMARY KEY, sha256 TEXT NOT NULL, version TEXT NOT NULL, "
+            "pages TEXT NOT NULL, structured TEXT NOT NULL, result TEXT NOT NULL, updated REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+            self._db.commit()
+        return rows
+
+    # -----------------------------
+    # Pages
+    # -----------------------------
+    def get_page(self, page_sha256: str, version: str) -> Optional[Dict]:
+        rows = self._execute("SELECT fields FROM pages WHERE key = ?", (f"{page_sha256}:{version}",))
+        if not rows:
+            return None
+        self.counts["pages_reused"] += 1
+        return json.loads(rows[0][0])
+
+    def put_page(self, page_sha256: str, version: str, fields: Dict):
+        self._execute("INSERT OR REPLACE INTO pages (key, fields, created) VALUES (?, ?, ?)",
+                      (f"{page_sha256}:{version}", json.dumps(fields), time.time()))
+        self.counts["pages_extracted"] += 1
+
+    # -----------------------------
+    # Deck versions
+    # -----------------------------
+    def previous(self, name: str, version: str) -> Optional[Dict]:
+        """{"sha256", "pages", "structured", "result"} of the last version of this deck, or None."""
+        rows = self._execute("SELECT sha256, pages, structured, result FROM decks WHERE name = ? AND version = ?",
+                             (name, version))
+        if not rows:
+            return None
+        sha256, pages, structured, result = rows[0]
+        return {"sha256": sha256, "pages": json.loads(pages),
+                "structured": json.loads(structured), "result": json.loads(result)}
+
+    def put_deck(self, name: str, sha256: str, version: str, pages: List[str], structured: Dict, result: Dict):
+        self._execute(
+            "INSERT OR REPLACE INTO decks (name, sha256, version, pages, structured, result, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (name, sha256, version, json.dumps(pages), json.dumps(structured), json.dumps(result), time.time())
+        )
+
+    def stats(self) -> Dict[str, int]:
+        counts = dict(self.counts)
+        counts["pages"] = self._execute("SELECT COUNT(*) FROM pages")[0][0]
+        counts["decks"] = self._execute("SELECT COUNT(*) FROM decks")[0][0]
+        return counts
+
+
+_lock = threading.Lock()
+
+
+# Get the process-wide page results store (singleton pattern)
+def get_page_results() -> PageResults:
+    if not hasattr(get_page_results, "instance"):
+        with _lock:
+            if not hasattr(get_page_results, "instance"):
+                get_page_results.instance = PageResults(ExtractionConfig.PAGE_RESULTS_PATH)
+    return get_page_results.instance
+
+
+def carry_over(previous: Dict, data: Dict, sections: Set[str]) -> Dict:
+    """Copy of data with every top-level section not in sections taken from the previous result."""
+    data = copy.deepcopy(data)
+    for key, value in previous.items():
+        if key not in sections and key != "metrics":
+            data[key] = copy.deepcopy(value)
+    return data
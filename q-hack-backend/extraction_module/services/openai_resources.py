@@ -0,0 +1,228 @@
+# extraction_module/services/openai_resources.py
+"""
+Reuse of remote OpenAI objects across decks.
+
+The extraction assistant is created once per (model, instructions, tools)
+and its ID remembered; uploaded PDFs and their vector stores are remembered
+per content hash, so a re-processed deck is neither uploaded nor indexed
+again. Threads are deleted after use, and `cleanup` removes threads, files
+and vector stores that are left over or no longer used.
+
+Run from the q-hack-backend directory:
+    python -m extraction_module.services.openai_resources stats
+    python -m extraction_module.services.openai_resources cleanup --max-age-hours 72 --dry-run
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+from ..config import ExtractionConfig
+
+
+def assistant_key(model: str, instructions: str, tools: List[Dict]) -> str:
+    payload = json.dumps({"model": model, "instructions": instructions, "tools": tools}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class OpenAIResources:
+    """Registry of assistants, uploaded files, vector stores and threads, backed by SQLite."""
+
+    def __init__(self, client, path: str):
+        self.client = client
+        self._lock = threading.Lock()
+        self.counts = {"assistants_created": 0, "assistants_reused": 0, "files_uploaded": 0, "files_reused": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS assistants (key TEXT PRIMARY KEY, assistant_id TEXT NOT NULL, "
+            "created REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS files (sha256 TEXT PRIMARY KEY, file_id TEXT NOT NULL, "
+            "vector_store_id TEXT, created REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE TABLE IF NOT EXISTS threads (thread_id TEXT PRIMARY KEY, created REAL NOT NULL)")
+        self._db.commit()
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+            self._db.commit()
+        return rows
+
+    # -----------------------------
+    # Assistants
+    # -----------------------------
+    def assistant(self, name: str, model: str, instructions: str, tools: List[Dict]) -> str:
+        """ID of the assistant for this configuration, creating it on first use."""
+        key = assistant_key(model, instructions, tools)
+        rows = self._execute("SELECT assistant_id FROM assistants WHERE key = ?", (key,))
+        if rows:
+            self._execute("UPDATE assistants SET used = ? WHERE key = ?", (time.time(), key))
+            self.counts["assistants_reused"] += 1
+            return rows[0][0]
+
+        assistant = self.client.beta.assistants.create(
+            name=name, model=model, tools=tools, instructions=instructions,
+            metadata={"config_key": key[:32]},
+        )
+        now = time.time()
+        self._execute("INSERT OR REPLACE INTO assistants (key, assistant_id, created, used) VALUES (?, ?, ?, ?)",
+                      (key, assistant.id, now, now))
+        self.counts["assistants_created"] += 1
+        return assistant.id
+
+    def forget_assistant(self, assistant_id: str):
+        """Drop a remembered assistant that no longer exists remotely."""
+        self._execute("DELETE FROM assistants WHERE assistant_id = ?", (assistant_id,))
+
+    # -----------------------------
+    # Files and vector stores
+    # -----------------------------
+    def file(self, pdf_path: str, sha256: str) -> str:
+        """ID of the uploaded copy of this PDF, uploading it if it is not known yet."""
+        rows = self._execute("SELECT file_id FROM files WHERE sha256 = ?", (sha256,))
+        if rows:
+            self._execute("UPDATE files SET used = ? WHERE sha256 = ?", (time.time(), sha256))
+            self.counts["files_reused"] += 1
+            return rows[0][0]
+
+        with open(pdf_path, "rb") as f:
+            file_id = self.client.files.create(file=f, purpose="assistants").id
+        now = time.time()
+        self._execute("INSERT OR REPLACE INTO files (sha256, file_id, vector_store_id, created, used) "
+                      "VALUES (?, ?, NULL, ?, ?)", (sha256, file_id, now, now))
+        self.counts["files_uploaded"] += 1
+        return file_id
+
+    def vector_store(self, pdf_path: str, sha256: str) -> str:
+        """ID of an indexed vector store holding this PDF, created once per content hash."""
+        # A store idle for longer than expires_after has expired remotely (an hour of margin for clock skew):
+        # keep the uploaded file, but index it into a new store
+        expiry_seconds = ExtractionConfig.OPENAI_STORE_EXPIRY_DAYS * 86400 - 3600
+        self._execute("UPDATE files SET vector_store_id = NULL WHERE sha256 = ? AND used < ?",
+                      (sha256, time.time() - expiry_seconds))
+        file_id = self.file(pdf_path, sha256)
+        rows = self._execute("SELECT vector_store_id FROM files WHERE sha256 = ?", (sha256,))
+        if rows and rows[0][0]:
+            return rows[0][0]
+
+        store = self.client.vector_stores.create(
+            name=f"deck-{sha256[:12]}",
+            expires_after={"anchor": "last_active_at", "days": ExtractionConfig.OPENAI_STORE_EXPIRY_DAYS},
+        )
+        indexed = self.client.vector_stores.files.create_and_poll(vector_store_id=store.id, file_id=file_id)
+        if indexed.status != "completed":
+            raise RuntimeError(f"Indexing {file_id} failed: {indexed.last_error}")
+        self._execute("UPDATE files SET vector_store_id = ? WHERE sha256 = ?", (store.id, sha256))
+        return store.id
+
+    def forget_file(self, sha256: str):
+        """Drop a remembered upload whose file or vector store no longer exists remotely."""
+        self._execute("DELETE FROM files WHERE sha256 = ?", (sha256,))
+
+    # -----------------------------
+    # Threads
+    # -----------------------------
+    def thread(self, **kwargs) -> str:
+        """Create a thread and remember it until it is released."""
+        thread = self.client.beta.threads.create(**kwargs)
+        self._execute("INSERT OR REPLACE INTO threads (thread_id, created) VALUES (?, ?)", (thread.id, time.time()))
+        return thread.id
+
+    def release_thread(self, thread_id: str):
+        """Delete a finished thread; cleanup retries it later if deletion fails."""
+        try:
+            self.client.beta.threads.delete(thread_id)
+            self._execute("DELETE FROM threads WHERE thread_id = ?", (thread_id,))
+        except Exception as e:
+            print(f"⚠️ Could not delete thread {thread_id}: {e}")
+
+    # -----------------------------
+    # Cleanup
+    # -----------------------------
+    def cleanup(self, max_age_seconds: float, dry_run: bool = False) -> Dict[str, int]:
+        """Delete leftover threads and files, vector stores and assistants unused for max_age_seconds."""
+        cutoff = time.time() - max_age_seconds
+        removed = {"threads": 0, "files": 0, "vector_stores": 0, "assistants": 0}
+
+        def delete(kind: str, func, remote_id: str) -> bool:
+            if dry_run:
+                print(f"Would delete {kind[:-1]} {remote_id}")
+                removed[kind] += 1
+                return True
+            try:
+                func(remote_id)
+            except Exception as e:
+                # Already gone remotely is fine; anything else is kept for the next run
+                if getattr(e, "status_code", None) != 404:
+                    print(f"⚠️ Could not delete {kind[:-1]} {remote_id}: {e}")
+                    return False
+            removed[kind] += 1
+            return True
+
+        # Threads are normally deleted right after their run; these were left behind
+        for (thread_id,) in self._execute("SELECT thread_id FROM threads WHERE created < ?", (time.time() - 3600,)):
+            if delete("threads", self.client.beta.threads.delete, thread_id) and not dry_run:
+                self._execute("DELETE FROM threads WHERE thread_id = ?", (thread_id,))
+
+        for sha256, file_id, store_id in self._execute(
+                "SELECT sha256, file_id, vector_store_id FROM files WHERE used < ?", (cutoff,)):
+            if store_id:
+                delete("vector_stores", self.client.vector_stores.delete, store_id)
+            if delete("files", self.client.files.delete, file_id) and not dry_run:
+                self.forget_file(sha256)
+
+        for key, assistant_id in self._execute("SELECT key, assistant_id FROM assistants WHERE used < ?", (cutoff,)):
+            if delete("assistants", self.client.beta.assistants.delete, assistant_id) and not dry_run:
+                self.forget_assistant(assistant_id)
+
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        counts = dict(self.counts)
+        for table in ("assistants", "files", "threads"):
+            counts[table] = self._execute(f"SELECT COUNT(*) FROM {table}")[0][0]
+        return counts
+
+
+_lock = threading.Lock()
+
+
+# Get the process-wide registry for an OpenAI client (singleton pattern)
+def get_openai_resources(client) -> OpenAIResources:
+    if not hasattr(get_openai_resources, "instance"):
+        with _lock:
+            if not hasattr(get_openai_resources, "instance"):
+                get_openai_resources.instance = OpenAIResources(client, ExtractionConfig.OPENAI_RESOURCES_PATH)
+    return get_openai_resources.instance
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and clean up remote OpenAI objects used by the extractor")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show remembered assistants, files and threads")
+    cleanup = sub.add_parser("cleanup", help="Delete stale threads, files, vector stores and assistants")
+    cleanup.add_argument("--max-age-hours", type=float, default=ExtractionConfig.OPENAI_RESOURCE_MAX_AGE_HOURS)
+    cleanup.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    from PDFDataExtraction import get_openai_client
+
+    resources = get_openai_resources(get_openai_client())
+    if args.command == "stats":
+        print(json.dumps(resources.stats(), indent=2))
+    else:
+        removed = resources.cleanup(args.max_age_hours * 3600, args.dry_run)
+        print(("Would remove" if args.dry_run else "Removed") + f": {removed}")
+
+
+if __name__ == "__main__":
+    main()
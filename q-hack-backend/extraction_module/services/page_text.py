@@ -0,0 +1,233 @@
+# extraction_module/services/page_text.py
+"""
+Local per-page text extraction for pitch decks.
+
+Each page's text is extracted on the worker with pypdf in layout mode, split
+into blocks at blank lines and compacted (column gaps become " | ", repeated
+footers and bare page numbers are dropped). Pages are cached by a hash of
+their content stream and images, so a page shared by two decks or two
+versions of a deck is extracted once. With LOCAL_PDF_TEXT=true the compacted
+text is sent to a single chat completion instead of uploading the PDF for an
+Assistants file_search run; decks with too little text (scanned or
+image-only slides) still go through the Assistants path.
+
+Run from the q-hack-backend directory:
+    python -m extraction_module.services.page_text SlideDecks/*.pdf
+    python -m extraction_module.services.page_text SlideDecks/Uber.pdf --compare
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, NamedTuple
+
+from ..config import ExtractionConfig
+
+# Bump when the extraction or block compaction changes its output
+PAGE_TEXT_VERSION = 1
+
+
+class PageText(NamedTuple):
+    number: int  # 1-based
+    sha256: str
+    text: str  # compacted layout blocks, separated by blank lines
+    cached: bool
+
+
+def page_sha256(page) -> str:
+    """Hash of a page's content stream and the images/forms it draws."""
+    digest = hashlib.sha256()
+    contents = page.get_contents()
+    if contents is not None:
+        digest.update(contents.get_data())
+    resources = page["/Resources"] if "/Resources" in page else {}
+    xobjects = resources["/XObject"] if "/XObject" in resources else {}
+    for name in sorted(xobjects):
+        digest.update(name.encode("utf-8"))
+        try:
+            digest.update(xobjects[name].get_object().get_data())
+        except Exception:
+            digest.update(b"?")  # undecodable stream: the name and content stream still count
+    return digest.hexdigest()
+
+
+def layout_blocks(text: str) -> List[str]:
+    """Split layout-mode text into blocks at blank lines, with column gaps collapsed to " | "."""
+    blocks, lines = [], []
+    for line in text.splitlines() + [""]:
+        line = re.sub(r" {3,}", " | ", line.strip())
+        line = re.sub(r"\s+", " ", line)
+        if line:
+            lines.append(line)
+        elif lines:
+            blocks.append("\n".join(lines))
+            lines = []
+    return blocks
+
+
+class PageTextCache:
+    """Compacted page text keyed by page hash and PAGE_TEXT_VERSION, backed by SQLite."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, text TEXT NOT NULL, "
+                         "created REAL NOT NULL)")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(sha256: str) -> str:
+        return f"{sha256}:v{PAGE_TEXT_VERSION}"
+
+    def get(self, sha256: str):
+        with self._lock:
+            row = self._db.execute("SELECT text FROM pages WHERE key = ?", (self.make_key(sha256),)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+
+    def put(self, sha256: str, text: str):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO pages (key, text, created) VALUES (?, ?, ?)",
+                             (self.make_key(sha256), text, time.time()))
+            self._db.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            pages = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {"pages": pages, "hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0}
+
+
+_lock = threading.Lock()
+
+
+# Get the process-wide page text cache (singleton pattern)
+def get_page_text_cache() -> PageTextCache:
+    if not hasattr(get_page_text_cache, "instance"):
+        with _lock:
+            if not hasattr(get_page_text_cache, "instance"):
+                get_page_text_cache.instance = PageTextCache(ExtractionConfig.PAGE_TEXT_CACHE_PATH)
+    return get_page_text_cache.instance
+
+
+def extract_pages(pdf_path: str, cache: PageTextCache = None) -> List[PageText]:
+    """Compacted text of every page, reusing cached pages. Raises ImportError without pypdf."""
+    from pypdf import PdfReader
+
+    logging.getLogger("pypdf").setLevel(logging.ERROR)  # malformed xrefs and fonts are common in decks
+    cache = cache or get_page_text_cache()
+    pages = []
+    for number, page in enumerate(PdfReader(pdf_path).pages, start=1):
+        sha256 = page_sha256(page)
+        text = cache.get(sha256)
+        cached = text is not None
+        if not cached:
+            text = "\n\n".join(layout_blocks(page.extract_text(extraction_mode="layout")))
+            cache.put(sha256, text)
+        pages.append(PageText(number, sha256, text, cached))
+    return pages
+
+
+def has_enough_text(pages: List[PageText]) -> bool:
+    """False for scanned or image-only decks, which need the Assistants path."""
+    chars = sum(len(page.text) for page in pages)
+    return bool(pages) and chars / len(pages) >= ExtractionConfig.LOCAL_TEXT_MIN_CHARS_PER_PAGE
+
+
+def compact_deck(pages: List[PageText]) -> str:
+    """
+    The deck as one prompt-ready text: a "## Slide N" header per page with
+    text, minus lines repeated on most pages (footers, confidentiality
+    notices) and bare page numbers.
+    """
+    line_pages = Counter(line for page in pages for line in set(page.text.splitlines()) if line)
+    repeated = {line for line, count in line_pages.items() if len(pages) >= 4 and count > len(pages) / 2}
+
+    parts = []
+    for page in pages:
+        lines = [line for line in page.text.splitlines()
+                 if line not in repeated and not re.fullmatch(r"\d{1,3}( ?/ ?\d{1,3})?", line)]
+        text = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+        if text:
+            parts.append(f"## Slide {page.number}\n{text}")
+    return "\n\n".join(parts)
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4  # ~4 characters per token for English prose
+
+
+def run_report(pdf_paths: List[str], compare: bool = False) -> List[Dict]:
+    """Per deck: pages, text size before/after compaction and extraction time; with compare, both LLM paths."""
+    rows = []
+    for pdf_path in pdf_paths:
+        start = time.perf_counter()
+        pages = extract_pages(pdf_path)
+        deck_text = compact_deck(pages)
+        row = {
+            "deck": os.path.basename(pdf_path),
+            "pages": len(pages),
+            "cached_pages": sum(page.cached for page in pages),
+            "text_pages": sum(bool(page.text) for page in pages),
+            "chars": sum(len(page.text) for page in pages),
+            "compact_chars": len(deck_text),
+            "estimated_tokens": estimate_tokens(deck_text),
+            "extract_seconds": round(time.perf_counter() - start, 3),
+            "usable": has_enough_text(pages),
+        }
+        if compare and row["usable"]:
+            from PDFDataExtraction import structure_pdf_with_assistant, structure_pdf_with_text
+
+            row["local_text"], row["assistants"] = {}, {}
+            structure_pdf_with_text(pdf_path, stats=row["local_text"])
+            structure_pdf_with_assistant(pdf_path, stats=row["assistants"])
+        rows.append(row)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract compact page text from pitch decks")
+    parser.add_argument("pdfs", nargs="+", help="PDF files to extract")
+    parser.add_argument("--compare", action="store_true",
+                        help="Also structure each usable deck via local text and via Assistants (calls OpenAI)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    rows = run_report(args.pdfs, args.compare)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'deck':<26} {'pages':>5} {'text':>5} {'chars':>7} {'compact':>7} {'~tokens':>7} {'secs':>6}  usable")
+    for row in rows:
+        print(f"{row['deck'][:26]:<26} {row['pages']:>5} {row['text_pages']:>5} {row['chars']:>7} "
+              f"{row['compact_chars']:>7} {row['estimated_tokens']:>7} {row['extract_seconds']:>6}  "
+              f"{'yes' if row['usable'] else 'no (Assistants path)'}")
+    compared = [row for row in rows if "assistants" in row]
+    if compared:
+        print(f"\n{'deck':<26} {'path':<11} {'seconds':>8} {'prompt':>8} {'completion':>10}")
+        for row in compared:
+            for path in ("local_text", "assistants"):
+                stats = row[path]
+                print(f"{row['deck'][:26]:<26} {path:<11} {stats.get('seconds', 0):>8} "
+                      f"{stats.get('prompt_tokens') or '-':>8} {stats.get('completion_tokens') or '-':>10}")
+    print(f"\nPage cache: {get_page_text_cache().stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# extraction_module/services/profile_cache.py
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional
+
+from ..config import ExtractionConfig
+
+
+def normalize(text: str) -> str:
+    """Lowercase, accent-free, punctuation-free form of a name: "José  O'Neil" -> "jose oneil"."""
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    text = re.sub(r"[^\w\s]", "", text.lower())
+    return " ".join(text.split())
+
+
+def normalize_url(url: str) -> str:
+    """Company page URL without scheme, www. and trailing slash."""
+    url = re.sub(r"^https?://", "", (url or "").strip().lower())
+    return url.removeprefix("www.").rstrip("/")
+
+
+class ProfileCache:
+    """
+    Persistent cache of LinkedIn lookups, shared by every deck.
+
+    Founders are keyed by normalized name plus company and store the selected
+    profile, the scored candidates it was chosen from and the fetch time.
+    "No profiles found" is cached too, with its own (shorter) TTL, so a
+    founder without a LinkedIn presence is not searched on every upload.
+    Company follower counts are cached by normalized page URL.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, negative_ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self.counts = {"founder_hits": 0, "founder_misses": 0, "negative_hits": 0,
+                       "company_hits": 0, "company_misses": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS founders (key TEXT PRIMARY KEY, profile TEXT, "
+            "candidates TEXT NOT NULL, fetched REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS companies (url TEXT PRIMARY KEY, followers INTEGER NOT NULL, "
+            "fetched REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def founder_key(name: str, company: str) -> str:
+        return f"{normalize(name)}|{normalize(company)}"
+
+    def _fresh(self, fetched: float, ttl: float) -> bool:
+        return not ttl or time.time() - fetched <= ttl
+
+    # -----------------------------
+    # Founders
+    # -----------------------------
+    def get_founder(self, name: str, company: str) -> Optional[Dict]:
+        """
+        {"profile", "candidates", "fetched"} for a fresh entry, or None.
+        A profile of None means the last lookup found nothing.
+        """
+        key = self.founder_key(name, company)
+        with self._lock:
+            row = self._db.execute("SELECT profile, candidates, fetched FROM founders WHERE key = ?",
+                                   (key,)).fetchone()
+            negative = row is not None and row[0] is None
+            ttl = self.negative_ttl_seconds if negative else self.ttl_seconds
+            if row is None or not self._fresh(row[2], ttl):
+                self.counts["founder_misses"] += 1
+                return None
+            self.counts["founder_hits"] += 1
+            if negative:
+                self.counts["negative_hits"] += 1
+        return {"profile": json.loads(row[0]) if row[0] else None,
+                "candidates": json.loads(row[1]), "fetched": row[2]}
+
+    def put_founder(self, name: str, company: str, profile: Optional[Dict], candidates: List[Dict]):
+        """Remember a founder lookup; profile None records that no profiles were found."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO founders (key, profile, candidates, fetched) VALUES (?, ?, ?, ?)",
+                (self.founder_key(name, company), json.dumps(profile) if profile else None,
+                 json.dumps(candidates), time.time())
+            )
+            self._db.commit()
+
+    # -----------------------------
+    # Companies
+    # -----------------------------
+    def get_company(self, url: str) -> Optional[int]:
+        """Cached follower count of a company page, or None."""
+        with self._lock:
+            row = self._db.execute("SELECT followers, fetched FROM companies WHERE url = ?",
+                                   (normalize_url(url),)).fetchone()
+            if row is None or not self._fresh(row[1], self.ttl_seconds):
+                self.counts["company_misses"] += 1
+                return None
+            self.counts["company_hits"] += 1
+        return row[0]
+
+    def put_company(self, url: str, followers: int):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO companies (url, followers, fetched) VALUES (?, ?, ?)",
+                             (normalize_url(url), followers, time.time()))
+            self._db.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            founders, negative = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(profile IS NULL), 0) FROM founders").fetchone()
+            companies = self._db.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+        hits = self.counts["founder_hits"] + self.counts["company_hits"]
+        lookups = hits + self.counts["founder_misses"] + self.counts["company_misses"]
+        return {
+            **self.counts,
+            "founders": founders,
+            "negative_founders": negative,
+            "companies": companies,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_lock = threading.Lock()
+
+
+# Get the process-wide profile cache (singleton pattern)
+def get_profile_cache() -> ProfileCache:
+    if not hasattr(get_profile_cache, "instance"):
+        with _lock:
+            if not hasattr(get_profile_cache, "instance"):
+                get_profile_cache.instance = ProfileCache(
+                    ExtractionConfig.PROFILE_CACHE_PATH,
+                    ExtractionConfig.PROFILE_CACHE_TTL_DAYS * 86400,
+                    ExtractionConfig.PROFILE_CACHE_NEGATIVE_TTL_DAYS * 86400,
+                )
+    return get_profile_cache.instance
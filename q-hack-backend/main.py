@@ -1,5 +1,10 @@
 # backend/main.py
+import os
+import threading
+import time
+
 from fastapi import FastAPI, Body
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from fastapi.responses import JSONResponse
@@ -9,8 +14,11 @@ from api.email_routes import router as email_router
 from api.chat_routes import router as chat_router
 from api.upload_routes import router as upload_router
 
-# Import the data extraction module
-from PDFDataExtraction import main as extract_pdf_data
+from evaluation_module.config import EvaluationConfig
+
+# PDFDataExtraction and the evaluator (openai, torch, transformers, nltk) are
+# imported on first use or by the warm-up thread, so chat and email routes
+# are served as soon as the process starts
 
 # Create FastAPI application
 app = FastAPI(title="Startup Analyzer API")
@@ -29,11 +37,48 @@ app.include_router(email_router)
 app.include_router(chat_router)
 app.include_router(upload_router)
 
+# State of the background warm-up of the extraction and evaluation stack
+warmup = {"ready": False, "seconds": None, "error": None}
+
+
+def warm_up_evaluator():
+    start = time.perf_counter()
+    try:
+        import PDFDataExtraction  # noqa: F401
+        from evaluator_final import get_evaluation_context
+        get_evaluation_context()
+        warmup["ready"] = True
+    except Exception as e:
+        warmup["error"] = f"{type(e).__name__}: {e}"
+        print(f"⚠️ Evaluator warm-up failed: {warmup['error']}")
+    warmup["seconds"] = round(time.perf_counter() - start, 2)
+
+
+# Fail fast at startup if the bundled VADER lexicon is missing (without importing nltk)
+@app.on_event("startup")
+def check_nltk_data():
+    lexicon = os.path.join(EvaluationConfig.NLTK_DATA_DIR, EvaluationConfig.VADER_LEXICON)
+    if not os.path.isfile(lexicon):
+        raise RuntimeError(f"VADER lexicon not found at {lexicon}. "
+                           f"Set NLTK_DATA_DIR to a directory that contains it.")
+
+
+# Load the ML stack in the background instead of blocking startup
+@app.on_event("startup")
+def start_warm_up():
+    if EvaluationConfig.PRELOAD_EVALUATOR:
+        threading.Thread(target=warm_up_evaluator, name="evaluator-warmup", daemon=True).start()
+
 # Root endpoint
 @app.get("/")
 async def root():
     return {"message": "Welcome to Startup Analyzer API"}
 
+# Readiness of the PDF analysis pipeline
+@app.get("/api/health")
+async def health():
+    return {"status": "ok", "evaluator": warmup}
+
 # Define a model for the file path request
 class FilePathRequest(BaseModel):
     file_path: str
@@ -42,8 +87,10 @@ class FilePathRequest(BaseModel):
 @app.post("/api/analyze-pdf")
 async def analyze_pdf(request: FilePathRequest):
     try:
-        # Call the PDFDataExtraction module with the uploaded file path
-        result = extract_pdf_data(request.file_path)
+        from PDFDataExtraction import main as extract_pdf_data
+
+        # The pipeline blocks for minutes, so run it off the event loop
+        result = await run_in_threadpool(extract_pdf_data, request.file_path)
         return JSONResponse(content=result)
     except Exception as e:
         return JSONResponse(
@@ -0,0 +1,89 @@
+# backend/profile_imports.py
+"""
+Import-time profile of a backend module.
+
+Imports the module in a fresh interpreter with `python -X importtime` and
+reports the total import time and the slowest imports by cumulative time, so
+a heavy dependency creeping back into the API startup path is easy to spot.
+
+Run from the q-hack-backend directory:
+    python profile_imports.py                 # the API process (main)
+    python profile_imports.py evaluator_final --top 10
+    python profile_imports.py main --max-seconds 2   # exit 1 if slower
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Dict, List
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def profile_import(module: str) -> Dict:
+    """Import module in a subprocess and parse its -X importtime output."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    imports = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append({
+                "module": name,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": len(indent) // 2,
+            })
+
+    # Top-level entries (depth 0) add up to the total; site is interpreter startup
+    total_ms = sum(i["cumulative_ms"] for i in imports if i["depth"] == 0 and i["module"] != "site")
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode != 0 and proc.stderr.strip() else None,
+        "total_seconds": round(total_ms / 1000, 3),
+        "imports": imports,
+    }
+
+
+def slowest(imports: List[Dict], top: int) -> List[Dict]:
+    """The top imports by cumulative time, each module listed once."""
+    seen = {}
+    for entry in imports:
+        if entry["module"] not in seen or entry["cumulative_ms"] > seen[entry["module"]]["cumulative_ms"]:
+            seen[entry["module"]] = entry
+    return sorted(seen.values(), key=lambda e: e["cumulative_ms"], reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile the import time of a backend module")
+    parser.add_argument("module", nargs="?", default="main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="Exit with status 1 if the import takes longer than this")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = profile_import(args.module)
+    report["slowest"] = slowest(report.pop("imports"), args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import {report['module']}: {report['total_seconds']:.3f}s")
+        if report["error"]:
+            print(f"❌ Import failed: {report['error']}")
+        print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+        for entry in report["slowest"]:
+            print(f"{entry['cumulative_ms']:>16.1f} {entry['self_ms']:>10.1f}  {entry['module']}")
+
+    too_slow = args.max_seconds is not None and report["total_seconds"] > args.max_seconds
+    sys.exit(1 if too_slow or not report["ok"] else 0)
+
+
+if __name__ == "__main__":
+    main()